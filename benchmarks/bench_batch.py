@@ -0,0 +1,60 @@
+# ==========================================================================
+# xvfb-run python benchmarks/bench_batch.py --variants 4 --views 32 --processes 1 2 4
+# ==========================================================================
+"""Time the batch rendering of camera views of scene variants on pools of processes.
+
+Every variant is a grid of boxes of a different size, saved as a COMPAS JSON file in a temporary folder.
+The views orbit around the grid, and every batch writes PNG files of all views of all variants.
+The throughput is printed for every number of processes, with the scene loads,
+which are more than the variants only if a variant is split over several processes.
+The Qt platform plugin has to provide OpenGL contexts, for example the "offscreen" plugin in an X server started by ``xvfb-run``.
+"""
+
+import argparse
+import math
+import tempfile
+from pathlib import Path
+
+from compas import json_dump
+from compas.geometry import Box
+from compas.geometry import Translation
+from compas_viewer.batch import BatchRenderer
+from compas_viewer.batch import RenderJob
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--variants", type=int, default=4, help="The number of scene files.")
+    ap.add_argument("--views", type=int, default=32, help="The number of camera views per scene file.")
+    ap.add_argument("-n", "--objects", type=int, default=400, help="The number of box objects of the first variant.")
+    ap.add_argument("--size", type=int, nargs=2, default=(1280, 720), help="The width and height of the images.")
+    ap.add_argument("--processes", type=int, nargs="+", default=(1, 2, 4), help="The numbers of processes.")
+    ap.add_argument("--writers", type=int, default=2, help="The number of writer threads per process.")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        jobs = []
+        for v in range(args.variants):
+            n = args.objects * (v + 1)
+            side = int(n**0.5 + 0.999)
+            boxes = [Box(1.0).transformed(Translation.from_vector([2 * (i % side), 2 * (i // side), 0])) for i in range(n)]
+            scene = Path(folder, f"variant.{v}.json")
+            json_dump(boxes, scene)
+            for k in range(args.views):
+                angle = 2 * math.pi * k / args.views
+                position = [side + 2 * side * math.cos(angle), side + 2 * side * math.sin(angle), 2 * side]
+                output = Path(folder, "images", f"variant.{v}.view.{k:04d}.png")
+                jobs.append(RenderJob(scene, output, position, target=[side, side, 0], width=args.size[0], height=args.size[1]))
+
+        print(f"{len(jobs)} views of {args.variants} variants at {args.size[0]} x {args.size[1]}.")
+        print(f"{'processes':>10} {'seconds':>10} {'images/s':>10} {'loads':>10} {'failed':>10}")
+        for processes in args.processes:
+            report = BatchRenderer(processes=processes, writers=args.writers).run(jobs)
+            print(f"{processes:>10} {report.seconds:>10.1f} {report.images_per_second:>10.1f} {report.scenes:>10} {len(report.failed):>10}")
+            if report.failed:
+                job, error = report.failed[0]
+                print(f"{'':>10} {job.output}: {error}")
+
+
+if __name__ == "__main__":
+    main()
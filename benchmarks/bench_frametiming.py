@@ -0,0 +1,72 @@
+# ==========================================================================
+# python benchmarks/bench_frametiming.py -n 10000 --frames 120
+# ==========================================================================
+"""Time the phases of the frames of a scene with many small objects, while the camera rotates.
+
+Every frame is repainted immediately, and the CPU and GPU times of the phases of the paint are read
+from the rolling window of ``Renderer.stats``. The GPU times require timer queries, which are not
+available in every OpenGL context. With ``--budget``, the benchmark fails if the mean total CPU time
+of a frame exceeds the budget. The viewer window has to be shown.
+"""
+
+import argparse
+import json
+import sys
+from collections import deque
+
+from PySide6.QtCore import QTimer
+
+from compas.geometry import Box
+from compas.geometry import Translation
+from compas_viewer import Viewer
+
+ap = argparse.ArgumentParser()
+ap.add_argument("-n", "--objects", type=int, default=10_000, help="The number of box objects.")
+ap.add_argument("--frames", type=int, default=120, help="The number of frames.")
+ap.add_argument("--budget", type=float, default=None, help="The maximum mean total CPU time of a frame, in milliseconds.")
+ap.add_argument("--json", action="store_true", help="Print the statistics as JSON instead of a table.")
+args = ap.parse_args()
+
+viewer = Viewer()
+side = int(args.objects**0.5 + 0.999)
+for i in range(args.objects):
+    x, y = 2 * (i % side), 2 * (i // side)
+    viewer.scene.add(Box(1.0).transformed(Translation.from_vector([x, y, 0])), name=f"box.{i}")
+viewer.renderer.camera.target = [side, side, 0]
+viewer.renderer.camera.position = [side, -side, 2 * side]
+
+failed = False
+
+
+def run():
+    global failed
+    viewer.renderer.frametimer.frames = deque(maxlen=args.frames)
+    for _ in range(args.frames):
+        viewer.renderer.camera.rotate(2, 0)
+        viewer.renderer.repaint()
+    # The queries of the last frames are read at the next paint.
+    viewer.renderer.repaint()
+    stats = viewer.renderer.stats()
+
+    if args.json:
+        print(json.dumps({"objects": args.objects, **stats}, indent=2))
+    else:
+        print(f"{args.objects} objects, {stats['frames']} frames at {stats['fps']:.1f} fps.")
+        print(f"{'phase':>16} {'cpu mean':>10} {'cpu max':>10} {'gpu mean':>10} {'gpu max':>10}")
+        for phase, cpu in stats["cpu"].items():
+            gpu = stats["gpu"].get(phase)
+            gpu_mean = f"{gpu['mean']:.2f}" if gpu else "-"
+            gpu_max = f"{gpu['max']:.2f}" if gpu else "-"
+            print(f"{phase:>16} {cpu['mean']:>10.2f} {cpu['max']:>10.2f} {gpu_mean:>10} {gpu_max:>10}")
+        if not stats["gpu"]:
+            print("No GPU times, timer queries are not supported by this OpenGL context.")
+
+    failed = args.budget is not None and stats["cpu"]["total"]["mean"] > args.budget
+    if failed:
+        print(f"The mean frame time of {stats['cpu']['total']['mean']:.2f} ms exceeds the budget of {args.budget} ms.", file=sys.stderr)
+    viewer.app.quit()
+
+
+QTimer.singleShot(500, run)
+viewer.show()
+sys.exit(1 if failed else 0)
@@ -0,0 +1,84 @@
+# ==========================================================================
+# python benchmarks/bench_occlusion.py --rooms 10 --resolution 32
+# ==========================================================================
+"""Compare the frame time of a dense interior with and without occlusion culling.
+
+The scene is a grid of rooms separated by walls, each room holding a detailed sphere mesh.
+The camera stands in the first room and looks along the grid, such that the walls hide almost everything.
+Frames are painted with the camera static, where the query results have settled,
+and with the camera moving a little every frame, where every frame issues new queries.
+Every frame is finished with ``glFinish``, so the times include the GPU work, also with a software
+renderer such as llvmpipe (``LIBGL_ALWAYS_SOFTWARE=1``). The viewer window has to be shown.
+"""
+
+import argparse
+import time
+
+from numpy import mean
+from numpy import percentile
+from OpenGL import GL
+from PySide6.QtCore import QTimer
+
+from compas.datastructures import Mesh
+from compas.geometry import Box
+from compas.geometry import Sphere
+from compas.geometry import Translation
+from compas_viewer import Viewer
+
+ap = argparse.ArgumentParser()
+ap.add_argument("--rooms", type=int, default=10, help="The number of rooms along each side of the grid.")
+ap.add_argument("--resolution", type=int, default=32, help="The number of divisions of the spheres.")
+ap.add_argument("--frames", type=int, default=50, help="The number of frames painted per measurement.")
+args = ap.parse_args()
+
+viewer = Viewer()
+viewer.renderer.config.frustumculling = True
+size = 10.0
+for i in range(args.rooms):
+    for j in range(args.rooms):
+        x, y = i * size, j * size
+        viewer.scene.add(Box(size, 0.2, 4.0).transformed(Translation.from_vector([x, y + size / 2, 2.0])), name=f"wall.x.{i}.{j}")
+        viewer.scene.add(Box(0.2, size, 4.0).transformed(Translation.from_vector([x + size / 2, y, 2.0])), name=f"wall.y.{i}.{j}")
+        sphere = Mesh.from_shape(Sphere(2.0), u=args.resolution, v=args.resolution)
+        sphere.transform(Translation.from_vector([x, y, 2.0]))
+        viewer.scene.add(sphere, name=f"sphere.{i}.{j}")
+
+viewer.renderer.camera.position = [-2.0, -2.0, 2.0]
+viewer.renderer.camera.target = [size * args.rooms, size * args.rooms, 2.0]
+print(f"{args.rooms**2} rooms with {3 * args.rooms**2} objects and {args.rooms**2 * args.resolution**2} sphere faces.")
+
+
+def frames(moving: bool) -> list[float]:
+    renderer = viewer.renderer
+    camera = renderer.camera
+    timings = []
+    for i in range(args.frames):
+        if moving:
+            camera.target = [size * args.rooms, size * args.rooms + (i % 2) * 0.01, 2.0]
+        start = time.perf_counter()
+        renderer.repaint()
+        renderer.makeCurrent()
+        GL.glFinish()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def run():
+    print(GL.glGetString(GL.GL_RENDERER).decode())
+    print(f"{'occlusion':>10} {'camera':>8} {'mean [ms]':>10} {'p50 [ms]':>10} {'p95 [ms]':>10} {'drawn':>6} {'occluded':>9}")
+    for enabled in (False, True):
+        viewer.renderer.config.occlusionculling = enabled
+        for moving in (False, True):
+            # Let the first query results arrive.
+            frames(moving)
+            timings = frames(moving)
+            stats = viewer.renderer.frame_stats
+            drawn = stats["objects"] - stats["culled"] - stats["occluded"]
+            camera = "moving" if moving else "static"
+            p50, p95 = percentile(timings, [50, 95])
+            print(f"{str(enabled):>10} {camera:>8} {mean(timings):>10.3f} {p50:>10.3f} {p95:>10.3f} {drawn:>6} {stats['occluded']:>9}")
+    viewer.app.quit()
+
+
+QTimer.singleShot(500, run)
+viewer.show()
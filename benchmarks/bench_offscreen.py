@@ -0,0 +1,55 @@
+# ==========================================================================
+# xvfb-run python benchmarks/bench_offscreen.py -n 1000 --size 1920 1080 --frames 20
+# ==========================================================================
+"""Time the headless rendering of a scene into arrays and image files.
+
+A headless viewer renders the frames of a rotating camera into an offscreen framebuffer,
+reading back the colors, the depths, or writing PNG files to a temporary folder.
+No window is shown, but the Qt platform plugin has to provide OpenGL contexts,
+for example the "offscreen" plugin in an X server started by ``xvfb-run``.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from compas.geometry import Box
+from compas.geometry import Translation
+from compas_viewer import Viewer
+
+ap = argparse.ArgumentParser()
+ap.add_argument("-n", "--objects", type=int, default=1000, help="The number of box objects.")
+ap.add_argument("--size", type=int, nargs=2, default=(1920, 1080), help="The width and height of the frames.")
+ap.add_argument("--frames", type=int, default=20, help="The number of frames per output.")
+ap.add_argument("--samples", type=int, default=4, help="The number of samples per pixel.")
+args = ap.parse_args()
+
+viewer = Viewer(headless=True)
+viewer.offscreen.samples = args.samples
+side = int(args.objects**0.5 + 0.999)
+for i in range(args.objects):
+    x, y = 2 * (i % side), 2 * (i // side)
+    viewer.scene.add(Box(1.0).transformed(Translation.from_vector([x, y, 0])), name=f"box.{i}")
+viewer.renderer.camera.target = [side, side, 0]
+viewer.renderer.camera.position = [side, -side, 2 * side]
+
+width, height = args.size
+start = time.perf_counter()
+viewer.offscreen.render(width, height)
+print(f"{args.objects} objects, first frame of {width} x {height} with initialization in {(time.perf_counter() - start) * 1000:.1f} ms.")
+
+with tempfile.TemporaryDirectory() as folder:
+    outputs = {
+        "rgba array": lambda i: viewer.offscreen.render(width, height),
+        "depth array": lambda i: viewer.offscreen.render_depth(width, height),
+        "png file": lambda i: viewer.offscreen.save(Path(folder, f"frame.{i:04d}.png"), width, height),
+    }
+    print(f"{'output':>12} {'ms/frame':>10} {'frames/s':>10}")
+    for name, output in outputs.items():
+        start = time.perf_counter()
+        for i in range(args.frames):
+            viewer.renderer.camera.rotate(5, 0)
+            output(i)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>12} {elapsed / args.frames * 1000:>10.1f} {args.frames / elapsed:>10.1f}")
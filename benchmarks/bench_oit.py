@@ -0,0 +1,70 @@
+# ==========================================================================
+# python benchmarks/bench_oit.py -n 10000
+# ==========================================================================
+"""Compare the frame time of the sorted transparency of the "ghosted" mode with the order-independent transparency of the "oit" mode.
+
+A grid of small overlapping boxes is added to the viewer, which are all transparent in both modes.
+Frames are painted with the camera static, where the sorted order is reused, and with the camera
+moving a little every frame, where the objects are sorted again in the "ghosted" mode.
+Every frame is finished with ``glFinish``, so the times include the GPU work, also with a software
+renderer such as llvmpipe (``LIBGL_ALWAYS_SOFTWARE=1``). The viewer window has to be shown.
+"""
+
+import argparse
+import time
+
+from numpy import mean
+from numpy import percentile
+from OpenGL import GL
+from PySide6.QtCore import QTimer
+
+from compas.geometry import Box
+from compas.geometry import Translation
+from compas_viewer import Viewer
+
+ap = argparse.ArgumentParser()
+ap.add_argument("-n", "--objects", type=int, default=10_000, help="The number of transparent boxes.")
+ap.add_argument("--frames", type=int, default=50, help="The number of frames painted per measurement.")
+args = ap.parse_args()
+
+viewer = Viewer(rendermode="ghosted")
+side = int(args.objects ** (1 / 3) + 0.999)
+for i in range(args.objects):
+    x, y, z = i % side, (i // side) % side, i // side**2
+    viewer.scene.add(Box(1.5).transformed(Translation.from_vector([x, y, z])), name=f"box.{i}")
+viewer.renderer.camera.target = [side / 2, side / 2, side / 2]
+viewer.renderer.camera.position = [side / 2, -2 * side, 2 * side]
+print(f"{args.objects} transparent boxes.")
+
+
+def frames(moving: bool) -> list[float]:
+    renderer = viewer.renderer
+    camera = renderer.camera
+    timings = []
+    for i in range(args.frames):
+        if moving:
+            camera.target = [side / 2, side / 2 + (i % 2) * 0.01, side / 2]
+        start = time.perf_counter()
+        renderer.repaint()
+        renderer.makeCurrent()
+        GL.glFinish()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def run():
+    print(GL.glGetString(GL.GL_RENDERER).decode())
+    print(f"{'mode':>8} {'camera':>8} {'mean [ms]':>10} {'p50 [ms]':>10} {'p95 [ms]':>10}")
+    for rendermode in ("ghosted", "oit"):
+        viewer.renderer.rendermode = rendermode
+        for moving in (False, True):
+            frames(moving)
+            timings = frames(moving)
+            camera = "moving" if moving else "static"
+            p50, p95 = percentile(timings, [50, 95])
+            print(f"{rendermode:>8} {camera:>8} {mean(timings):>10.3f} {p50:>10.3f} {p95:>10.3f}")
+    viewer.app.quit()
+
+
+QTimer.singleShot(500, run)
+viewer.show()
@@ -0,0 +1,110 @@
+# ==========================================================================
+# python benchmarks/bench_picking.py -n 100 --resolution 64
+# ==========================================================================
+"""Compare the latency of picking with the instance map and with CPU ray casting.
+
+A grid of sphere meshes is added to the viewer, and a set of random pixels is picked
+with both pick modes of the selector, and random boxes with both drag modes.
+The vertices, edges and faces under the same pixels and in the same boxes are picked with the element map. The first round of ray casts also builds the triangle
+hierarchies of the objects it reaches, and is reported separately as the cold picks.
+
+The instance map needs an OpenGL context, so the viewer window is shown and the picks
+are done once it is painted. With ``--cpu-only`` no window is shown and only the ray
+casting is timed, which also works without a display.
+"""
+
+import argparse
+import time
+
+from numpy import mean
+from numpy import percentile
+from numpy.random import default_rng
+from PySide6.QtCore import QTimer
+
+from compas.datastructures import Mesh
+from compas.geometry import Sphere
+from compas.geometry import Translation
+from compas_viewer import Viewer
+
+ap = argparse.ArgumentParser()
+ap.add_argument("-n", "--meshes", type=int, default=100, help="The number of sphere meshes.")
+ap.add_argument("--resolution", type=int, default=48, help="The number of divisions of the spheres.")
+ap.add_argument("--picks", type=int, default=200, help="The number of random pixels picked.")
+ap.add_argument("--cpu-only", action="store_true", help="Only time the ray casting, without showing the viewer.")
+args = ap.parse_args()
+
+viewer = Viewer()
+side = int(args.meshes**0.5 + 0.999)
+objs = []
+for i in range(args.meshes):
+    mesh = Mesh.from_shape(Sphere(1.0), u=args.resolution, v=args.resolution)
+    obj = viewer.scene.add(mesh, name=f"sphere.{i}")
+    obj.transformation = Translation.from_vector([3 * (i % side), 3 * (i // side), 0])
+    objs.append(obj)
+
+center = 1.5 * (side - 1)
+viewer.renderer.camera.target = [center, center, 0]
+viewer.renderer.camera.position = [center, center - 3 * side, 3 * side]
+
+width = viewer.layout.config.window.width
+height = viewer.layout.config.window.height
+rng = default_rng(0)
+pixels = [(int(x), int(y)) for x, y in rng.random((args.picks, 2)) * [width, height]]
+print(f"{args.meshes} meshes with {args.meshes * args.resolution**2} faces, {args.picks} picks in a {width} x {height} viewport.")
+
+
+def timed(pick) -> list[float]:
+    timings = []
+    for x, y in pixels:
+        start = time.perf_counter()
+        pick(x, y)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def timed_drag(select) -> list[float]:
+    timings = []
+    for (x1, y1), (x2, y2) in zip(pixels[::2], pixels[1::2]):
+        start = time.perf_counter()
+        select((x1, y1, x2, y2))
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(name: str, timings: list[float]):
+    print(f"{name:>12} {mean(timings):>10.3f} {percentile(timings, 50):>10.3f} {percentile(timings, 95):>10.3f}")
+
+
+def run():
+    raycaster = viewer.renderer.raycaster
+    print(f"{'mode':>12} {'mean [ms]':>10} {'p50 [ms]':>10} {'p95 [ms]':>10}")
+    report("ray (cold)", timed(raycaster.pick))
+    report("ray", timed(raycaster.pick))
+    hits = sum(raycaster.pick(x, y) is not None for x, y in pixels)
+
+    selector = viewer.renderer.selector
+    report("drag (cpu)", timed_drag(selector.project_objects_in_box))
+    if not args.cpu_only:
+        selector.pickmode = "instance"
+        selector.dragmode = "instance"
+        report("instance", timed(selector.pick_object))
+        report("drag", timed_drag(selector.objects_in_box))
+        picker = viewer.renderer.elementpicker
+        report("element", timed(picker.pick))
+        report("drag element", timed_drag(picker.pick_box))
+        viewer.app.quit()
+    print(f"{hits} of {args.picks} picks hit an object.")
+
+
+if args.cpu_only:
+    # Read the geometric data without creating GPU buffers.
+    for obj in objs:
+        obj._points_data = obj._read_points_data()
+        obj._lines_data = obj._read_lines_data()
+        obj._frontfaces_data = obj._read_frontfaces_data()
+        obj._update_bounding_box()
+        obj._update_matrix()
+    run()
+else:
+    QTimer.singleShot(500, run)
+    viewer.show()
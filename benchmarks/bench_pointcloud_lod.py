@@ -0,0 +1,55 @@
+# ==========================================================================
+# python benchmarks/bench_pointcloud_lod.py -n 20000000
+# ==========================================================================
+"""Sweep the point budget of the octree level of detail of huge point clouds.
+
+For every budget, the octree nodes are selected for a set of cameras orbiting the cloud,
+and the selection time, the number of nodes and the number of points drawn are reported.
+The benchmark does not need an OpenGL context.
+"""
+
+import argparse
+import time
+from math import cos
+from math import radians
+from math import sin
+from math import tan
+
+from numpy import array
+from numpy import mean
+from numpy.random import default_rng
+
+from compas_viewer.spatial import Octree
+
+ap = argparse.ArgumentParser()
+ap.add_argument("-n", "--points", type=int, default=5_000_000, help="The number of points in the cloud.")
+ap.add_argument("--capacity", type=int, default=20_000, help="The maximum number of points per octree node.")
+ap.add_argument("--budgets", type=int, nargs="+", default=[100_000, 250_000, 500_000, 1_000_000, 2_000_000, 5_000_000])
+ap.add_argument("--error", type=float, default=1.0, help="The screen-space error budget in pixels.")
+ap.add_argument("--height", type=int, default=900, help="The height of the viewport in pixels.")
+args = ap.parse_args()
+
+# A terrain-like scan: a noisy height field of 1000 x 1000 units.
+rng = default_rng(0)
+points = rng.random((args.points, 3)) * [1000, 1000, 1]
+points[:, 2] += 20 * (points[:, 0] / 1000) ** 2
+
+start = time.perf_counter()
+octree = Octree.from_points(points, capacity=args.capacity)
+print(f"Built octree with {len(octree)} nodes over {args.points} points in {time.perf_counter() - start:.2f} s.")
+
+scale = args.height / (2 * tan(radians(45.0) / 2))
+cameras = [array([500 + 700 * cos(radians(a)), 500 + 700 * sin(radians(a)), 300]) for a in range(0, 360, 30)]
+
+print(f"{'budget':>10} {'nodes':>8} {'points':>10} {'select [ms]':>12}")
+for budget in args.budgets:
+    timings = []
+    nodes = []
+    drawn = []
+    for eye in cameras:
+        start = time.perf_counter()
+        selected, total = octree.select(eye, scale, budget, error_budget=args.error)
+        timings.append((time.perf_counter() - start) * 1000)
+        nodes.append(len(selected))
+        drawn.append(total)
+    print(f"{budget:>10} {mean(nodes):>8.0f} {mean(drawn):>10.0f} {mean(timings):>12.2f}")
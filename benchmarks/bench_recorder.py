@@ -0,0 +1,63 @@
+# ==========================================================================
+# xvfb-run python benchmarks/bench_recorder.py -n 1000 --size 1920 1080 --frames 100
+# ==========================================================================
+"""Time the recording of an animation into PNG files, with synchronous and asynchronous readback.
+
+A headless viewer animates a grid of boxes with ``viewer.on``. The synchronous recording steps the animation
+and writes every frame with ``OffscreenRenderer.save``, which waits for the pixels and encodes them in the loop.
+The asynchronous recording uses ``Viewer.recorder``, which reads the pixels back through two pixel buffer objects
+and encodes them in writer threads. The Qt platform plugin has to provide OpenGL contexts,
+for example the "offscreen" plugin in an X server started by ``xvfb-run``.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from compas.geometry import Box
+from compas.geometry import Translation
+from compas_viewer import Viewer
+
+ap = argparse.ArgumentParser()
+ap.add_argument("-n", "--objects", type=int, default=1000, help="The number of box objects.")
+ap.add_argument("--size", type=int, nargs=2, default=(1920, 1080), help="The width and height of the frames.")
+ap.add_argument("--frames", type=int, default=100, help="The number of frames per recording.")
+ap.add_argument("--writers", type=int, default=4, help="The number of writer threads of the recorder.")
+args = ap.parse_args()
+
+viewer = Viewer(headless=True)
+side = int(args.objects**0.5 + 0.999)
+boxes = []
+for i in range(args.objects):
+    x, y = 2 * (i % side), 2 * (i // side)
+    boxes.append(viewer.scene.add(Box(1.0).transformed(Translation.from_vector([x, y, 0])), name=f"box.{i}"))
+viewer.renderer.camera.target = [side, side, 0]
+viewer.renderer.camera.position = [side, -side, 2 * side]
+
+
+@viewer.on(interval=40)
+def rotate(frame):
+    for box in boxes:
+        box.rotation = [0, 0, frame * 0.05]
+        box.update()
+
+
+width, height = args.size
+viewer.recorder.writers = args.writers
+viewer.offscreen.render(width, height)
+
+with tempfile.TemporaryDirectory() as folder:
+    print(f"{args.objects} objects, {args.frames} frames of {width} x {height}.")
+    print(f"{'readback':>12} {'ms/frame':>10} {'frames/s':>10}")
+
+    Path(folder, "sync").mkdir()
+    start = time.perf_counter()
+    for i in range(args.frames):
+        viewer.animation()
+        viewer.offscreen.save(Path(folder, "sync", f"frame.{i:04d}.png"), width, height)
+    elapsed = time.perf_counter() - start
+    print(f"{'synchronous':>12} {elapsed / args.frames * 1000:>10.1f} {args.frames / elapsed:>10.1f}")
+
+    stats = viewer.recorder.record(args.frames, path=Path(folder, "async", "frame.{frame:04d}.png"), width=width, height=height)
+    print(f"{'pbo':>12} {stats['seconds'] / args.frames * 1000:>10.1f} {stats['fps']:>10.1f}")
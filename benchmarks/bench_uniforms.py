@@ -0,0 +1,100 @@
+# ==========================================================================
+# python benchmarks/bench_uniforms.py -n 10000
+# ==========================================================================
+"""Count the OpenGL calls of the shaders in one frame of a scene with many small objects.
+
+Every uniform set used to look up the location of the uniform and then set it, and every enabled
+attribute looked up its location, so the calls of the old shader are counted from the requests.
+The calls of the current shader are counted by wrapping the OpenGL functions used by the shader module.
+The viewer window has to be shown.
+"""
+
+import argparse
+import time
+from collections import Counter
+
+from PySide6.QtCore import QTimer
+
+from compas.geometry import Box
+from compas.geometry import Translation
+from compas_viewer import Viewer
+from compas_viewer.components.renderer.shaders import shader as shader_module
+
+ap = argparse.ArgumentParser()
+ap.add_argument("-n", "--objects", type=int, default=10_000, help="The number of box objects.")
+ap.add_argument("--transformed", action="store_true", help="Give every object its own transformation.")
+args = ap.parse_args()
+
+viewer = Viewer()
+viewer.renderer.config.frustumculling = False
+side = int(args.objects**0.5 + 0.999)
+for i in range(args.objects):
+    x, y = 2 * (i % side), 2 * (i // side)
+    if args.transformed:
+        obj = viewer.scene.add(Box(1.0), name=f"box.{i}")
+        obj.transformation = Translation.from_vector([x, y, 0])
+    else:
+        viewer.scene.add(Box(1.0).transformed(Translation.from_vector([x, y, 0])), name=f"box.{i}")
+viewer.renderer.camera.target = [side, side, 0]
+viewer.renderer.camera.position = [side, -side, 2 * side]
+
+
+class CountingGL:
+    """Count the calls of the OpenGL functions, by name."""
+
+    def __init__(self, gl):
+        self.gl = gl
+        self.counts = Counter()
+
+    def __getattr__(self, name):
+        value = getattr(self.gl, name)
+        if not name.startswith("gl") or not callable(value):
+            return value
+
+        def call(*args, **kwargs):
+            self.counts[name] += 1
+            return value(*args, **kwargs)
+
+        return call
+
+
+requests = Counter()
+
+
+def counted(method):
+    def call(self, name, *args, **kwargs):
+        requests[method.__name__] += 1
+        return method(self, name, *args, **kwargs)
+
+    return call
+
+
+def run():
+    for name in ("uniform4x4", "uniform1i", "uniform1f", "uniform3f", "enable_attribute"):
+        setattr(shader_module.Shader, name, counted(getattr(shader_module.Shader, name)))
+    gl = CountingGL(shader_module.GL)
+    shader_module.GL = gl
+
+    start = time.perf_counter()
+    viewer.renderer.repaint()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    uniforms = sum(requests[name] for name in ("uniform4x4", "uniform1i", "uniform1f", "uniform3f"))
+    issued = sum(count for name, count in gl.counts.items() if name.startswith("glUniform"))
+    lookups = gl.counts["glGetUniformLocation"] + gl.counts["glGetAttribLocation"]
+    before = 2 * uniforms + requests["enable_attribute"]
+    after = issued + lookups
+    print(f"{args.objects} objects, one frame in {elapsed:.1f} ms.")
+    print(f"{'':>28} {'before':>10} {'after':>10}")
+    print(f"{'uniform location lookups':>28} {uniforms:>10} {gl.counts['glGetUniformLocation']:>10}")
+    print(f"{'attribute location lookups':>28} {requests['enable_attribute']:>10} {gl.counts['glGetAttribLocation']:>10}")
+    print(f"{'uniform sets':>28} {uniforms:>10} {issued:>10}")
+    print(f"{'total':>28} {before:>10} {after:>10}")
+    print(f"{before - after} calls removed, {(before - after) / args.objects:.1f} per object.")
+    stats = viewer.renderer.frame_stats
+    print(f"{stats['state_changes']} state changes passed to OpenGL, {stats['state_skipped']} skipped by the state tracker.")
+    viewer.app.quit()
+
+
+QTimer.singleShot(500, run)
+viewer.show()
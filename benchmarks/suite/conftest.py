@@ -0,0 +1,103 @@
+# ==========================================================================
+# xvfb-run python -m pytest benchmarks/suite --benchmark-json=benchmarks.json
+# ==========================================================================
+"""Headless benchmark suite of the pipeline from the scene to the pixels, with pytest-benchmark.
+
+The benchmarks which need OpenGL render with a headless viewer, and are skipped if the Qt platform plugin
+cannot create an OpenGL context. On a server without a GPU, run the suite in an X server started by ``xvfb-run``,
+where Mesa's llvmpipe renders on the CPU. The results are written as JSON with ``--benchmark-json``,
+or saved with ``--benchmark-autosave`` and compared between releases with ``pytest-benchmark compare``.
+The version of compas_viewer, the Qt platform plugin and the OpenGL renderer are added to the machine info of the results.
+"""
+
+import os
+import sys
+
+import pytest
+from OpenGL import GL
+from PySide6.QtGui import QGuiApplication
+from PySide6.QtGui import QOffscreenSurface
+from PySide6.QtGui import QOpenGLContext
+from PySide6.QtGui import QSurfaceFormat
+from PySide6.QtWidgets import QApplication
+
+import compas_viewer
+from compas.geometry import Box
+from compas.geometry import Translation
+from compas_viewer import Viewer
+
+# The number of objects of the scenes of the frame and picking benchmarks.
+OBJECTS = [100, 1_000, 10_000]
+
+# The width and height of the frames.
+SIZE = (1280, 720)
+
+
+def pytest_benchmark_update_machine_info(config, machine_info):
+    machine_info["compas_viewer"] = compas_viewer.__version__
+    machine_info["qt_platform"] = QGuiApplication.platformName()
+    machine_info.update(opengl_info())
+
+
+def opengl_info() -> dict:
+    """The renderer and the version of the OpenGL contexts of headless viewers, which are empty without OpenGL."""
+    surfaceformat = QSurfaceFormat()
+    surfaceformat.setVersion(2, 1)
+    surfaceformat.setProfile(QSurfaceFormat.OpenGLContextProfile.CompatibilityProfile)
+    context = QOpenGLContext()
+    context.setFormat(surfaceformat)
+    if not context.create():
+        return {}
+    surface = QOffscreenSurface()
+    surface.setFormat(context.format())
+    surface.create()
+    context.makeCurrent(surface)
+    info = {"gl_renderer": GL.glGetString(GL.GL_RENDERER).decode(), "gl_version": GL.glGetString(GL.GL_VERSION).decode()}
+    context.doneCurrent()
+    return info
+
+
+@pytest.fixture(scope="session", autouse=True)
+def app():
+    """The application of all viewers, which outlives them, with the "offscreen" Qt platform plugin unless another one is set."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+@pytest.fixture(scope="session")
+def opengl(app) -> bool:
+    """Whether OpenGL contexts can be created."""
+    return bool(opengl_info())
+
+
+@pytest.fixture
+def viewer():
+    """A viewer which is not shown, for the benchmarks which do not need OpenGL."""
+    return Viewer()
+
+
+@pytest.fixture
+def headless(opengl):
+    """A headless viewer, whose OpenGL context is current, or a skip without OpenGL."""
+    if not opengl:
+        pytest.skip("The Qt platform plugin cannot create OpenGL contexts.")
+    viewer = Viewer(headless=True, show_grid=False)
+    viewer.offscreen.make_current()  # type: ignore
+    return viewer
+
+
+@pytest.fixture
+def boxes():
+    """Add a square grid of boxes to the scene of a viewer, and aim the camera at it."""
+
+    def add(viewer: Viewer, n: int):
+        side = int(n**0.5 + 0.999)
+        objs = []
+        for i in range(n):
+            x, y = 2 * (i % side), 2 * (i // side)
+            objs.append(viewer.scene.add(Box(1.0).transformed(Translation.from_vector([x, y, 0])), name=f"box.{i}"))
+        viewer.renderer.camera.target = [side, side, 0]
+        viewer.renderer.camera.position = [side, -side, 2 * side]
+        return objs
+
+    return add
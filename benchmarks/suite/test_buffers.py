@@ -0,0 +1,66 @@
+"""Building the buffers of mesh objects, and uploading vertex buffers."""
+
+import pytest
+from numpy import random
+
+from compas.datastructures import Mesh
+from compas_viewer.gl import delete_buffers
+from compas_viewer.gl import make_vertex_buffer
+
+# The number of faces along the sides of the square grid meshes.
+MESH_SIZES = [10, 50, 100, 200]
+
+# The number of floats of the vertex buffers.
+BUFFER_SIZES = [3 * 10_000, 3 * 100_000, 3 * 1_000_000]
+
+
+@pytest.mark.benchmark(group="mesh buffer data")
+@pytest.mark.parametrize("n", MESH_SIZES)
+def test_mesh_buffer_data(benchmark, viewer, n):
+    """Read the points, lines and faces of a mesh into buffer data, on the CPU only."""
+    obj = viewer.scene.add(Mesh.from_meshgrid(dx=1.0, nx=n))
+
+    def read():
+        obj._read_points_data()
+        obj._read_lines_data()
+        obj._read_frontfaces_data()
+        obj._read_backfaces_data()
+
+    benchmark.extra_info["faces"] = n * n
+    benchmark(read)
+
+
+@pytest.mark.benchmark(group="mesh buffer build")
+@pytest.mark.parametrize("n", MESH_SIZES)
+def test_mesh_buffer_build(benchmark, headless, n):
+    """Initialize a mesh object, from its data to the buffers on the GPU."""
+    obj = headless.scene.add(Mesh.from_meshgrid(dx=1.0, nx=n))
+
+    def release():
+        buffers = [obj._points_buffer, obj._lines_buffer, obj._frontfaces_buffer, obj._backfaces_buffer]
+        for buffer in buffers:
+            if buffer is not None:
+                delete_buffers([buffer["positions"], buffer["colors"], buffer["elements"]])
+
+    def build():
+        obj.init()
+        release()
+
+    benchmark.extra_info["faces"] = n * n
+    benchmark.pedantic(build, rounds=10, warmup_rounds=1)
+
+
+@pytest.mark.benchmark(group="make_vertex_buffer")
+@pytest.mark.parametrize("n", BUFFER_SIZES)
+@pytest.mark.parametrize("kind", ["ndarray", "list"])
+def test_make_vertex_buffer(benchmark, headless, n, kind):
+    """Upload a vertex buffer from a NumPy array, or from a flat list of floats."""
+    data = random.default_rng(0).random(n, dtype="float32")
+    if kind == "list":
+        data = data.tolist()
+
+    def upload():
+        delete_buffers([make_vertex_buffer(data)])
+
+    benchmark.extra_info["bytes"] = 4 * n
+    benchmark(upload)
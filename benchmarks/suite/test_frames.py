@@ -0,0 +1,45 @@
+"""Painting the frames of scenes with many objects, and picking objects in them."""
+
+import pytest
+from conftest import OBJECTS
+from conftest import SIZE
+from OpenGL import GL
+
+
+@pytest.mark.benchmark(group="paint")
+@pytest.mark.parametrize("n", OBJECTS)
+def test_paint(benchmark, headless, boxes, n):
+    """Paint a frame of a rotating camera, waiting for the GPU to finish it."""
+    boxes(headless, n)
+    width, height = SIZE
+    headless.offscreen.paint(width, height)
+
+    def paint():
+        headless.renderer.camera.rotate(1, 0)
+        headless.offscreen.paint(width, height)
+        GL.glFinish()
+
+    benchmark.extra_info["objects"] = n
+    benchmark(paint)
+
+
+@pytest.mark.benchmark(group="picking")
+@pytest.mark.parametrize("n", OBJECTS)
+@pytest.mark.parametrize("pickmode", ["instance", "ray"])
+@pytest.mark.parametrize("cache", ["cold", "warm"])
+def test_pick(benchmark, headless, boxes, n, pickmode, cache):
+    """Pick the object in the middle of the view, with a changed scene or with an unchanged one."""
+    boxes(headless, n)
+    width, height = SIZE
+    headless.offscreen.paint(width, height)
+    selector = headless.renderer.selector
+    selector.pickmode = pickmode
+
+    def pick():
+        if cache == "cold":
+            headless.scene.invalidate()
+        selector.pick_object(width // 2, height // 2)
+        GL.glFinish()
+
+    benchmark.extra_info["objects"] = n
+    benchmark(pick)
@@ -0,0 +1,21 @@
+"""Rebuilding the widgets of the layout."""
+
+import pytest
+
+from compas.geometry import Box
+from compas_viewer.layout import Treeform
+
+# The number of objects in the scene tree.
+NODES = [100, 1_000, 10_000]
+
+
+@pytest.mark.benchmark(group="treeform")
+@pytest.mark.parametrize("n", NODES)
+def test_treeform_update(benchmark, viewer, n):
+    """Rebuild the items of a tree form of the scene tree."""
+    for i in range(n):
+        viewer.scene.add(Box(1.0), name=f"box.{i}")
+    treeform = Treeform(viewer.scene.tree, {"Name": (lambda o: o.name), "Object": (lambda o: o.object)})
+
+    benchmark.extra_info["nodes"] = n
+    benchmark(treeform.update)
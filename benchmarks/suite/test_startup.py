@@ -0,0 +1,29 @@
+"""Starting viewers, up to the first frame."""
+
+import pytest
+from conftest import SIZE
+from OpenGL import GL
+
+from compas_viewer import Viewer
+
+
+@pytest.mark.benchmark(group="startup")
+def test_viewer(benchmark):
+    """Create a viewer with its window, which is not shown."""
+    benchmark.pedantic(Viewer, rounds=5, warmup_rounds=1)
+
+
+@pytest.mark.benchmark(group="startup")
+def test_headless_first_frame(benchmark, opengl):
+    """Create a headless viewer, and paint its first frame."""
+    if not opengl:
+        pytest.skip("The Qt platform plugin cannot create OpenGL contexts.")
+    width, height = SIZE
+
+    def start():
+        viewer = Viewer(headless=True)
+        viewer.offscreen.paint(width, height)  # type: ignore
+        GL.glFinish()
+        viewer.offscreen.done_current()  # type: ignore
+
+    benchmark.pedantic(start, rounds=5, warmup_rounds=1)
@@ -0,0 +1,11 @@
+from numpy.random import default_rng
+
+from compas_viewer import Viewer
+from compas_viewer.scene import LODPointcloud
+
+viewer = Viewer()
+
+points = default_rng(0).random((5_000_000, 3)) * [100, 100, 10]
+viewer.scene.add(LODPointcloud(points, colors=points / [100, 100, 10]), point_budget=1_000_000, pointssize=2)
+
+viewer.show()
@@ -10,6 +10,9 @@ from compas import json_load
 from compas import json_loadz
 from compas.scene.context import ITEM_SCENEOBJECT
 from compas_viewer import Viewer
+from compas_viewer.readers import POINT_READERS
+from compas_viewer.readers import is_point_file
+from compas_viewer.scene import StreamingPointcloud
 
 
 def validate_object(object):
@@ -24,14 +27,15 @@ ap.add_argument(
     "--file",
     required=False,
     help="""
-    The compas.geometry's JSON file, or the compressed JSON file (ZIP).""",
+    The compas.geometry's JSON file, the compressed JSON file (ZIP),
+    or a point file which is streamed into the viewer ({}).""".format(", ".join(POINT_READERS)),
 )
 
 ap.add_argument(
     "--files",
     required=False,
     help="""
-    The path to a folder containing the JSON files for the viewer to load.""",
+    The path to a folder containing the JSON files or point files for the viewer to load.""",
 )
 
 args = vars(ap.parse_args())
@@ -47,8 +51,10 @@ if args["file"]:
         _geos.append(json_load(args["file"]))
     elif args["file"].endswith(".zip"):
         _geos.append(json_loadz(args["file"]))
+    elif is_point_file(args["file"]):
+        _geos.append(StreamingPointcloud(args["file"]))
     else:
-        raise ValueError(f"The file {args['file']} is not a JSON file or a compressed JSON file.")
+        raise ValueError(f"The file {args['file']} is not a JSON file, a compressed JSON file or a point file.")
 
 # ==========================================================================
 # "--files" argument
@@ -60,8 +66,10 @@ if args["files"]:
             _geos.append(json_load(path.join(args["files"], file)))
         elif file.endswith(".zip"):
             _geos.append(json_loadz(path.join(args["files"], file)))
+        elif is_point_file(file):
+            _geos.append(StreamingPointcloud(path.join(args["files"], file)))
         else:
-            print(f"The file {file} in the folder {args['files']} is not a JSON file or a compressed JSON file.")
+            print(f"The file {file} in the folder {args['files']} is not a JSON file, a compressed JSON file or a point file.")
 
 
 # ==========================================================================
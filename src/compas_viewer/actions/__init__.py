@@ -33,6 +33,7 @@ def register_actions():
     register("url", OpenURL)
     register("camera_info", CameraInfo)
     register("selection_info", SelectionInfo)
+    register("toggle_overlay", ToggleOverlay)
 
 
 def get_action_cls(name: str) -> Any:
@@ -50,7 +51,7 @@ from .select_all import SelectAll  # noqa: E402
 from .viewmode import ViewRight, ViewFront, ViewTop, ViewPerspective  # noqa: E402
 from .delete_selected import DeleteSelected  # noqa: E402
 from .io import ImportFile, ExportFile, OpenURL  # noqa: E402
-from .info import GLInfo, CameraInfo, SelectionInfo  # noqa: E402
+from .info import GLInfo, CameraInfo, SelectionInfo, ToggleOverlay  # noqa: E402
 
 register_actions()
 
@@ -68,4 +69,5 @@ ___all__ = [
     "ExportFile",
     "OpenURL",
     "CameraInfo" "SelectionInfo",
+    "ToggleOverlay",
 ]
@@ -47,3 +47,13 @@ class GLInfo(Action):
 
     def pressed_action(self):
         self.viewer.layout.window.info(gl_info())
+
+
+class ToggleOverlay(Action):
+    """
+    Show or hide the performance overlay of the renderer.
+    """
+
+    def pressed_action(self):
+        overlay = self.viewer.renderer.overlay
+        overlay.setVisible(overlay.isHidden())
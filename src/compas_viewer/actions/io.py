@@ -1,13 +1,80 @@
+from pathlib import Path
+
 from PySide6.QtGui import QDesktopServices
+from PySide6.QtWidgets import QFileDialog
+
+from compas import json_load
+from compas import json_loadz
+from compas_viewer.readers import POINT_READERS
+from compas_viewer.readers import is_point_file
 
 from .action import Action
 
 
 class ImportFile(Action):
-    """Import a file into the viewer."""
+    """
+    Import a file into the viewer.
+
+    COMPAS JSON files and compressed JSON files are loaded and added to the scene.
+    Point files (PLY, XYZ, CSV, NPY, LAS) are streamed into the scene as a
+    :class:`compas_viewer.scene.StreamingPointcloud`, while the viewer keeps rendering.
+
+    See Also
+    --------
+    :mod:`compas_viewer.readers`
+    """
 
     def pressed_action(self):
-        raise NotImplementedError("Importing files is not yet implemented.")
+        points = " ".join(f"*{extension}" for extension in POINT_READERS)
+        filepath, _ = QFileDialog.getOpenFileName(
+            self.viewer.window,
+            "Import File",
+            "",
+            f"Supported files (*.json *.zip {points});;COMPAS JSON (*.json *.zip);;Point files ({points})",
+        )
+        if filepath:
+            self.import_file(filepath)
+
+    def import_file(self, filepath: str):
+        """
+        Import a file into the scene.
+
+        Parameters
+        ----------
+        filepath : str
+            The path to the file.
+
+        Raises
+        ------
+        ValueError
+            If the file type is not supported.
+        """
+        from compas_viewer.scene import StreamingPointcloud
+
+        if is_point_file(filepath):
+            items = [StreamingPointcloud(filepath)]
+        elif filepath.endswith(".json"):
+            items = json_load(filepath)
+        elif filepath.endswith(".zip"):
+            items = json_loadz(filepath)
+        else:
+            raise ValueError(f"The file {filepath} is not a JSON file, a compressed JSON file or a point file.")
+
+        if isinstance(items, dict):
+            items = list(items.values())
+        elif not isinstance(items, list):
+            items = [items]
+
+        if self.viewer.started:
+            # Buffers of objects added at runtime are created right away.
+            self.viewer.renderer.makeCurrent()
+        for item in items:
+            obj = self.scene.add(item, name=getattr(item, "name", None) or Path(filepath).stem)
+            if self.viewer.started:
+                obj.init()
+        if self.viewer.started:
+            self.viewer.renderer.doneCurrent()
+        self.viewer.renderer.update()
 
 
 class ExportFile(Action):
@@ -0,0 +1,369 @@
+"""
+Batch rendering of many camera views of many scene files, on a pool of processes.
+
+Every process of the pool has a headless :class:`compas_viewer.Viewer` with its own offscreen OpenGL context.
+The jobs are grouped by scene file, such that a scene is loaded once for all the cameras of a group,
+and the images are encoded and written by a pool of threads in every process, while the next frame is rendered.
+
+Scripts which render batches have to guard their entry point with ``if __name__ == "__main__":``,
+because the processes are started with the "spawn" method, which imports the main module again.
+"""
+
+import gc
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from multiprocessing import get_context
+from os import cpu_count
+from pathlib import Path
+from typing import Callable
+from typing import Literal
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+from compas import json_load
+from compas import json_loadz
+
+Rendermode = Literal["wireframe", "shaded", "ghosted", "oit", "lighted"]
+
+
+class RenderJob:
+    """A camera view of a scene file, to be rendered into an image file.
+
+    Parameters
+    ----------
+    scene : str | :class:`pathlib.Path`
+        The path of the scene, a COMPAS JSON file (".json") or a compressed COMPAS JSON file (".zip").
+        The items of the file are added to the scene, as by :class:`compas_viewer.actions.ImportFile`.
+    output : str | :class:`pathlib.Path`
+        The path of the image file. The format follows from the extension, such as ".png" or ".jpg".
+        Missing folders are created.
+    position : tuple[float, float, float]
+        The position of the camera.
+    target : tuple[float, float, float], optional
+        The target of the camera. Default is the origin.
+    rendermode : Literal['wireframe', 'shaded', 'ghosted', 'oit', 'lighted'], optional
+        The render mode. Default is "shaded".
+    width : int, optional
+        The width of the image, in pixels. Default is 1920.
+    height : int, optional
+        The height of the image, in pixels. Default is 1080.
+
+    Attributes
+    ----------
+    scene : str
+        The path of the scene.
+    output : str
+        The path of the image file.
+    position : tuple[float, float, float]
+        The position of the camera.
+    target : tuple[float, float, float]
+        The target of the camera.
+    rendermode : str
+        The render mode.
+    width : int
+        The width of the image.
+    height : int
+        The height of the image.
+    """
+
+    def __init__(
+        self,
+        scene: Union[str, Path],
+        output: Union[str, Path],
+        position: Sequence[float],
+        target: Sequence[float] = (0.0, 0.0, 0.0),
+        rendermode: Rendermode = "shaded",
+        width: int = 1920,
+        height: int = 1080,
+    ):
+        self.scene = str(scene)
+        self.output = str(output)
+        self.position = tuple(float(x) for x in position)
+        self.target = tuple(float(x) for x in target)
+        self.rendermode = rendermode
+        self.width = width
+        self.height = height
+
+    def __repr__(self):
+        return f"RenderJob({self.scene!r}, {self.output!r}, position={self.position}, target={self.target}, rendermode={self.rendermode!r}, size={self.width}x{self.height})"
+
+
+class BatchReport:
+    """The outcome of a batch of render jobs.
+
+    Attributes
+    ----------
+    images : int
+        The number of images written.
+    failed : list[tuple[:class:`RenderJob`, str]]
+        The jobs which failed, with their errors.
+    seconds : float
+        The wall clock time of the batch, including the start of the processes.
+    scenes : int
+        The number of times a scene was loaded, over all processes.
+    """
+
+    def __init__(self):
+        self.images = 0
+        self.failed: list[tuple[RenderJob, str]] = []
+        self.seconds = 0.0
+        self.scenes = 0
+
+    @property
+    def images_per_second(self) -> float:
+        """The throughput of the batch, in images written per second."""
+        return self.images / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return f"{self.images} images in {self.seconds:.1f} s, {self.images_per_second:.1f} images/s, {len(self.failed)} failed, {self.scenes} scene loads."
+
+
+class BatchRenderer:
+    """Render batches of jobs on a pool of processes, each with a headless viewer and its own offscreen OpenGL context.
+
+    Parameters
+    ----------
+    processes : int, optional
+        The number of processes. Default is the number of CPUs.
+    writers : int, optional
+        The number of threads per process encoding and writing the images. Default is 2.
+    samples : int, optional
+        The number of samples per pixel for multisample anti-aliasing. Default is 4.
+    show_grid : bool, optional
+        Draw the grid of the XY plane. Default is False.
+
+    Attributes
+    ----------
+    processes : int
+        The number of processes.
+    writers : int
+        The number of writer threads per process.
+    samples : int
+        The number of samples per pixel.
+    show_grid : bool
+        Whether the grid is drawn.
+
+    Notes
+    -----
+    The jobs are sorted by scene file and render mode, and split into tasks of at most ``chunksize`` jobs of one scene.
+    A process keeps the viewer of the last scene it rendered, such that consecutive tasks of the same scene
+    do not load it again. The viewer of another scene is created anew, which releases the buffers of the previous one
+    together with its OpenGL context, and starts with the default configuration and camera.
+    With the "offscreen" Qt platform plugin on a server without a GPU, every process renders with Mesa's llvmpipe
+    on the CPU, so more processes than CPUs do not increase the throughput.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from compas_viewer.batch import BatchRenderer
+        from compas_viewer.batch import RenderJob
+
+        if __name__ == "__main__":
+            jobs = []
+            for variant in ["a.json", "b.json"]:
+                for i, position in enumerate([(10, -10, 10), (-10, -10, 10)]):
+                    jobs.append(RenderJob(variant, f"images/{variant}.{i}.png", position, width=1280, height=720))
+            report = BatchRenderer(processes=4).run(jobs)
+            print(report)
+
+    See Also
+    --------
+    :class:`compas_viewer.components.renderer.OffscreenRenderer`
+    """
+
+    def __init__(self, processes: Optional[int] = None, writers: int = 2, samples: int = 4, show_grid: bool = False):
+        self.processes = processes or cpu_count() or 1
+        self.writers = writers
+        self.samples = samples
+        self.show_grid = show_grid
+
+    def tasks(self, jobs: Sequence[RenderJob], chunksize: Optional[int] = None) -> list[list[tuple[int, RenderJob]]]:
+        """Group the jobs into tasks of one scene, with the indices of the jobs.
+
+        Parameters
+        ----------
+        jobs : Sequence[:class:`RenderJob`]
+            The jobs.
+        chunksize : int, optional
+            The maximum number of jobs of a task. By default, the number of jobs divided by the number of processes,
+            such that only the scenes with more than a fair share of the jobs are split over several processes.
+
+        Returns
+        -------
+        list[list[tuple[int, :class:`RenderJob`]]]
+            The tasks, the largest first.
+        """
+        if chunksize is None:
+            chunksize = max(1, -(-len(jobs) // self.processes))
+        groups: OrderedDict[str, list[tuple[int, RenderJob]]] = OrderedDict()
+        for index, job in enumerate(jobs):
+            groups.setdefault(job.scene, []).append((index, job))
+        tasks = []
+        for group in groups.values():
+            group.sort(key=lambda item: item[1].rendermode)
+            for start in range(0, len(group), chunksize):
+                tasks.append(group[start : start + chunksize])
+        tasks.sort(key=len, reverse=True)
+        return tasks
+
+    def run(
+        self,
+        jobs: Sequence[RenderJob],
+        chunksize: Optional[int] = None,
+        callback: Optional[Callable[[RenderJob, Optional[str]], None]] = None,
+    ) -> BatchReport:
+        """Render the jobs, and wait until all the images are written.
+
+        Parameters
+        ----------
+        jobs : Sequence[:class:`RenderJob`]
+            The jobs.
+        chunksize : int, optional
+            The maximum number of jobs sent to a process at once, see :meth:`tasks`.
+        callback : Callable[[:class:`RenderJob`, str | None], None], optional
+            Called in this process for every finished job, with the error of the job, or None if its image is written.
+
+        Returns
+        -------
+        :class:`BatchReport`
+            The number of images written, the failed jobs, and the throughput.
+        """
+        report = BatchReport()
+        start = time.perf_counter()
+        context = get_context("spawn")
+        initargs = (self.writers, self.samples, self.show_grid)
+        with ProcessPoolExecutor(max_workers=self.processes, mp_context=context, initializer=_init_worker, initargs=initargs) as pool:
+            futures = {pool.submit(_render_task, task): task for task in self.tasks(jobs, chunksize)}
+            for future in as_completed(futures):
+                try:
+                    errors, loaded = future.result()
+                except Exception as e:
+                    # The process failed as a whole, for example without an OpenGL context.
+                    errors = {index: f"{type(e).__name__}: {e}" for index, _ in futures[future]}
+                    loaded = False
+                report.scenes += loaded
+                for index, job in futures[future]:
+                    error = errors.get(index)
+                    if error is None:
+                        report.images += 1
+                    else:
+                        report.failed.append((job, error))
+                    if callback:
+                        callback(job, error)
+        report.seconds = time.perf_counter() - start
+        return report
+
+
+def render_batch(jobs: Sequence[RenderJob], processes: Optional[int] = None, **kwargs) -> BatchReport:
+    """Render a batch of jobs on a pool of processes.
+
+    Parameters
+    ----------
+    jobs : Sequence[:class:`RenderJob`]
+        The jobs.
+    processes : int, optional
+        The number of processes. Default is the number of CPUs.
+    **kwargs : dict, optional
+        The other parameters of :class:`BatchRenderer`.
+
+    Returns
+    -------
+    :class:`BatchReport`
+        The number of images written, the failed jobs, and the throughput.
+    """
+    return BatchRenderer(processes=processes, **kwargs).run(jobs)
+
+
+# ==========================================================================
+# Worker processes
+# ==========================================================================
+
+_worker: dict = {}
+
+
+def _init_worker(writers: int, samples: int, show_grid: bool):
+    """Start the application and the writer threads of a process, the viewer is created by the first task."""
+    from PySide6.QtWidgets import QApplication
+
+    # The application outlives the viewers, which are replaced for every scene.
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    _worker["app"] = QApplication.instance() or QApplication(sys.argv)
+    _worker["writers"] = ThreadPoolExecutor(max_workers=writers)
+    _worker["samples"] = samples
+    _worker["show_grid"] = show_grid
+    _worker["scene"] = None
+    _worker["viewer"] = None
+
+
+def _load_viewer(job: RenderJob):
+    """Create a headless viewer with the items of the scene file of a job."""
+    from compas_viewer import Viewer
+
+    if job.scene.endswith(".json"):
+        items = json_load(job.scene)
+    elif job.scene.endswith(".zip"):
+        items = json_loadz(job.scene)
+    else:
+        raise ValueError(f"The scene {job.scene} is not a JSON file or a compressed JSON file.")
+    if isinstance(items, dict):
+        items = list(items.values())
+    elif not isinstance(items, list):
+        items = [items]
+
+    # The previous viewer and its OpenGL context are released first.
+    _worker["viewer"] = None
+    _worker["scene"] = None
+    gc.collect()
+    viewer = Viewer(headless=True, rendermode=job.rendermode, show_grid=_worker["show_grid"])
+    viewer.offscreen.samples = _worker["samples"]  # type: ignore
+    for item in items:
+        viewer.scene.add(item, name=getattr(item, "name", None) or Path(job.scene).stem)
+    _worker["viewer"] = viewer
+    _worker["scene"] = job.scene
+    return viewer
+
+
+def _write(image, path: str):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    if not image.save(path):
+        raise OSError(f"Writing the image {path} failed.")
+
+
+def _render_task(task: list[tuple[int, RenderJob]]) -> tuple[dict[int, str], bool]:
+    """Render the jobs of a task, which share a scene, and wait until their images are written."""
+    errors: dict[int, str] = {}
+    loaded = False
+    viewer = _worker["viewer"]
+    if _worker["scene"] != task[0][1].scene:
+        try:
+            viewer = _load_viewer(task[0][1])
+            loaded = True
+        except Exception as e:
+            return {index: f"{type(e).__name__}: {e}" for index, _ in task}, False
+
+    writes: dict[int, Future] = {}
+    for index, job in task:
+        try:
+            if viewer.renderer.rendermode != job.rendermode:
+                viewer.offscreen.make_current()
+                viewer.renderer.rendermode = job.rendermode
+            viewer.renderer.camera.target = list(job.target)
+            viewer.renderer.camera.position = list(job.position)
+            image = viewer.offscreen.image(job.width, job.height)
+            writes[index] = _worker["writers"].submit(_write, image, job.output)
+        except Exception as e:
+            errors[index] = f"{type(e).__name__}: {e}"
+    for index, future in writes.items():
+        try:
+            future.result()
+        except Exception as e:
+            errors[index] = f"{type(e).__name__}: {e}"
+    return errors, loaded
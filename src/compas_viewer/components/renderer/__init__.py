@@ -2,3 +2,16 @@ from .renderer import Renderer  # noqa: F401
 from .camera import Camera  # noqa: F401
 from .shaders.shader import Shader  # noqa: F401
 from .selector import Selector  # noqa: F401
+from .raycaster import RayCaster  # noqa: F401
+from .raycaster import PickResult  # noqa: F401
+from .elementpicker import ElementPicker  # noqa: F401
+from .occlusion import OcclusionCuller  # noqa: F401
+from .renderqueue import RenderQueue  # noqa: F401
+from .renderqueue import DrawItem  # noqa: F401
+from .oit import WeightedBlendedOIT  # noqa: F401
+from .renderlists import RenderLists  # noqa: F401
+from .framescheduler import FrameScheduler  # noqa: F401
+from .frametimer import FrameTimer  # noqa: F401
+from .overlay import PerformanceOverlay  # noqa: F401
+from .offscreen import OffscreenRenderer  # noqa: F401
+from .recorder import FrameRecorder  # noqa: F401
@@ -397,6 +397,28 @@ class Camera:
             P = self.ortho(left, right, bottom, top, self.config.near * self.config.scale, self.config.far * self.config.scale)
         return list(asfortranarray(P, dtype=float32))
 
+    def pixelscale(self, width: int, height: int) -> float:
+        """Compute the number of pixels covered by one unit of length on screen.
+
+        Parameters
+        ----------
+        width : int
+            Width of the viewer.
+        height : int
+            Height of the viewer.
+
+        Returns
+        -------
+        float
+            In perspective view mode, the number of pixels per unit of length at unit distance from the camera,
+            such that a length ``l`` at distance ``d`` covers ``l * pixelscale / d`` pixels.
+            In the orthographic view modes, the number of pixels per unit of length at any distance.
+
+        """
+        if self.renderer.viewmode == "perspective":
+            return height / (2 * tan(radians(self.config.fov) / 2))
+        return width / (2 * self.distance)
+
     def viewworld(self) -> list[list[float]]:
         """Compute the view-world matrix corresponding to the current camera settings.
 
@@ -0,0 +1,311 @@
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Literal
+from typing import Optional
+from typing import Sequence
+
+from numpy import array
+from numpy import frombuffer
+from numpy import int64
+from numpy import uint8
+from numpy import unique
+from OpenGL import GL
+from PySide6.QtCore import QSize
+from PySide6.QtOpenGL import QOpenGLFramebufferObject
+
+from compas_viewer.gl import glstate
+
+if TYPE_CHECKING:
+    from compas_viewer.scene import ViewerSceneObject
+
+    from .renderer import Renderer
+
+
+ElementKind = Literal["point", "line", "face"]
+
+
+class ElementPicker:
+    """Pick the vertices, edges and faces of objects through an offscreen map of element IDs.
+
+    Where the instance map of the :class:`compas_viewer.components.renderer.Selector` identifies whole objects,
+    the element map stores a 32-bit ID per pixel: the index of the point, line or triangle drawn there
+    in the RGB bytes, and the range it belongs to in the alpha byte. A range is one kind of elements of one object.
+    The IDs are mapped back to the vertex, edge and face keys recorded while the buffers were created.
+
+    Parameters
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+
+    Attributes
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+    PIXEL_SELECTION_INCREMENTAL : int
+        The size in pixels added to the points and the width added to the lines in the element map.
+    MAX_ELEMENTS : int
+        The maximum number of elements of one kind in one object.
+
+    Notes
+    -----
+    The requested kinds of elements are drawn in one pass without blending nor smoothing,
+    faces first and points last, such that vertices and edges win over the faces they lie on.
+    The faces of the target objects are always drawn into the depth buffer,
+    and the other visible objects as well, so that hidden elements cannot be picked.
+    Elements are drawn regardless of the ``show_points``, ``show_lines`` and ``show_faces`` settings of the objects.
+    The map is only repainted when the scene, the camera, the targets or the kinds have changed.
+
+    See Also
+    --------
+    :func:`compas_viewer.scene.ViewerSceneObject.draw_elements`
+    :func:`compas_viewer.scene.ViewerSceneObject.element_keys`
+
+    Examples
+    --------
+    .. code-block:: python
+
+        picker = viewer.renderer.elementpicker
+        hit = picker.pick(x, y, objs=[obj], kinds=("point",))
+        if hit:
+            obj, kind, vertex = hit
+        faces = picker.pick_box((x1, y1, x2, y2), objs=[obj], kinds=("face",))[obj]["face"]
+    """
+
+    PIXEL_SELECTION_INCREMENTAL = 4
+    MAX_ELEMENTS = (1 << 24) - 1
+
+    # The draw order and the depth offsets of the kinds, in normalized device coordinates.
+    KINDS: tuple[ElementKind, ...] = ("face", "line", "point")
+    DEPTH_OFFSETS = {"face": 0.0, "line": 1e-5, "point": 2e-5}
+
+    def __init__(self, renderer: "Renderer"):
+        self.renderer = renderer
+        self.viewer = renderer.viewer
+        self.scene = renderer.scene
+        self._fbo: Optional[QOpenGLFramebufferObject] = None
+        self._key: Optional[tuple] = None
+        self._ranges: list[tuple["ViewerSceneObject", ElementKind]] = []
+
+    def targets(self, objs: Optional[Sequence["ViewerSceneObject"]] = None) -> list["ViewerSceneObject"]:
+        """The visible and selectable objects whose elements can be picked.
+
+        Parameters
+        ----------
+        objs : Sequence[:class:`compas_viewer.scene.ViewerSceneObject`], optional
+            The candidate objects. Default is all objects of the scene.
+
+        Returns
+        -------
+        list[:class:`compas_viewer.scene.ViewerSceneObject`]
+        """
+        if objs is None:
+            objs = self.scene.objects  # type: ignore
+        return [obj for obj in objs if obj.is_visible and not obj.is_locked and obj.instance_color.rgb255 in self.scene.instance_colors]  # type: ignore
+
+    def paint(self, objs: Sequence["ViewerSceneObject"], kinds: Sequence[ElementKind]) -> QOpenGLFramebufferObject:
+        """Paint the element map of the objects into an offscreen framebuffer, unless it is up to date.
+
+        Parameters
+        ----------
+        objs : Sequence[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The objects whose elements are drawn.
+        kinds : Sequence[Literal["point", "line", "face"]]
+            The kinds of elements which are drawn.
+
+        Returns
+        -------
+        :PySide6:`PySide6/QtOpenGL/QOpenGLFramebufferObject`
+            The framebuffer holding the element map.
+
+        Raises
+        ------
+        ValueError
+            If there are more than 256 ranges, or more than :attr:`MAX_ELEMENTS` elements in one range.
+
+        Notes
+        -----
+        The OpenGL context of the renderer has to be current.
+        """
+        renderer = self.renderer
+        r = renderer.devicePixelRatio()
+        size = QSize(int(self.viewer.layout.config.window.width * r), int(self.viewer.layout.config.window.height * r))
+        if self._fbo is None or self._fbo.size() != size:
+            self._fbo = QOpenGLFramebufferObject(size, QOpenGLFramebufferObject.Attachment.Depth)
+            self._key = None
+
+        key = (renderer.selector.instance_map_key(), tuple(id(obj) for obj in objs), tuple(kinds))
+        if key == self._key:
+            return self._fbo
+
+        ranges = [(obj, kind) for kind in self.KINDS if kind in kinds for obj in objs if obj.primitives(kind) is not None]
+        if len(ranges) > 256:
+            raise ValueError(f"The element map holds at most 256 ranges of elements, got {len(ranges)}.")
+        for obj, kind in ranges:
+            if len(obj.primitives(kind)) > self.MAX_ELEMENTS:  # type: ignore
+                raise ValueError(f"The element map holds at most {self.MAX_ELEMENTS} elements per range, {obj.name} has more {kind}s.")
+
+        self._fbo.bind()
+        GL.glViewport(0, 0, size.width(), size.height())
+        glstate.clear_color(0, 0, 0, 0)
+        renderer.clear()
+        glstate.clear_color(*renderer.config.backgroundcolor.rgba)
+        glstate.disable(GL.GL_BLEND)
+        glstate.disable(GL.GL_CULL_FACE)
+        glstate.disable(GL.GL_POINT_SMOOTH)
+        glstate.disable(GL.GL_LINE_SMOOTH)
+        glstate.depth_func(GL.GL_LEQUAL)
+        viewworld = renderer.camera.viewworld()
+        projection = renderer.camera.projection(self.viewer.layout.config.window.width, self.viewer.layout.config.window.height)
+
+        # Occluders, only written to the depth buffer.
+        glstate.color_mask(False, False, False, False)
+        targets = set(map(id, objs))
+        _, _, mesh_objs = renderer.renderlists.lists(visible=False)
+        renderer.shader_instance.bind()
+        renderer.shader_instance.uniform4x4("projection", projection)
+        renderer.shader_instance.uniform4x4("viewworld", viewworld)
+        for obj in mesh_objs:
+            if id(obj) not in targets and obj.is_visible:
+                obj.draw_instance(renderer.shader_instance, renderer.rendermode == "wireframe")
+        renderer.shader_instance.release()
+
+        shader = renderer.shader_element
+        shader.bind()
+        shader.uniform4x4("projection", projection)
+        shader.uniform4x4("viewworld", viewworld)
+        shader.uniform1f("range", 0)
+        shader.uniform1f("depth_offset", 0)
+        if "face" not in kinds:
+            for obj in objs:
+                obj.draw_elements(shader, "face")
+        glstate.color_mask(True, True, True, True)
+
+        # The element IDs.
+        for i, (obj, kind) in enumerate(ranges):
+            shader.uniform1f("range", i)
+            shader.uniform1f("depth_offset", self.DEPTH_OFFSETS[kind])
+            obj.draw_elements(shader, kind, increment=self.PIXEL_SELECTION_INCREMENTAL)
+        shader.release()
+
+        glstate.depth_func(GL.GL_LESS)
+        glstate.enable(GL.GL_BLEND)
+        glstate.enable(GL.GL_CULL_FACE)
+        glstate.enable(GL.GL_POINT_SMOOTH)
+        glstate.enable(GL.GL_LINE_SMOOTH)
+        GL.glBindFramebuffer(GL.GL_FRAMEBUFFER, renderer.defaultFramebufferObject())
+        self._key = key
+        self._ranges = ranges
+        return self._fbo
+
+    def read(self, box: tuple[int, int, int, int], objs: Sequence["ViewerSceneObject"], kinds: Sequence[ElementKind]):
+        """Read the element IDs of a box area of the screen.
+
+        Parameters
+        ----------
+        box : tuple[int, int, int, int]
+            The box area [x1, y1, x2, y2] in screen coordinates. x1=x2 and y1=y2 means a single pixel.
+        objs : Sequence[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The objects whose elements are drawn.
+        kinds : Sequence[Literal["point", "line", "face"]]
+            The kinds of elements which are drawn.
+
+        Returns
+        -------
+        ndarray
+            The 32-bit IDs of the pixels, row by row from the bottom. Zero where there is no element.
+        """
+        x1, y1, x2, y2 = box
+        x, y = min(x1, x2), self.viewer.layout.config.window.height - max(y1, y2) - 1
+        width = max(1, abs(x1 - x2))
+        height = max(1, abs(y1 - y2))
+        r = self.renderer.devicePixelRatio()
+
+        self.renderer.makeCurrent()
+        fbo = self.paint(objs, kinds)
+        fbo.bind()
+        pixels = GL.glReadPixels(int(x * r), int(y * r), max(1, int(width * r)), max(1, int(height * r)), GL.GL_RGBA, GL.GL_UNSIGNED_BYTE)
+        GL.glBindFramebuffer(GL.GL_FRAMEBUFFER, self.renderer.defaultFramebufferObject())
+        return frombuffer(pixels, dtype=uint8).view(">u4").ravel()
+
+    def decode(self, ids) -> dict["ViewerSceneObject", dict[ElementKind, list[Any]]]:
+        """Map element IDs of the last painted map to the keys of the elements.
+
+        Parameters
+        ----------
+        ids : array-like
+            The 32-bit IDs, as returned by :meth:`read`.
+
+        Returns
+        -------
+        dict[:class:`compas_viewer.scene.ViewerSceneObject`, dict[Literal["point", "line", "face"], list]]
+            The keys of the vertices, edges and faces per object and kind.
+        """
+        # The RGB bytes are the high bytes of the big-endian IDs, and the alpha byte the low byte.
+        ids = unique(array(ids, dtype=">u4")).astype(int64)
+        ids = ids[ids >> 8 > 0]
+        ranges = ids & 255
+        indices = (ids >> 8) - 1
+        elements: dict["ViewerSceneObject", dict[ElementKind, list[Any]]] = {}
+        for i in unique(ranges).tolist():
+            obj, kind = self._ranges[i]
+            elements.setdefault(obj, {})[kind] = obj.element_keys(kind, indices[ranges == i])
+        return elements
+
+    def pick(
+        self,
+        x: int,
+        y: int,
+        objs: Optional[Sequence["ViewerSceneObject"]] = None,
+        kinds: Sequence[ElementKind] = ("point", "line", "face"),
+    ) -> Optional[tuple["ViewerSceneObject", ElementKind, Any]]:
+        """Pick the element under a point of the screen.
+
+        Parameters
+        ----------
+        x, y : int
+            The screen coordinates of the point.
+        objs : Sequence[:class:`compas_viewer.scene.ViewerSceneObject`], optional
+            The objects whose elements can be picked. Default is all visible and selectable objects.
+        kinds : Sequence[Literal["point", "line", "face"]], optional
+            The kinds of elements which can be picked.
+
+        Returns
+        -------
+        tuple[:class:`compas_viewer.scene.ViewerSceneObject`, Literal["point", "line", "face"], Any] | None
+            The object, the kind and the vertex, edge or face key of the element, or None if there is no element.
+        """
+        objs = self.targets(objs)
+        if not objs:
+            return None
+        elements = self.decode(self.read((x, y, x, y), objs, kinds))
+        for obj, keys in elements.items():
+            for kind, values in keys.items():
+                return obj, kind, values[0]
+        return None
+
+    def pick_box(
+        self,
+        box: tuple[int, int, int, int],
+        objs: Optional[Sequence["ViewerSceneObject"]] = None,
+        kinds: Sequence[ElementKind] = ("point", "line", "face"),
+    ) -> dict["ViewerSceneObject", dict[ElementKind, list[Any]]]:
+        """Pick the visible elements in a box area of the screen.
+
+        Parameters
+        ----------
+        box : tuple[int, int, int, int]
+            The box area [x1, y1, x2, y2] in screen coordinates.
+        objs : Sequence[:class:`compas_viewer.scene.ViewerSceneObject`], optional
+            The objects whose elements can be picked. Default is all visible and selectable objects.
+        kinds : Sequence[Literal["point", "line", "face"]], optional
+            The kinds of elements which can be picked.
+
+        Returns
+        -------
+        dict[:class:`compas_viewer.scene.ViewerSceneObject`, dict[Literal["point", "line", "face"], list]]
+            The keys of the vertices, edges and faces per object and kind.
+        """
+        objs = self.targets(objs)
+        if not objs:
+            return {}
+        return self.decode(self.read(box, objs, kinds))
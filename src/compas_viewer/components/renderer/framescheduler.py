@@ -0,0 +1,105 @@
+import time
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import QObject
+from PySide6.QtCore import Qt
+from PySide6.QtCore import QTimer
+from PySide6.QtOpenGLWidgets import QOpenGLWidget
+
+if TYPE_CHECKING:
+    from .renderer import Renderer
+
+
+class FrameScheduler(QObject):
+    """Coalesce the repaint requests of the renderer into at most one paint per display refresh.
+
+    A request only marks the frame dirty. The paint is scheduled for the next refresh of the screen
+    after the last paint, and all requests made until then are served by that one paint.
+    While the renderer is hidden or its window is minimized, the scheduler is paused and the frame stays dirty,
+    to be painted when the renderer is shown again.
+
+    Parameters
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+
+    Attributes
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+    dirty : bool
+        Whether a paint has been requested since the last paint.
+    paused : bool
+        Whether the renderer is hidden, such that no paints are scheduled.
+    requests : int
+        The number of requests.
+    paints : int
+        The number of paints scheduled for the requests.
+
+    Notes
+    -----
+    :func:`compas_viewer.components.renderer.Renderer.update` is routed through :meth:`request`,
+    so all updates of the scene objects, the actions and the controller are coalesced.
+    Paints requested by Qt itself, for example after a resize, are not affected,
+    and :func:`compas_viewer.components.renderer.Renderer.repaint` still paints immediately.
+    """
+
+    # The refresh rate used if the screen does not report one.
+    DEFAULT_REFRESH_RATE = 60.0
+
+    def __init__(self, renderer: "Renderer"):
+        super().__init__()
+        self.renderer = renderer
+        self.dirty = False
+        self.paused = False
+        self.requests = 0
+        self.paints = 0
+        self._last = 0.0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._paint)
+
+    @property
+    def interval(self) -> float:
+        """The time between two refreshes of the screen of the renderer, in seconds."""
+        screen = self.renderer.screen()
+        rate = screen.refreshRate() if screen is not None else 0
+        return 1.0 / (rate if rate > 0 else self.DEFAULT_REFRESH_RATE)
+
+    def request(self):
+        """Mark the frame dirty and schedule a paint for the next refresh, unless one is scheduled already."""
+        self.requests += 1
+        self.dirty = True
+        self._schedule()
+
+    def _schedule(self):
+        if self.paused or self._timer.isActive():
+            return
+        wait = self._last + self.interval - time.perf_counter()
+        self._timer.start(max(0, int(wait * 1000)))
+
+    def _paint(self):
+        if not self.dirty:
+            return
+        if not self.renderer.isVisible() or self.renderer.window().isMinimized():
+            self.pause()
+            return
+        self.paints += 1
+        QOpenGLWidget.update(self.renderer)
+
+    def painted(self):
+        """Mark the frame clean, called by the renderer at every paint, whoever requested it."""
+        self.dirty = False
+        self._last = time.perf_counter()
+
+    def pause(self):
+        """Stop scheduling paints, for example when the renderer is hidden."""
+        self.paused = True
+        self._timer.stop()
+
+    def resume(self):
+        """Schedule paints again, and paint the requests made while paused."""
+        self.paused = False
+        if self.dirty:
+            self._schedule()
@@ -0,0 +1,156 @@
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+from typing import Optional
+
+from OpenGL import GL
+
+if TYPE_CHECKING:
+    from .renderer import Renderer
+
+
+class FrameTimer:
+    """Record the CPU and GPU time of the phases of the paints of the renderer, over a rolling window of frames.
+
+    A paint is divided into phases by laps: :meth:`begin` starts the first phase, and every call of :meth:`lap`
+    ends the current phase under the given name and starts the next one. The CPU time of a phase is measured
+    with :func:`time.perf_counter`. Its GPU time is measured with a ``GL_TIME_ELAPSED`` query around the
+    commands of the phase, whose result is read in a later frame, when it is available, such that the CPU never
+    waits for the GPU.
+
+    Parameters
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+    window : int, optional
+        The number of frames kept. Default is 120.
+
+    Attributes
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+    frames : collections.deque[dict]
+        The records of the last frames, oldest first. Every record has the start time of the paint ``"time"``,
+        and the CPU and GPU times of its phases, ``"cpu"`` and ``"gpu"``, in milliseconds.
+        The GPU times of the last frames are filled in when their queries are available.
+    gpu : bool | None
+        Whether the GPU times are measured, which requires OpenGL 3.3 or the ``GL_ARB_timer_query`` extension.
+        None until the first frame.
+
+    Notes
+    -----
+    The GPU time of phases without OpenGL commands, such as the categorization of the objects, is close to zero.
+    Only the paints of the scene are recorded, not those of the instance map.
+
+    See Also
+    --------
+    :func:`compas_viewer.components.renderer.Renderer.stats`
+    :attr:`compas_viewer.configurations.RendererConfig.gputiming`
+
+    References
+    ----------
+    * https://registry.khronos.org/OpenGL/extensions/ARB/ARB_timer_query.txt
+    """
+
+    def __init__(self, renderer: "Renderer", window: int = 120):
+        self.renderer = renderer
+        self.frames: deque[dict] = deque(maxlen=window)
+        self.gpu: Optional[bool] = None
+        self._record: Optional[dict] = None
+        self._phase_start = 0.0
+        self._query: Optional[int] = None
+        self._pending: deque[tuple[dict, str, int]] = deque()
+        self._free: list[int] = []
+
+    def _init(self):
+        """Find whether timer queries are supported, in the OpenGL context of the renderer."""
+        context = self.renderer.context()
+        version = (context.format().majorVersion(), context.format().minorVersion())
+        self.gpu = version >= (3, 3) or context.hasExtension(b"GL_ARB_timer_query")
+
+    def _collect(self):
+        """Read the GPU times of the queries which are available, in the order they were issued."""
+        while self._pending:
+            record, phase, query = self._pending[0]
+            if not int(GL.glGetQueryObjectuiv(query, GL.GL_QUERY_RESULT_AVAILABLE)):
+                break
+            self._pending.popleft()
+            record["gpu"][phase] = int(GL.glGetQueryObjectui64v(query, GL.GL_QUERY_RESULT)) / 1e6
+            self._free.append(query)
+
+    def _begin_query(self):
+        if not self._free:
+            self._free.append(int(GL.glGenQueries(1)))
+        self._query = self._free.pop()
+        GL.glBeginQuery(GL.GL_TIME_ELAPSED, self._query)
+
+    def begin(self):
+        """Start the record of a frame, and collect the available GPU times of the previous frames."""
+        if self.gpu is None:
+            self._init()
+        timing = self.gpu and self.renderer.config.gputiming
+        if self.gpu:
+            self._collect()
+        now = time.perf_counter()
+        self._record = {"time": now, "cpu": {}, "gpu": {}}
+        self._phase_start = now
+        if timing:
+            self._begin_query()
+
+    def lap(self, phase: str):
+        """End the current phase under a name, and start the next one.
+
+        Parameters
+        ----------
+        phase : str
+            The name of the phase which ends.
+        """
+        if self._record is None:
+            return
+        now = time.perf_counter()
+        self._record["cpu"][phase] = (now - self._phase_start) * 1e3
+        self._phase_start = now
+        if self._query is not None:
+            GL.glEndQuery(GL.GL_TIME_ELAPSED)
+            self._pending.append((self._record, phase, self._query))
+            self._begin_query()
+
+    def end(self):
+        """End the record of the frame, discarding the time since the last lap."""
+        if self._record is None:
+            return
+        if self._query is not None:
+            GL.glEndQuery(GL.GL_TIME_ELAPSED)
+            self._free.append(self._query)
+            self._query = None
+        self._record["cpu"]["total"] = (time.perf_counter() - self._record["time"]) * 1e3
+        self.frames.append(self._record)
+        self._record = None
+
+    def stats(self) -> dict:
+        """The statistics of the frames of the window.
+
+        Returns
+        -------
+        dict
+            The number of frames ``"frames"``, the frames per second between the first and the last paint ``"fps"``,
+            and for ``"cpu"`` and ``"gpu"``, the ``"mean"``, ``"min"`` and ``"max"`` times of every phase in milliseconds.
+            The CPU phases include the ``"total"`` time of the paints. The GPU phases only include
+            the frames whose queries are available, and their ``"total"`` is the sum of the phases of the complete frames.
+        """
+        frames = list(self.frames)
+        fps = 0.0
+        if len(frames) > 1 and frames[-1]["time"] > frames[0]["time"]:
+            fps = (len(frames) - 1) / (frames[-1]["time"] - frames[0]["time"])
+        samples: dict[str, dict[str, list[float]]] = {"cpu": {}, "gpu": {}}
+        for record in frames:
+            for phase, ms in record["cpu"].items():
+                samples["cpu"].setdefault(phase, []).append(ms)
+            for phase, ms in record["gpu"].items():
+                samples["gpu"].setdefault(phase, []).append(ms)
+            if record["gpu"] and len(record["gpu"]) == len(record["cpu"]) - 1:
+                samples["gpu"].setdefault("total", []).append(sum(record["gpu"].values()))
+        stats: dict = {"frames": len(frames), "fps": fps}
+        for clock, phases in samples.items():
+            stats[clock] = {phase: {"mean": sum(values) / len(values), "min": min(values), "max": max(values)} for phase, values in phases.items()}
+        return stats
@@ -0,0 +1,205 @@
+from typing import TYPE_CHECKING
+from typing import Optional
+
+from numpy import array
+from numpy import asarray
+from numpy import float64
+from numpy import identity
+from numpy import maximum
+from numpy.linalg import inv
+from numpy.linalg import norm
+from OpenGL import GL
+
+from compas_viewer.gl import glstate
+from compas_viewer.gl import make_index_buffer
+from compas_viewer.gl import make_vertex_buffer
+
+if TYPE_CHECKING:
+    from compas_viewer.scene import ViewerSceneObject
+
+    from .renderer import Renderer
+
+
+# The corners and the triangles of the unit cube.
+CUBE_POSITIONS = [0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1, 0, 0, 0, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1]
+CUBE_ELEMENTS = [0, 2, 1, 0, 3, 2, 4, 5, 6, 4, 6, 7, 0, 1, 5, 0, 5, 4, 1, 2, 6, 1, 6, 5, 2, 3, 7, 2, 7, 6, 3, 0, 4, 3, 4, 7]
+
+
+class OcclusionCuller:
+    """Skip the objects hidden behind others, with hardware occlusion queries on their bounding boxes.
+
+    Every frame, the candidate objects are sorted front to back and the objects which were found occluded
+    are not drawn. After the visible objects are drawn, the bounding boxes of the candidates are tested
+    against the depth buffer, without writing to it. The results are only read in a later frame,
+    when they are available, such that the CPU never waits for the GPU.
+
+    Parameters
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+
+    Attributes
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+    target : int | None
+        The query target, ``GL_ANY_SAMPLES_PASSED`` if supported, otherwise ``GL_SAMPLES_PASSED``.
+        None until the first queries are issued.
+
+    Notes
+    -----
+    Objects are only tested again when the scene or the camera has changed, so that a static view settles
+    without further frames. While results are pending, or when an occluded object is found visible again,
+    another frame is requested, so objects which come into view appear one or two frames late.
+    Objects containing the camera are always drawn.
+    The boxes are tested after the opaque objects are drawn and before the transparent ones,
+    such that objects behind transparent objects are not culled.
+    The culling is skipped in the "ghosted" render mode, where all objects are transparent.
+
+    See Also
+    --------
+    :attr:`compas_viewer.configurations.RendererConfig.occlusionculling`
+
+    References
+    ----------
+    * https://registry.khronos.org/OpenGL-Refpages/gl4/html/glBeginQuery.xhtml
+    * Bittner, J., Wimmer, M., Piringer, H. and Purgathofer, W. (2004). Coherent Hierarchical Culling: Hardware Occlusion Queries Made Useful.
+    """
+
+    # The relative and absolute growth of the tested boxes, which keeps them in front of the surfaces they enclose.
+    BOX_PADDING = (1e-3, 1e-6)
+
+    def __init__(self, renderer: "Renderer"):
+        self.renderer = renderer
+        self.scene = renderer.scene
+        self.target: Optional[int] = None
+        self._queries: dict["ViewerSceneObject", int] = {}
+        self._pending: dict["ViewerSceneObject", int] = {}
+        self._tested: dict["ViewerSceneObject", tuple] = {}
+        self._occluded: set["ViewerSceneObject"] = set()
+        self._candidates: list["ViewerSceneObject"] = []
+        self._key: Optional[tuple] = None
+        self._cube: Optional[dict] = None
+
+    def _init(self):
+        """Choose the query target and create the box buffers, in the OpenGL context of the renderer."""
+        context = self.renderer.context()
+        version = (context.format().majorVersion(), context.format().minorVersion())
+        if version >= (3, 3) or context.hasExtension(b"GL_ARB_occlusion_query2"):
+            self.target = GL.GL_ANY_SAMPLES_PASSED
+        else:
+            self.target = GL.GL_SAMPLES_PASSED
+        self._cube = {
+            "positions": make_vertex_buffer(CUBE_POSITIONS),
+            "elements": make_index_buffer(CUBE_ELEMENTS),
+            "n": len(CUBE_ELEMENTS),
+        }
+
+    def cull(self, objs: list["ViewerSceneObject"], viewworld: list[list[float]]) -> list["ViewerSceneObject"]:
+        """Collect the available query results and remove the occluded objects.
+
+        Parameters
+        ----------
+        objs : list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The candidate objects.
+        viewworld : list[list[float]]
+            The viewworld matrix.
+
+        Returns
+        -------
+        list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The objects which are not known to be occluded, sorted front to back.
+            The number of skipped objects is stored in ``frame_stats["occluded"]``.
+        """
+        repaint = False
+        for obj, query in list(self._pending.items()):
+            if not int(GL.glGetQueryObjectuiv(query, GL.GL_QUERY_RESULT_AVAILABLE)):
+                continue
+            del self._pending[obj]
+            if int(GL.glGetQueryObjectuiv(query, GL.GL_QUERY_RESULT)):
+                if obj in self._occluded:
+                    self._occluded.discard(obj)
+                    repaint = True
+            else:
+                self._occluded.add(obj)
+
+        # Forget the objects which are no longer candidates, they are tested again when they come back.
+        current = set(objs)
+        for obj in list(self._queries):
+            if obj not in current and obj not in self._pending:
+                GL.glDeleteQueries(1, [self._queries.pop(obj)])
+                self._tested.pop(obj, None)
+                self._occluded.discard(obj)
+
+        width = self.renderer.viewer.layout.config.window.width
+        height = self.renderer.viewer.layout.config.window.height
+        view = array(viewworld, dtype=float64)
+        self._key = (self.scene.version, tuple(view.flat), tuple(array(self.renderer.camera.projection(width, height)).flat))
+
+        eye = inv(view)[:3, 3]
+        boxed = [obj for obj in objs if obj.bounding_box is not None]
+        unboxed = [obj for obj in objs if obj.bounding_box is None]
+        if boxed:
+            boxes = asarray([obj.bounding_box for obj in boxed], dtype=float64)
+            distances = norm(maximum(maximum(boxes[:, 0] - eye, eye - boxes[:, 1]), 0), axis=1)
+            boxed = [boxed[i] for i in distances.argsort(kind="stable").tolist()]
+        self._candidates = boxed
+
+        drawn = [obj for obj in boxed if obj not in self._occluded] + unboxed
+        self.renderer.frame_stats["occluded"] = len(objs) - len(drawn)
+        if repaint or self._pending:
+            self.renderer.update()
+        return drawn
+
+    def query(self, shader):
+        """Test the bounding boxes of the candidates of this frame against the depth buffer.
+
+        Parameters
+        ----------
+        shader : :class:`compas_viewer.components.renderer.shaders.Shader`
+            The instance shader, with the projection and viewworld matrices set.
+
+        Notes
+        -----
+        This is called after the opaque objects are drawn. Objects already tested for the current
+        scene and camera, or with a result still pending, are not tested again.
+        """
+        if self._cube is None:
+            self._init()
+        candidates = [obj for obj in self._candidates if obj not in self._pending and self._tested.get(obj) != self._key]
+        if not candidates:
+            return
+
+        eye = inv(array(self.renderer.camera.viewworld(), dtype=float64))[:3, 3]
+        glstate.color_mask(False, False, False, False)
+        glstate.depth_mask(False)
+        glstate.disable(GL.GL_CULL_FACE)
+        glstate.depth_func(GL.GL_LEQUAL)
+        shader.enable_attribute("position")
+        shader.bind_attribute("position", self._cube["positions"])  # type: ignore
+        matrix = identity(4)
+        for obj in candidates:
+            lo, hi = asarray(obj.bounding_box, dtype=float64)  # type: ignore
+            pad = (hi - lo) * self.BOX_PADDING[0] + self.BOX_PADDING[1]
+            lo, hi = lo - pad, hi + pad
+            self._tested[obj] = self._key  # type: ignore
+            if (eye >= lo).all() and (eye <= hi).all():
+                self._occluded.discard(obj)
+                continue
+            if obj not in self._queries:
+                self._queries[obj] = int(GL.glGenQueries(1))
+            matrix[:3, :3] = 0
+            matrix[[0, 1, 2], [0, 1, 2]] = hi - lo
+            matrix[:3, 3] = lo
+            shader.uniform4x4("transform", matrix)
+            GL.glBeginQuery(self.target, self._queries[obj])
+            shader.draw_triangles(elements=self._cube["elements"], n=self._cube["n"])  # type: ignore
+            GL.glEndQuery(self.target)
+            self._pending[obj] = self._queries[obj]
+        shader.uniform4x4("transform", identity(4))
+        shader.disable_attribute("position")
+        glstate.depth_func(GL.GL_LESS)
+        glstate.enable(GL.GL_CULL_FACE)
+        glstate.depth_mask(True)
+        glstate.color_mask(True, True, True, True)
+        self.renderer.update()
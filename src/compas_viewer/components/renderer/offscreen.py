@@ -0,0 +1,251 @@
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Optional
+from typing import Union
+
+from numpy import float32
+from numpy import frombuffer
+from numpy import ndarray
+from numpy import uint8
+from OpenGL import GL
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QImage
+from PySide6.QtGui import QOffscreenSurface
+from PySide6.QtGui import QOpenGLContext
+from PySide6.QtGui import QSurfaceFormat
+from PySide6.QtOpenGL import QOpenGLFramebufferObject
+from PySide6.QtOpenGL import QOpenGLFramebufferObjectFormat
+
+if TYPE_CHECKING:
+    from compas_viewer.scene import ViewerSceneObject
+
+    from .renderer import Renderer
+
+
+class OffscreenRenderer:
+    """Render the scene of a viewer into an offscreen framebuffer, without a window.
+
+    The renderer gets its own OpenGL context, made current on a :class:`PySide6.QtGui.QOffscreenSurface`,
+    and draws into a framebuffer object of any resolution. The frames are read back as NumPy arrays,
+    or written to image files. The OpenGL canvas of the viewer is never shown,
+    and the renderer redirects its context and default framebuffer to the offscreen ones.
+
+    Parameters
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer of a viewer which is not shown, usually created with ``Viewer(headless=True)``.
+    samples : int, optional
+        The number of samples per pixel for multisample anti-aliasing. Default is 4.
+        With 0, the frames are drawn without anti-aliasing.
+
+    Attributes
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+    context : :PySide6:`PySide6/QtGui/QOpenGLContext`
+        The OpenGL context.
+    surface : :PySide6:`PySide6/QtGui/QOffscreenSurface`
+        The offscreen surface on which the context is made current.
+    samples : int
+        The number of samples per pixel.
+
+    Raises
+    ------
+    RuntimeError
+        If no OpenGL context can be created, for example if the Qt platform plugin has no OpenGL support.
+
+    Notes
+    -----
+    The context is OpenGL 2.1 with a compatibility profile, like the context of the canvas.
+    On Linux servers without a display, the Qt platform plugin has to provide OpenGL contexts,
+    for example the "offscreen" plugin in an X server such as ``xvfb-run``, or the "eglfs" plugin on a DRM device,
+    where Mesa's llvmpipe renders on the CPU if there is no GPU.
+    Objects added to the scene after the first frame are initialized before the next frame.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from compas.geometry import Box
+        from compas_viewer import Viewer
+
+        viewer = Viewer(headless=True)
+        viewer.scene.add(Box(1))
+        rgba = viewer.offscreen.render(1920, 1080)
+        viewer.offscreen.save("box.png", 1920, 1080)
+
+    See Also
+    --------
+    :class:`compas_viewer.Viewer`
+    """
+
+    def __init__(self, renderer: "Renderer", samples: int = 4):
+        self.renderer = renderer
+        self.samples = samples
+
+        surfaceformat = QSurfaceFormat()
+        surfaceformat.setVersion(2, 1)
+        surfaceformat.setProfile(QSurfaceFormat.OpenGLContextProfile.CompatibilityProfile)
+        self.context = QOpenGLContext()
+        self.context.setFormat(surfaceformat)
+        if not self.context.create():
+            raise RuntimeError("Creating an OpenGL context failed, the Qt platform plugin may not support OpenGL.")
+        self.surface = QOffscreenSurface()
+        self.surface.setFormat(self.context.format())
+        self.surface.create()
+
+        self._fbo: Optional[QOpenGLFramebufferObject] = None
+        self._resolve_fbo: Optional[QOpenGLFramebufferObject] = None
+        self._initialized: set["ViewerSceneObject"] = set()
+        self._started = False
+        self.renderer.offscreen = self
+
+    @property
+    def framebuffer(self) -> Optional[QOpenGLFramebufferObject]:
+        """The framebuffer drawn into, which is multisampled if :attr:`samples` is not 0."""
+        return self._fbo
+
+    def make_current(self):
+        """Make the OpenGL context current."""
+        if not self.context.makeCurrent(self.surface):
+            raise RuntimeError("Making the offscreen OpenGL context current failed.")
+
+    def done_current(self):
+        """Release the OpenGL context."""
+        self.context.doneCurrent()
+
+    def _framebuffers(self, width: int, height: int):
+        """Create the framebuffers, unless they have the size already."""
+        size = QSize(width, height)
+        if self._fbo is not None and self._fbo.size() == size:
+            return
+        fboformat = QOpenGLFramebufferObjectFormat()
+        fboformat.setAttachment(QOpenGLFramebufferObject.Attachment.CombinedDepthStencil)
+        fboformat.setSamples(self.samples)
+        self._fbo = QOpenGLFramebufferObject(size, fboformat)
+        if self.samples:
+            self._resolve_fbo = QOpenGLFramebufferObject(size, QOpenGLFramebufferObject.Attachment.CombinedDepthStencil)
+        else:
+            self._resolve_fbo = self._fbo
+
+    def paint(self, width: int, height: int):
+        """Paint a frame of the scene into the framebuffer, which is left bound.
+
+        Parameters
+        ----------
+        width : int
+            The width of the frame, in pixels.
+        height : int
+            The height of the frame, in pixels.
+
+        Notes
+        -----
+        At the first frame, the renderer and the objects of the scene are initialized, as for a shown canvas.
+        """
+        self.make_current()
+        self._framebuffers(width, height)
+        self._fbo.bind()  # type: ignore
+        GL.glViewport(0, 0, width, height)
+        if not self._started:
+            # The projection of the shaders is created from the size of the frame.
+            self.renderer.viewer.layout.config.window.width = width
+            self.renderer.viewer.layout.config.window.height = height
+            self.renderer.initializeGL()
+            self._started = True
+            self.renderer.viewer.started = True
+            self._initialized = set(self.renderer.scene.objects)
+        else:
+            objects = self.renderer.scene.objects
+            for obj in objects:
+                if obj not in self._initialized:
+                    obj.init()
+            self._initialized = set(objects)
+        self.renderer.resizeGL(width, height)
+        self.renderer.paintGL()
+
+        if self._resolve_fbo is not self._fbo:
+            buffers = GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT
+            QOpenGLFramebufferObject.blitFramebuffer(self._resolve_fbo, self._fbo, buffers, GL.GL_NEAREST)
+        self._resolve_fbo.bind()  # type: ignore
+
+    def render(self, width: int, height: int) -> ndarray:
+        """Render the scene and read the colors of the frame.
+
+        Parameters
+        ----------
+        width : int
+            The width of the frame, in pixels.
+        height : int
+            The height of the frame, in pixels.
+
+        Returns
+        -------
+        ndarray
+            The RGBA colors as integers between 0 and 255, as an array of shape (height, width, 4),
+            with the top row first.
+        """
+        self.paint(width, height)
+        GL.glPixelStorei(GL.GL_PACK_ALIGNMENT, 1)
+        data = GL.glReadPixels(0, 0, width, height, GL.GL_RGBA, GL.GL_UNSIGNED_BYTE)
+        self._resolve_fbo.release()  # type: ignore
+        return frombuffer(data, dtype=uint8).reshape(height, width, 4)[::-1]
+
+    def render_depth(self, width: int, height: int) -> ndarray:
+        """Render the scene and read the depths of the frame.
+
+        Parameters
+        ----------
+        width : int
+            The width of the frame, in pixels.
+        height : int
+            The height of the frame, in pixels.
+
+        Returns
+        -------
+        ndarray
+            The depths of the window coordinates, between 0 (near) and 1 (far, or background),
+            as an array of shape (height, width), with the top row first.
+        """
+        self.paint(width, height)
+        GL.glPixelStorei(GL.GL_PACK_ALIGNMENT, 1)
+        data = GL.glReadPixels(0, 0, width, height, GL.GL_DEPTH_COMPONENT, GL.GL_FLOAT)
+        self._resolve_fbo.release()  # type: ignore
+        return frombuffer(data, dtype=float32).reshape(height, width)[::-1]
+
+    def image(self, width: int, height: int) -> QImage:
+        """Render the scene into an image.
+
+        Parameters
+        ----------
+        width : int
+            The width of the image, in pixels.
+        height : int
+            The height of the image, in pixels.
+
+        Returns
+        -------
+        :PySide6:`PySide6/QtGui/QImage`
+            The image.
+        """
+        rgba = self.render(width, height).copy()
+        return QImage(rgba.data, width, height, 4 * width, QImage.Format.Format_RGBA8888).copy()
+
+    def save(self, path: Union[str, Path], width: int, height: int):
+        """Render the scene into an image file.
+
+        Parameters
+        ----------
+        path : str | :class:`pathlib.Path`
+            The path of the file. The format follows from the extension, such as ".png" or ".jpg".
+        width : int
+            The width of the image, in pixels.
+        height : int
+            The height of the image, in pixels.
+
+        Raises
+        ------
+        OSError
+            If the file cannot be written.
+        """
+        if not self.image(width, height).save(str(path)):
+            raise OSError(f"Writing the image {path} failed.")
@@ -0,0 +1,150 @@
+from typing import TYPE_CHECKING
+from typing import Optional
+
+from OpenGL import GL
+from PySide6.QtCore import QSize
+from PySide6.QtOpenGL import QOpenGLFramebufferObject
+
+from compas_viewer.gl import glstate
+from compas_viewer.gl import make_index_buffer
+from compas_viewer.gl import make_vertex_buffer
+
+if TYPE_CHECKING:
+    from compas_viewer.scene import ViewerSceneObject
+
+    from .renderer import Renderer
+
+
+# The corners and the triangles of a quad covering the viewport.
+QUAD_POSITIONS = [-1, -1, 0, 1, -1, 0, 1, 1, 0, -1, 1, 0]
+QUAD_ELEMENTS = [0, 1, 2, 0, 2, 3]
+
+
+class WeightedBlendedOIT:
+    """Draw transparent objects in any order, with weighted blended order-independent transparency.
+
+    The transparent objects are drawn into two floating point targets of an offscreen framebuffer,
+    which holds a copy of the depth of the opaque objects. The first target accumulates the premultiplied
+    colors, weighted by a function of the depth, and the product of the transparencies (the revealage).
+    The second target accumulates the weights. Both are added with the same blending factors,
+    the color channels with ``GL_ONE, GL_ONE`` and the alpha channel with ``GL_ZERO, GL_ONE_MINUS_SRC_ALPHA``,
+    such that one pass with multiple render targets suffices in OpenGL 2.1.
+    The weighted average color is then composited over the opaque objects with a quad covering the viewport.
+
+    Parameters
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+
+    Attributes
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+
+    Notes
+    -----
+    The result does not depend on the drawing order, so the objects are not sorted, and meshes which
+    intersect themselves or each other are blended consistently. The colors are an approximation,
+    with surfaces in front weighted more than those behind them.
+    This is used in the "oit" render mode.
+
+    See Also
+    --------
+    :attr:`compas_viewer.configurations.RendererConfig.rendermode`
+
+    References
+    ----------
+    * McGuire, M. and Bavoil, L. (2013). Weighted Blended Order-Independent Transparency. Journal of Computer Graphics Techniques, 2(2).
+    """
+
+    def __init__(self, renderer: "Renderer"):
+        self.renderer = renderer
+        self._fbo: Optional[QOpenGLFramebufferObject] = None
+        self._quad: Optional[dict] = None
+
+    def _framebuffer(self) -> QOpenGLFramebufferObject:
+        """The offscreen framebuffer with the two accumulation targets, of the size of the canvas."""
+        r = self.renderer.devicePixelRatio()
+        window = self.renderer.viewer.layout.config.window
+        size = QSize(int(window.width * r), int(window.height * r))
+        if self._fbo is None or self._fbo.size() != size:
+            self._fbo = QOpenGLFramebufferObject(size, QOpenGLFramebufferObject.Attachment.CombinedDepthStencil, GL.GL_TEXTURE_2D, GL.GL_RGBA16F)
+            self._fbo.addColorAttachment(size, GL.GL_RGBA16F)
+            for texture in self._fbo.textures():
+                GL.glBindTexture(GL.GL_TEXTURE_2D, texture)
+                GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MIN_FILTER, GL.GL_NEAREST)
+                GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MAG_FILTER, GL.GL_NEAREST)
+            GL.glBindTexture(GL.GL_TEXTURE_2D, 0)
+        if self._quad is None:
+            self._quad = {
+                "positions": make_vertex_buffer(QUAD_POSITIONS),
+                "elements": make_index_buffer(QUAD_ELEMENTS),
+                "n": len(QUAD_ELEMENTS),
+            }
+        return self._fbo
+
+    def draw(self, objs: list["ViewerSceneObject"], viewworld: list[list[float]]):
+        """Draw the transparent objects over the current frame.
+
+        Parameters
+        ----------
+        objs : list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The transparent objects, in any order.
+        viewworld : list[list[float]]
+            The viewworld matrix.
+
+        Notes
+        -----
+        This is called in :func:`compas_viewer.components.renderer.Renderer.paint`, after the opaque objects are drawn.
+        """
+        if not objs:
+            return
+        renderer = self.renderer
+        fbo = self._framebuffer()
+        width, height = fbo.width(), fbo.height()
+        default = renderer.defaultFramebufferObject()
+
+        # The depth of the opaque objects hides the transparent ones behind them.
+        GL.glBindFramebuffer(GL.GL_READ_FRAMEBUFFER, default)
+        GL.glBindFramebuffer(GL.GL_DRAW_FRAMEBUFFER, fbo.handle())
+        GL.glBlitFramebuffer(0, 0, width, height, 0, 0, width, height, GL.GL_DEPTH_BUFFER_BIT, GL.GL_NEAREST)
+        fbo.bind()
+
+        # The accumulated color starts at zero with a revealage of one, the accumulated weight at zero.
+        glstate.clear_color(0, 0, 0, 1)
+        GL.glDrawBuffer(GL.GL_COLOR_ATTACHMENT0)
+        GL.glClear(GL.GL_COLOR_BUFFER_BIT)
+        glstate.clear_color(0, 0, 0, 0)
+        GL.glDrawBuffer(GL.GL_COLOR_ATTACHMENT1)
+        GL.glClear(GL.GL_COLOR_BUFFER_BIT)
+        glstate.clear_color(*renderer.config.backgroundcolor.rgba)
+        GL.glDrawBuffers(2, [GL.GL_COLOR_ATTACHMENT0, GL.GL_COLOR_ATTACHMENT1])
+
+        glstate.depth_mask(False)
+        glstate.blend_func_separate(GL.GL_ONE, GL.GL_ONE, GL.GL_ZERO, GL.GL_ONE_MINUS_SRC_ALPHA)
+        shader = renderer.shader_oit
+        shader.bind()
+        shader.uniform4x4("viewworld", viewworld)
+        for obj in objs:
+            obj.draw(shader, False, False)
+        shader.release()
+        glstate.blend_func(GL.GL_SRC_ALPHA, GL.GL_ONE_MINUS_SRC_ALPHA)
+        glstate.depth_mask(True)
+        GL.glDrawBuffer(GL.GL_COLOR_ATTACHMENT0)
+        GL.glBindFramebuffer(GL.GL_FRAMEBUFFER, default)
+
+        # The weighted average color over the opaque objects.
+        accumulation, weights = fbo.textures()[:2]
+        shader = renderer.shader_composite
+        shader.bind()
+        shader.uniformText("accumulation", accumulation, 0)
+        shader.uniformText("weights", weights, 1)
+        shader.enable_attribute("position")
+        shader.bind_attribute("position", self._quad["positions"])  # type: ignore
+        shader.draw_triangles(elements=self._quad["elements"], n=self._quad["n"], background=True)  # type: ignore
+        shader.disable_attribute("position")
+        shader.release()
+        GL.glActiveTexture(GL.GL_TEXTURE1)
+        GL.glBindTexture(GL.GL_TEXTURE_2D, 0)
+        GL.glActiveTexture(GL.GL_TEXTURE0)
+        GL.glBindTexture(GL.GL_TEXTURE_2D, 0)
@@ -0,0 +1,97 @@
+import time
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QLabel
+
+from compas_viewer.gl import glcounters
+
+if TYPE_CHECKING:
+    from .renderer import Renderer
+
+
+class PerformanceOverlay(QLabel):
+    """Show the performance counters of the renderer over the top left corner of the canvas.
+
+    The overlay lists the CPU and GPU time of the frames, the frames per second, the draw calls,
+    the triangles, lines and points drawn, the drawn, culled and occluded objects, the memory
+    of the buffers and the uploads waiting for the next draw.
+
+    Parameters
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+
+    Attributes
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+
+    Notes
+    -----
+    The overlay is a child widget of the renderer, composed over the canvas by Qt, so it does not change
+    the OpenGL state of the frames. The draw calls are only counted while the overlay is shown,
+    see :class:`compas_viewer.gl.GLCounters`, and its text is refreshed at most every :attr:`REFRESH_INTERVAL` seconds.
+
+    See Also
+    --------
+    :attr:`compas_viewer.configurations.RendererConfig.show_overlay`
+    :func:`compas_viewer.components.renderer.Renderer.stats`
+    """
+
+    # The minimum time between two refreshes of the text, in seconds.
+    REFRESH_INTERVAL = 0.25
+
+    def __init__(self, renderer: "Renderer"):
+        super().__init__(renderer)
+        self.renderer = renderer
+        self._last = 0.0
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setTextFormat(Qt.TextFormat.PlainText)
+        self.setStyleSheet("background-color: rgba(0, 0, 0, 160); color: white; font-family: monospace; padding: 6px;")
+        self.move(8, 8)
+        self.hide()
+
+    def setVisible(self, visible: bool):
+        """Show or hide the overlay, and start or stop counting the draw calls.
+
+        Parameters
+        ----------
+        visible : bool
+            Whether the overlay is shown.
+        """
+        super().setVisible(visible)
+        glcounters.enabled = visible
+        self._last = 0.0
+        self.renderer.update()
+
+    def refresh(self):
+        """Update the text from the counters of the last frame, unless it was updated recently."""
+        now = time.perf_counter()
+        if self.isHidden() or now - self._last < self.REFRESH_INTERVAL:
+            return
+        self._last = now
+
+        stats = self.renderer.stats()
+        frame = self.renderer.frame_stats
+        cpu = stats["cpu"].get("total")
+        gpu = stats["gpu"].get("total")
+        frametime = f"{cpu['mean']:.2f} ms cpu" if cpu else "-"
+        if gpu:
+            frametime += f", {gpu['mean']:.2f} ms gpu"
+        drawn = frame["objects"] - frame["culled"] - frame["occluded"]
+        _, _, mesh_objs = self.renderer.renderlists.lists()
+        pending = sum(obj.pending_uploads() for obj in mesh_objs)
+        lines = [
+            f"frame     {frametime}",
+            f"fps       {stats['fps']:.0f}",
+            f"draws     {frame['draw_calls']:,}",
+            f"triangles {frame['triangles']:,}",
+            f"lines     {frame['lines']:,}",
+            f"points    {frame['points']:,}",
+            f"objects   {drawn:,} of {frame['objects']:,}, {frame['culled']:,} culled, {frame['occluded']:,} occluded",
+            f"buffers   {glcounters.buffer_bytes / 2**20:.1f} MB in {glcounters.buffers:,}",
+            f"uploads   {pending:,} pending",
+        ]
+        self.setText("\n".join(lines))
+        self.adjustSize()
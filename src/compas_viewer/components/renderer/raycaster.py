@@ -0,0 +1,287 @@
+from math import inf
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Literal
+from typing import Optional
+
+from numpy import abs
+from numpy import array
+from numpy import asarray
+from numpy import errstate
+from numpy import float64
+from numpy import fmax
+from numpy import fmin
+from numpy import maximum
+from numpy import where
+from numpy.linalg import inv
+from numpy.linalg import norm
+
+from compas.geometry import Point
+from compas.geometry import transform_points_numpy
+from compas_viewer.spatial import ray_segments
+from compas_viewer.spatial import raycast_triangles
+
+if TYPE_CHECKING:
+    from compas_viewer.scene import ViewerSceneObject
+
+    from .renderer import Renderer
+
+
+def _farthest(lo, hi, origin) -> float:
+    """The largest distance from a point to the corners of a box."""
+    return float(norm(maximum(abs(asarray(lo) - origin), abs(asarray(hi) - origin))))
+
+
+def _slab(lo, hi, origin, inverse) -> tuple[float, float]:
+    """The ray parameters at which a ray enters and exits a box, given the inverse of its direction."""
+    with errstate(invalid="ignore"):
+        t1 = (asarray(lo, dtype=float64) - origin) * inverse
+        t2 = (asarray(hi, dtype=float64) - origin) * inverse
+        return max(float(fmax.reduce(fmin(t1, t2))), 0.0), float(fmin.reduce(fmax(t1, t2)))
+
+
+class PickResult:
+    """The object and element hit by a picking ray.
+
+    Parameters
+    ----------
+    obj : :class:`compas_viewer.scene.ViewerSceneObject`
+        The object which is hit.
+    kind : Literal["point", "line", "face"] | None
+        The kind of primitive which is hit, or None for objects without primitives, which are hit at their bounds.
+    index : int
+        The index of the primitive in the point, line or frontface data of the object, -1 if there is none.
+    point : :class:`compas.geometry.Point`
+        The hit point in world coordinates. For points and lines, it is the closest point on the primitive.
+    distance : float
+        The distance from the near plane to the hit along the ray.
+
+    Attributes
+    ----------
+    key : Any
+        The vertex, edge or face key of the hit element for objects that record them, such as meshes,
+        otherwise the index of the primitive.
+
+    See Also
+    --------
+    :func:`compas_viewer.scene.ViewerSceneObject.element_key`
+    """
+
+    def __init__(
+        self,
+        obj: "ViewerSceneObject",
+        kind: Optional[Literal["point", "line", "face"]],
+        index: int,
+        point: Point,
+        distance: float,
+    ):
+        self.obj = obj
+        self.kind = kind
+        self.index = index
+        self.point = point
+        self.distance = distance
+
+    def __repr__(self):
+        return f"PickResult({self.obj.name}, kind={self.kind}, key={self.key}, point={self.point}, distance={self.distance:.6g})"
+
+    @property
+    def key(self) -> Any:
+        if self.kind is None:
+            return None
+        return self.obj.element_key(self.kind, self.index)
+
+
+class RayCaster:
+    """Pick objects and their elements by casting a ray from the camera through the cursor.
+
+    This is an alternative to the instance map of the :class:`compas_viewer.components.renderer.Selector`,
+    which does not repaint the scene nor read back from the GPU.
+    The candidate objects are found through the bounding volume hierarchy of the scene,
+    nearest first. In every candidate, the ray is transformed to local coordinates and tested against
+    hierarchies over the triangles, lines and points of the object, which are built on first use.
+
+    Parameters
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+
+    Attributes
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+    PIXEL_TOLERANCE : float
+        The distance in pixels within which lines and points are hit.
+
+    Notes
+    -----
+    Triangles are hit from both sides. Lines and points are hit when they are within ``PIXEL_TOLERANCE``
+    pixels of the ray on screen, and take precedence over faces at the same depth, as they are drawn on top.
+    Objects without primitives, such as streamed point clouds, are hit at their bounding boxes.
+
+    See Also
+    --------
+    :func:`compas_viewer.scene.ViewerSceneObject.pick_primitives`
+    :func:`compas_viewer.scene.ViewerScene.query_ray`
+
+    Examples
+    --------
+    .. code-block:: python
+
+        result = viewer.renderer.raycaster.pick(x, y)
+        if result:
+            print(result.obj, result.kind, result.key, result.point)
+    """
+
+    PIXEL_TOLERANCE = 4.0
+
+    def __init__(self, renderer: "Renderer"):
+        self.renderer = renderer
+        self.scene = renderer.scene
+
+    def ray(self, x: float, y: float) -> tuple[Any, Any, float, float]:
+        """Compute the ray from the camera through a point on the screen.
+
+        Parameters
+        ----------
+        x, y : float
+            The screen coordinates of the point.
+
+        Returns
+        -------
+        tuple[ndarray, ndarray, float, float]
+            The start point of the ray on the near plane and its unit direction, in world coordinates.
+            And the tolerance and its increase per unit of length along the ray,
+            which make the distance covered by ``PIXEL_TOLERANCE`` pixels on screen.
+        """
+        width = self.renderer.viewer.layout.config.window.width
+        height = self.renderer.viewer.layout.config.window.height
+        camera = self.renderer.camera
+        view = array(camera.viewworld())
+        inverse = inv(array(camera.projection(width, height)) @ view)
+        ndc_x, ndc_y = 2 * x / width - 1, 1 - 2 * y / height
+        near = inverse @ [ndc_x, ndc_y, -1, 1]
+        far = inverse @ [ndc_x, ndc_y, 1, 1]
+        origin = near[:3] / near[3]
+        direction = far[:3] / far[3] - origin
+        direction /= norm(direction)
+
+        scale = self.PIXEL_TOLERANCE / camera.pixelscale(width, height)
+        if self.renderer.viewmode == "perspective":
+            eye = inv(view)[:3, 3]
+            return origin, direction, scale * float(norm(origin - eye)), scale
+        return origin, direction, scale, 0.0
+
+    def pick(self, x: float, y: float) -> Optional[PickResult]:
+        """Pick the nearest object and element under a point on the screen.
+
+        Parameters
+        ----------
+        x, y : float
+            The screen coordinates of the point.
+
+        Returns
+        -------
+        :class:`compas_viewer.components.renderer.raycaster.PickResult` | None
+        """
+        return self.cast(*self.ray(x, y))
+
+    def cast(self, origin, direction, tolerance: float = 0.0, slope: float = 0.0) -> Optional[PickResult]:
+        """Find the nearest selectable object and element hit by a ray.
+
+        Parameters
+        ----------
+        origin : array-like
+            The start point of the ray in world coordinates.
+        direction : array-like
+            The unit direction of the ray in world coordinates.
+        tolerance : float, optional
+            The distance within which lines and points are hit, at the start of the ray.
+        slope : float, optional
+            The increase of that distance per unit of length along the ray, for perspective views.
+
+        Returns
+        -------
+        :class:`compas_viewer.components.renderer.raycaster.PickResult` | None
+        """
+        origin = asarray(origin, dtype=float64)
+        direction = asarray(direction, dtype=float64)
+        bvh = self.scene.bvh
+        if not len(bvh):
+            return None
+
+        pad = tolerance + slope * _farthest(bvh.lo[0], bvh.hi[0], origin)
+
+        best: Optional[PickResult] = None
+        depth = inf
+        with errstate(divide="ignore"):
+            inverse = 1.0 / direction
+        for obj in self.scene.query_ray(origin, direction, pad=pad):
+            if obj.is_locked or not obj.is_visible or obj.instance_color.rgb255 not in self.scene.instance_colors:
+                continue
+            lo, hi = obj.bounding_box  # type: ignore
+            entry, _ = _slab(lo - pad, hi + pad, origin, inverse)
+            if entry > depth:
+                # The objects are sorted by their entry, so none of the remaining can be nearer.
+                break
+            hit = self._cast_object(obj, origin, direction, inverse, tolerance, slope, depth)
+            if hit is not None and hit[0] < depth:
+                depth, best = hit
+        return best
+
+    def _cast_object(
+        self,
+        obj: "ViewerSceneObject",
+        origin,
+        direction,
+        inverse_direction,
+        tolerance: float,
+        slope: float,
+        depth: float,
+    ) -> Optional[tuple[float, PickResult]]:
+        """Intersect a ray with the primitives of one object, returning the depth of the hit and the result."""
+        matrix = array(obj.worldtransformation.matrix, dtype=float64)
+        inverse = inv(matrix)
+        local_origin = inverse[:3, :3] @ origin + inverse[:3, 3]
+        # The direction is not normalized, such that the ray parameters are the same in world and local coordinates.
+        local_direction = inverse[:3, :3] @ direction
+        best = None
+
+        faces = obj.pick_primitives("face") if obj.show_faces else None
+        if faces is not None:
+            triangles, bvh = faces
+            index, t = raycast_triangles(bvh, triangles, local_origin, local_direction, tmax=depth)
+            if index >= 0:
+                depth = t
+                best = (t, PickResult(obj, "face", index, Point(*(origin + t * direction)), t))
+
+        lo, hi = obj.bounding_box  # type: ignore
+        farthest = _farthest(lo, hi, origin)
+        # The largest length in local coordinates of a unit length in world coordinates.
+        local_scale = float(norm(inverse[:3, :3], 2))
+
+        for kind, show in (("line", obj.show_lines), ("point", obj.show_points)):
+            primitives = obj.pick_primitives(kind) if show else None  # type: ignore
+            if primitives is None:
+                continue
+            segments, bvh = primitives
+            pad = tolerance + slope * min(farthest, depth)
+            items, _ = bvh.query_ray(local_origin, local_direction, tmax=depth + pad, pad=pad * local_scale)
+            if not len(items):
+                continue
+            t, s = ray_segments(local_origin, local_direction, segments[items])
+            a = segments[items, 0]
+            closest = transform_points_numpy(a + s[:, None] * (segments[items, 1] - a), matrix)
+            distances = norm(origin + t[:, None] * direction - closest, axis=1)
+            allowed = tolerance + slope * t
+            # Lines and points are drawn on top of the faces they lie on, so they are compared by the front of their tolerance.
+            depths = where(distances <= allowed, maximum(t - allowed, 0), inf)
+            i = int(depths.argmin())
+            if depths[i] < depth:
+                depth = float(depths[i])
+                best = (depth, PickResult(obj, kind, int(items[i]), Point(*closest[i]), float(t[i])))  # type: ignore
+
+        if best is None and obj.positions_array() is None:
+            entry, exit = _slab(lo, hi, origin, inverse_direction)
+            if entry <= exit and entry < depth:
+                best = (entry, PickResult(obj, None, -1, Point(*(origin + entry * direction)), entry))
+        return best
@@ -0,0 +1,256 @@
+import ctypes as ct
+import shlex
+import subprocess
+import time
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Callable
+from typing import Optional
+from typing import Union
+
+from numpy import empty
+from numpy import ndarray
+from numpy import uint8
+from OpenGL import GL
+from OpenGL.raw.GL.VERSION.GL_1_0 import glReadPixels
+from PySide6.QtGui import QImage
+
+from compas_viewer.gl import delete_buffers
+from compas_viewer.gl import make_pixel_buffer
+
+if TYPE_CHECKING:
+    from .renderer import Renderer
+
+
+class FrameRecorder:
+    """Record the frames of an animation into image files, or pipe them to a video encoder.
+
+    The animation is advanced by a fixed timestep, independent of the wall clock: every frame, the step
+    of the animation is called once, and the scene is painted and read back. The frames are recorded
+    as fast as they can be painted, and every frame of the animation is recorded, however long it takes.
+    The pixels are read back asynchronously through two pixel buffer objects: the pixels of a frame are copied
+    into one buffer while the next frame is painted, and they are mapped when the copy of the other buffer starts.
+    The frames are flipped, encoded and written by a pool of threads.
+
+    Parameters
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+    writers : int, optional
+        The number of threads which encode and write the image files. Default is 4.
+
+    Attributes
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+    writers : int
+        The number of writer threads.
+    frame : int
+        The number of the frame being recorded.
+    fps : float
+        The frames per second of the recording.
+
+    Notes
+    -----
+    A headless viewer renders the frames at the given size into its offscreen framebuffer.
+    A shown viewer renders them into the framebuffer of the canvas, at its size in device pixels,
+    and the canvas is repainted when the recording ends.
+    The time of a frame is :attr:`time`, the frame number divided by the frames per second,
+    such that animations which depend on the frame number, or on this time, are recorded deterministically.
+    At most two frames per writer thread wait for their encoding, after which the recording waits for the writers.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from compas.geometry import Box
+        from compas_viewer import Viewer
+
+        viewer = Viewer(headless=True)
+        box = viewer.scene.add(Box(1))
+
+
+        @viewer.on(interval=40)
+        def rotate(frame):
+            box.rotation = [0, 0, frame * 0.05]
+            box.update()
+
+
+        viewer.recorder.record(250, path="frames/frame.{frame:04d}.png", width=1920, height=1080)
+        viewer.recorder.record(250, command="ffmpeg -y -f rawvideo -pix_fmt rgba -s {width}x{height} -r {fps} -i - movie.mp4")
+
+    See Also
+    --------
+    :func:`compas_viewer.Viewer.on`
+    :class:`compas_viewer.components.renderer.OffscreenRenderer`
+    """
+
+    def __init__(self, renderer: "Renderer", writers: int = 4):
+        self.renderer = renderer
+        self.writers = writers
+        self.frame = 0
+        self.fps = 25.0
+
+    @property
+    def time(self) -> float:
+        """The time of the frame being recorded in the animation, in seconds."""
+        return self.frame / self.fps
+
+    def _size(self, width: Optional[int], height: Optional[int]) -> tuple[int, int]:
+        if self.renderer.offscreen is not None:
+            window = self.renderer.viewer.layout.config.window
+            return width or window.width, height or window.height
+        ratio = self.renderer.devicePixelRatio()
+        return int(self.renderer.width() * ratio), int(self.renderer.height() * ratio)
+
+    def _paint(self, width: int, height: int):
+        """Paint a frame, leaving its framebuffer bound and the context current."""
+        if self.renderer.offscreen is not None:
+            self.renderer.offscreen.paint(width, height)
+        else:
+            self.renderer.makeCurrent()
+            GL.glBindFramebuffer(GL.GL_FRAMEBUFFER, self.renderer.defaultFramebufferObject())
+            self.renderer.paintGL()
+
+    def record(
+        self,
+        frames: int,
+        path: Optional[Union[str, Path]] = None,
+        command: Optional[Union[str, list[str]]] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        fps: Optional[float] = None,
+        step: Optional[Callable] = None,
+    ) -> dict:
+        """Record a number of frames of the animation.
+
+        Parameters
+        ----------
+        frames : int
+            The number of frames.
+        path : str | :class:`pathlib.Path`, optional
+            The pattern of the paths of the image files, formatted with the number of the frame as ``frame``,
+            such as "frames/frame.{frame:04d}.png". The format follows from the extension. Missing folders are created.
+        command : str | list[str], optional
+            The command of an encoder, which reads the frames as raw RGBA pixels, with the top row first,
+            from its standard input. The arguments are formatted with ``width``, ``height`` and ``fps``.
+        width : int, optional
+            The width of the frames of a headless viewer, in pixels. Default is the width of the window in the config.
+        height : int, optional
+            The height of the frames of a headless viewer, in pixels. Default is the height of the window in the config.
+        fps : float, optional
+            The frames per second. Default follows from the interval of the animation of :func:`compas_viewer.Viewer.on`,
+            or is 25 without one.
+        step : Callable, optional
+            Called without arguments before every frame, to advance the animation.
+            Default is the step of the animation of :func:`compas_viewer.Viewer.on`, whose timer is stopped,
+            and which continues from its current frame, :attr:`compas_viewer.Viewer.frame_count`.
+
+        Returns
+        -------
+        dict
+            The number of frames ``"frames"``, the time of the recording ``"seconds"``,
+            and the frames recorded per second ``"fps"``.
+
+        Raises
+        ------
+        ValueError
+            If neither or both of a path and a command are given.
+        RuntimeError
+            If the viewer is neither headless nor shown, or if the encoder fails.
+        OSError
+            If an image file cannot be written.
+        """
+        if (path is None) == (command is None):
+            raise ValueError("Must specify either a path or a command.")
+        viewer = self.renderer.viewer
+        if self.renderer.offscreen is None and not viewer.started:
+            raise RuntimeError("The frames of a viewer are recorded when it is shown, or when it is headless.")
+        if step is None:
+            step = viewer.animation
+            if step is not None:
+                viewer.timer.stop()
+        self.fps = fps or (1000 / viewer.animation_interval if viewer.animation_interval else 25.0)
+        width, height = self._size(width, height)
+
+        encoder = None
+        if command is not None:
+            if isinstance(command, str):
+                command = shlex.split(command)
+            command = [arg.format(width=width, height=height, fps=self.fps) for arg in command]
+            encoder = subprocess.Popen(command, stdin=subprocess.PIPE)
+            # The raw frames have to arrive in order.
+            workers = 1
+        else:
+            workers = self.writers
+        pool = ThreadPoolExecutor(max_workers=workers)
+
+        def write(pixels: ndarray, frame: int):
+            pixels = pixels[::-1]
+            if encoder is not None:
+                encoder.stdin.write(pixels.tobytes())  # type: ignore
+            else:
+                filepath = Path(str(path).format(frame=frame))
+                filepath.parent.mkdir(parents=True, exist_ok=True)
+                data = pixels.tobytes()
+                image = QImage(data, width, height, 4 * width, QImage.Format.Format_RGBA8888)
+                if not image.save(str(filepath)):
+                    raise OSError(f"Writing the image {filepath} failed.")
+
+        size = width * height * 4
+        writes: deque[Future] = deque()
+
+        def collect(pbo: int, frame: int):
+            """Map a pixel buffer whose copy was started a frame ago, and hand its pixels to the writers."""
+            pixels = empty((height, width, 4), dtype=uint8)
+            GL.glBindBuffer(GL.GL_PIXEL_PACK_BUFFER, pbo)
+            pointer = GL.glMapBuffer(GL.GL_PIXEL_PACK_BUFFER, GL.GL_READ_ONLY)
+            if pointer:
+                ct.memmove(pixels.ctypes.data, pointer, size)
+            GL.glUnmapBuffer(GL.GL_PIXEL_PACK_BUFFER)
+            GL.glBindBuffer(GL.GL_PIXEL_PACK_BUFFER, 0)
+            while len(writes) >= 2 * workers:
+                writes.popleft().result()
+            writes.append(pool.submit(write, pixels, frame))
+
+        start = time.perf_counter()
+        if self.renderer.offscreen is not None:
+            self.renderer.offscreen.make_current()
+        else:
+            self.renderer.makeCurrent()
+        pbos = [make_pixel_buffer(size), make_pixel_buffer(size)]
+        try:
+            for frame in range(frames):
+                self.frame = frame
+                if step is not None:
+                    step()
+                self._paint(width, height)
+                GL.glPixelStorei(GL.GL_PACK_ALIGNMENT, 1)
+                GL.glBindBuffer(GL.GL_PIXEL_PACK_BUFFER, pbos[frame % 2])
+                glReadPixels(0, 0, width, height, GL.GL_RGBA, GL.GL_UNSIGNED_BYTE, ct.c_void_p(0))
+                GL.glBindBuffer(GL.GL_PIXEL_PACK_BUFFER, 0)
+                if frame:
+                    collect(pbos[(frame - 1) % 2], frame - 1)
+            if frames:
+                collect(pbos[(frames - 1) % 2], frames - 1)
+            for future in writes:
+                future.result()
+        finally:
+            delete_buffers(pbos)
+            pool.shutdown(wait=True)
+            if encoder is not None:
+                with suppress(BrokenPipeError):
+                    encoder.stdin.close()  # type: ignore
+                encoder.wait()
+            if self.renderer.offscreen is None:
+                self.renderer.doneCurrent()
+                self.renderer.update()
+        if encoder is not None and encoder.returncode:
+            raise RuntimeError(f"The encoder {command[0]} failed with exit code {encoder.returncode}.")  # type: ignore
+
+        seconds = time.perf_counter() - start
+        return {"frames": frames, "seconds": seconds, "fps": frames / seconds if seconds else 0.0}
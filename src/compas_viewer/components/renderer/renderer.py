@@ -1,8 +1,11 @@
 import time
-from functools import lru_cache
+import warnings
 from typing import TYPE_CHECKING
+from typing import Optional
 
+from numpy import array
 from numpy import float32
+from numpy import float64
 from numpy import identity
 from OpenGL import GL
 from PySide6 import QtCore
@@ -12,13 +15,21 @@ from PySide6.QtGui import QWheelEvent
 from PySide6.QtOpenGLWidgets import QOpenGLWidget
 
 from compas.geometry import Frame
-from compas.geometry import transform_points_numpy
 from compas_viewer.configurations import RendererConfig
-from compas_viewer.scene import TagObject
-from compas_viewer.scene.collectionobject import CollectionObject
-from compas_viewer.scene.vectorobject import VectorObject
+from compas_viewer.gl import glcounters
+from compas_viewer.gl import glstate
+from compas_viewer.spatial import frustum_planes
 
 from .camera import Camera
+from .elementpicker import ElementPicker
+from .framescheduler import FrameScheduler
+from .frametimer import FrameTimer
+from .occlusion import OcclusionCuller
+from .oit import WeightedBlendedOIT
+from .overlay import PerformanceOverlay
+from .raycaster import RayCaster
+from .renderlists import RenderLists
+from .renderqueue import RenderQueue
 from .selector import Selector
 from .shaders import Shader
 
@@ -27,6 +38,11 @@ if TYPE_CHECKING:
     from compas_viewer import Viewer
     from compas_viewer.scene.gridobject import GridObject
     from compas_viewer.scene.meshobject import MeshObject
+    from compas_viewer.scene.sceneobject import ViewerSceneObject
+    from compas_viewer.scene.tagobject import TagObject
+    from compas_viewer.scene.vectorobject import VectorObject
+
+    from .offscreen import OffscreenRenderer
 
 
 class Renderer(QOpenGLWidget):
@@ -52,18 +68,48 @@ class Renderer(QOpenGLWidget):
 
         self._viewmode = self.config.viewmode
         self._rendermode = self.config.rendermode
-        self._opacity = self.config.ghostopacity if self.rendermode == "ghosted" else 1.0
+        self._opacity = self.config.ghostopacity if self.rendermode in ("ghosted", "oit") else 1.0
 
         self._frames = 0
         self._now = time.time()
 
+        #  Statistics of the last frame
+        self.frame_stats = {
+            "objects": 0,
+            "culled": 0,
+            "occluded": 0,
+            "state_changes": 0,
+            "state_skipped": 0,
+            "draw_calls": 0,
+            "triangles": 0,
+            "lines": 0,
+            "points": 0,
+        }
+
         self.shader_model: Shader
+        self.shader_oit: Shader
+        self.shader_composite: Shader
         self.shader_tag: Shader
         self.shader_arrow: Shader
         self.shader_instance: Shader
+        self.shader_element: Shader
         self.shader_grid: Shader
 
+        #  Objects which upload their data over several frames, such as streamed point clouds
+        self.uploads: dict["ViewerSceneObject", None] = {}
+
+        self.renderlists = RenderLists(self)
+        self.scheduler = FrameScheduler(self)
+        self.frametimer = FrameTimer(self)
+        self.overlay = PerformanceOverlay(self)
+        self.offscreen: Optional["OffscreenRenderer"] = None
+        self.overlay.setVisible(self.config.show_overlay)
         self.camera = Camera(self)
+        self.raycaster = RayCaster(self)
+        self.elementpicker = ElementPicker(self)
+        self.occlusion = OcclusionCuller(self)
+        self.renderqueue = RenderQueue(self)
+        self.oit = WeightedBlendedOIT(self)
         self.selector = Selector(self)
         self.grid: "GridObject"
 
@@ -85,14 +131,15 @@ class Renderer(QOpenGLWidget):
     def rendermode(self, rendermode):
         self._rendermode = rendermode
         self.config.rendermode = rendermode
-        if rendermode == "ghosted":
+        if rendermode in ("ghosted", "oit"):
             self._opacity = self.config.ghostopacity
         else:
             self._opacity = 1.0
         if self.shader_model:
-            self.shader_model.bind()
-            self.shader_model.uniform1f("opacity", self._opacity)
-            self.shader_model.release()
+            for shader in (self.shader_model, self.shader_oit):
+                shader.bind()
+                shader.uniform1f("opacity", self._opacity)
+                shader.release()
             self.update()
 
     @property
@@ -145,6 +192,50 @@ class Renderer(QOpenGLWidget):
         """
         GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)  # type: ignore
 
+    def context(self):
+        """
+        The OpenGL context of the renderer.
+
+        Returns
+        -------
+        :PySide6:`PySide6/QtGui/QOpenGLContext`
+            The context of the canvas, or of the offscreen renderer if there is one.
+        """
+        if self.offscreen is not None:
+            return self.offscreen.context
+        return super().context()
+
+    def defaultFramebufferObject(self) -> int:
+        """
+        The framebuffer which the frames are drawn into.
+
+        Returns
+        -------
+        int
+            The framebuffer of the canvas, or of the offscreen renderer if there is one.
+        """
+        if self.offscreen is not None and self.offscreen.framebuffer is not None:
+            return self.offscreen.framebuffer.handle()
+        return super().defaultFramebufferObject()
+
+    def makeCurrent(self):
+        """
+        Make the OpenGL context of the renderer current.
+        """
+        if self.offscreen is not None:
+            self.offscreen.make_current()
+        else:
+            super().makeCurrent()
+
+    def doneCurrent(self):
+        """
+        Release the OpenGL context of the renderer.
+        """
+        if self.offscreen is not None:
+            self.offscreen.done_current()
+        else:
+            super().doneCurrent()
+
     def initializeGL(self):
         """
         Initialize the OpenGL canvas.
@@ -160,18 +251,19 @@ class Renderer(QOpenGLWidget):
         * https://doc.qt.io/qtforpython-6/PySide6/QtOpenGL/QOpenGLWindow.html#PySide6.QtOpenGL.PySide6.QtOpenGL.QOpenGLWindow.initializeGL
 
         """
-        GL.glClearColor(*self.config.backgroundcolor.rgba)
-        GL.glPolygonOffset(1.0, 1.0)
-        GL.glEnable(GL.GL_POLYGON_OFFSET_FILL)
-        GL.glEnable(GL.GL_CULL_FACE)
+        glstate.invalidate()
+        glstate.clear_color(*self.config.backgroundcolor.rgba)
+        glstate.polygon_offset(1.0, 1.0)
+        glstate.enable(GL.GL_POLYGON_OFFSET_FILL)
+        glstate.enable(GL.GL_CULL_FACE)
         GL.glCullFace(GL.GL_BACK)
-        GL.glEnable(GL.GL_DEPTH_TEST)
-        GL.glDepthFunc(GL.GL_LESS)
-        GL.glEnable(GL.GL_BLEND)
-        GL.glBlendFunc(GL.GL_SRC_ALPHA, GL.GL_ONE_MINUS_SRC_ALPHA)
-        GL.glEnable(GL.GL_POINT_SMOOTH)
-        GL.glEnable(GL.GL_LINE_SMOOTH)
-        GL.glEnable(GL.GL_FRAMEBUFFER_SRGB)
+        glstate.enable(GL.GL_DEPTH_TEST)
+        glstate.depth_func(GL.GL_LESS)
+        glstate.enable(GL.GL_BLEND)
+        glstate.blend_func(GL.GL_SRC_ALPHA, GL.GL_ONE_MINUS_SRC_ALPHA)
+        glstate.enable(GL.GL_POINT_SMOOTH)
+        glstate.enable(GL.GL_LINE_SMOOTH)
+        glstate.enable(GL.GL_FRAMEBUFFER_SRGB)
         self.init()
 
     def resizeGL(self, w: int, h: int):
@@ -212,27 +304,117 @@ class Renderer(QOpenGLWidget):
         This implements the virtual function of the OpenGL widget.
         This method also paints the instance map used by the selector to identify selected objects.
         The instance map is immediately cleared again, after which the real scene objects are drawn.
+        The frame scheduler is told that the frame is painted, and the state tracker
+        :data:`compas_viewer.gl.glstate` is invalidated first. The numbers of issued and skipped
+        state changes of the frame are stored in ``frame_stats``, and while the performance overlay
+        is shown, the draw calls and primitives counted by :data:`compas_viewer.gl.glcounters`.
+        About once per second, the frames per second and the mean frame time are shown in the status bar.
 
         References
         ----------
         * https://doc.qt.io/qtforpython-6/PySide6/QtOpenGL/QOpenGLWindow.html#PySide6.QtOpenGL.PySide6.QtOpenGL.QOpenGLWindow.paintGL
 
         """
+        self.scheduler.painted()
+        glstate.invalidate()
+        glcounters.reset()
         self.clear()
         if is_instance or self.rendermode == "instance":
             self.paint_instance()
         else:
             self.paint()
+        self.frame_stats["state_changes"] = glstate.issued
+        self.frame_stats["state_skipped"] = glstate.skipped
+        if glcounters.enabled:
+            self.frame_stats["draw_calls"] = glcounters.draw_calls
+            self.frame_stats["triangles"] = glcounters.triangles
+            self.frame_stats["lines"] = glcounters.lines
+            self.frame_stats["points"] = glcounters.points
+            self.overlay.refresh()
 
         self._frames += 1
-        if time.time() - self._now > 1:
-            self._now = time.time()
-            # self.viewer.layout.fps(self._frames)
+        now = time.time()
+        if now - self._now > 1:
+            # After a pause without paints, the counting starts again.
+            if now - self._now < 2 and self.offscreen is None and self.viewer.layout.config.statusbar.show_fps:
+                frametime = self.frametimer.stats()["cpu"].get("total")
+                self.viewer.layout.statusbar.fps(self._frames / (now - self._now), frametime["mean"] if frametime else None)
+            self._now = now
             self._frames = 0
 
+    def stats(self) -> dict:
+        """
+        The timing statistics of the last frames.
+
+        Returns
+        -------
+        dict
+            The number of frames ``"frames"``, the frames per second ``"fps"``, and for ``"cpu"`` and ``"gpu"``,
+            the ``"mean"``, ``"min"`` and ``"max"`` times of every phase of :func:`paint` in milliseconds.
+            The phases are "projection", "categorization", "culling", "sorting", "opaque", "transparent",
+            "occlusion", "vectors", "tags" and "overlay", and the "total" time of the frames.
+
+        Notes
+        -----
+        The statistics cover the frames of the rolling window of the frame timer. The GPU times are read
+        asynchronously from timer queries, so the last frames are missing from them, and they are empty
+        if the OpenGL context does not support timer queries or if ``RendererConfig.gputiming`` is off.
+        Phases which are skipped, such as the occlusion queries when occlusion culling is off, are not listed.
+
+        See Also
+        --------
+        :class:`compas_viewer.components.renderer.FrameTimer`
+
+        Examples
+        --------
+        >>> stats = viewer.renderer.stats()  # doctest: +SKIP
+        >>> stats["cpu"]["opaque"]["mean"]  # doctest: +SKIP
+        1.8
+        """
+        return self.frametimer.stats()
+
+    def update(self):
+        """
+        Request a repaint of the canvas.
+
+        Notes
+        -----
+        The requests are coalesced by the :class:`compas_viewer.components.renderer.FrameScheduler`,
+        into at most one paint per refresh of the screen, and none while the renderer is hidden.
+
+        See Also
+        --------
+        :func:`compas_viewer.components.renderer.FrameScheduler.request`
+        """
+        self.scheduler.request()
+
     # ==========================================================================
     # Event
     # ==========================================================================
+    def showEvent(self, event):
+        """
+        Resume the frame scheduler when the renderer is shown, or its window is restored.
+
+        Parameters
+        ----------
+        event : :PySide6:`PySide6/QtGui/QShowEvent`
+            The Qt event.
+        """
+        super().showEvent(event)
+        self.scheduler.resume()
+
+    def hideEvent(self, event):
+        """
+        Pause the frame scheduler when the renderer is hidden, or its window is minimized.
+
+        Parameters
+        ----------
+        event : :PySide6:`PySide6/QtGui/QHideEvent`
+            The Qt event.
+        """
+        super().hideEvent(event)
+        self.scheduler.pause()
+
     def event(self, event):
         """
         Event handler for the renderer. Customised to capture multi-touch gestures.
@@ -268,8 +450,11 @@ class Renderer(QOpenGLWidget):
 
         """
         if self.isActiveWindow() and self.underMouse():
+            viewworld = array(self.camera.viewworld()).tobytes()
             self.viewer.controller.mouse_move_action(self, event)
-            self.update()
+            # Hovering without moving the camera or dragging a selection box leaves the frame unchanged.
+            if self.selector.on_drag_selection or array(self.camera.viewworld()).tobytes() != viewworld:
+                self.update()
 
     def mousePressEvent(self, event: QMouseEvent):
         """
@@ -433,6 +618,18 @@ class Renderer(QOpenGLWidget):
         self.shader_model.uniform3f("selection_color", self.config.selector.selectioncolor.rgb)
         self.shader_model.release()
 
+        self.shader_oit = Shader(name="oit")
+        self.shader_oit.bind()
+        self.shader_oit.uniform4x4("projection", projection)
+        self.shader_oit.uniform4x4("viewworld", viewworld)
+        self.shader_oit.uniform4x4("transform", transform)
+        self.shader_oit.uniform1i("is_selected", 0)
+        self.shader_oit.uniform1f("opacity", self.opacity)
+        self.shader_oit.uniform3f("selection_color", self.config.selector.selectioncolor.rgb)
+        self.shader_oit.release()
+
+        self.shader_composite = Shader(name="composite")
+
         self.shader_tag = Shader(name="tag")
         self.shader_tag.bind()
         self.shader_tag.uniform4x4("projection", projection)
@@ -457,6 +654,13 @@ class Renderer(QOpenGLWidget):
         self.shader_instance.uniform4x4("transform", transform)
         self.shader_instance.release()
 
+        self.shader_element = Shader(name="element")
+        self.shader_element.bind()
+        self.shader_element.uniform4x4("projection", projection)
+        self.shader_element.uniform4x4("viewworld", viewworld)
+        self.shader_element.uniform4x4("transform", transform)
+        self.shader_element.release()
+
         self.shader_grid = Shader(name="grid")
         self.shader_grid.bind()
         self.shader_grid.uniform4x4("projection", projection)
@@ -483,6 +687,10 @@ class Renderer(QOpenGLWidget):
         self.shader_model.uniform4x4("projection", projection)
         self.shader_model.release()
 
+        self.shader_oit.bind()
+        self.shader_oit.uniform4x4("projection", projection)
+        self.shader_oit.release()
+
         self.shader_tag.bind()
         self.shader_tag.uniform4x4("projection", projection)
         self.shader_tag.release()
@@ -496,6 +704,10 @@ class Renderer(QOpenGLWidget):
         self.shader_instance.uniform4x4("projection", projection)
         self.shader_instance.release()
 
+        self.shader_element.bind()
+        self.shader_element.uniform4x4("projection", projection)
+        self.shader_element.release()
+
         self.shader_grid.bind()
         self.shader_grid.uniform4x4("projection", projection)
         self.shader_grid.release()
@@ -516,6 +728,9 @@ class Renderer(QOpenGLWidget):
     def sort_objects_from_viewworld(self, objects: list["MeshObject"], viewworld: list[list[float]]):
         """Sort objects by the distances from their bounding box centers to camera location
 
+        .. deprecated::
+            Use :func:`compas_viewer.components.renderer.RenderQueue.sort_transparent` instead.
+
         Parameters
         ----------
         objects : list[:class:`compas_viewer.scene.meshobject.MeshObject`]
@@ -527,62 +742,82 @@ class Renderer(QOpenGLWidget):
         -------
         list
             A list of sorted objects.
-        """
-        opaque_objects = []
-        transparent_objects = []
-        centers = []
-
-        for obj in objects:
-            if obj.opacity * self.opacity < 1 and obj.bounding_box_center is not None:
-                transparent_objects.append(obj)
-                centers.append(transform_points_numpy([obj.bounding_box_center], obj.worldtransformation)[0])
-            else:
-                opaque_objects.append(obj)
-        if transparent_objects:
-            centers = transform_points_numpy(centers, viewworld)
-            transparent_objects = sorted(zip(transparent_objects, centers), key=lambda pair: pair[1][2])
-            transparent_objects, _ = zip(*transparent_objects)
-        return opaque_objects + list(transparent_objects)
-
-    @lru_cache(maxsize=3)
+
+        Notes
+        -----
+        The opaque objects keep their order and are followed by the transparent objects, back to front.
+        """
+        warnings.warn("Renderer.sort_objects_from_viewworld is deprecated, use RenderQueue.sort_transparent instead.", DeprecationWarning, stacklevel=2)
+        opaque = [obj for obj in objects if obj.opacity * self.opacity >= 1 or obj.bounding_box_center is None]
+        transparent = [obj for obj in objects if obj.opacity * self.opacity < 1 and obj.bounding_box_center is not None]
+        if transparent:
+            view = array(viewworld, dtype=float64)
+            # The bounding box centers are already in world space.
+            centers = array([obj.bounding_box_center for obj in transparent], dtype=float64)
+            depths = centers @ view[2, :3] + view[2, 3]
+            transparent = [transparent[i] for i in depths.argsort(kind="stable").tolist()]
+        return opaque + transparent
+
     def sort_objects_from_category(self, objs: tuple["MeshObject"]) -> tuple[list["TagObject"], list["VectorObject"], list["MeshObject"]]:
         """Sort objects by their categories
 
+        .. deprecated::
+            Use :func:`compas_viewer.components.renderer.RenderLists.lists` instead,
+            which keeps the categories of the objects of the scene.
+
         Returns
         -------
         tuple(list[:class:`compas_viewer.scene.tagobject.TagObject`],
         list[:class:`compas_viewer.scene.vectorobject.VectorObject`],
         list[:class:`compas_viewer.scene.sceneobject.MeshObject`])
             A tuple of sorted objects.
+        """
+        warnings.warn("Renderer.sort_objects_from_category is deprecated, use RenderLists.lists instead.", DeprecationWarning, stacklevel=2)
+        lists: dict[str, list] = {"tag": [], "vector": [], "mesh": []}
+        for obj in objs:
+            for category, item in RenderLists.categorize(obj):
+                lists[category].append(item)
+        return lists["tag"], lists["vector"], lists["mesh"]
+
+    def cull_objects(self, objs: list["MeshObject"], viewworld: list[list[float]]) -> list["MeshObject"]:
+        """Remove the objects whose world-space bounding boxes are outside the view frustum.
+
+        Parameters
+        ----------
+        objs : list[:class:`compas_viewer.scene.meshobject.MeshObject`]
+            The objects to be culled.
+        viewworld : list[list[float]]
+            The viewworld matrix.
+
+        Returns
+        -------
+        list[:class:`compas_viewer.scene.meshobject.MeshObject`]
+            The objects which are (partly) inside the view frustum, or have no bounding box yet.
 
         Notes
         -----
-        This function is cached to improve the performance.
+        The boxes of all objects are tested at once, from the bounds table of the scene.
+        The number of culled objects is stored in ``frame_stats["culled"]``.
 
-        References
-        ----------
-        * https://docs.python.org/3/library/functools.html#functools.lru_cache
-        * https://en.wikipedia.org/wiki/Cache_replacement_policies#Least_recently_used_(LRU)
+        See Also
+        --------
+        :func:`compas_viewer.scene.ViewerScene.cull`
         """
-        tag_objs = []
-        vector_objs = []
-        mesh_objs = []
-
-        def sort(obj):
-            if isinstance(obj, TagObject):
-                tag_objs.append(obj)
-            elif isinstance(obj, VectorObject):
-                vector_objs.append(obj)
-            else:
-                mesh_objs.append(obj)
+        projection = self.camera.projection(self.viewer.layout.config.window.width, self.viewer.layout.config.window.height)
+        visible = self.scene.cull(frustum_planes(array(projection) @ array(viewworld)))
+        drawn = [obj for obj in objs if obj._bounds_index is None or visible[obj._bounds_index]]
+        self.frame_stats["culled"] = len(objs) - len(drawn)
+        return drawn
 
-        for obj in objs:
-            if isinstance(obj, CollectionObject):
-                [sort(item) for item in obj.objects]
-            else:
-                sort(obj)
+    def upload(self):
+        """Upload the data of the objects which are loading, whether they are drawn in this frame or not.
 
-        return tag_objs, vector_objs, mesh_objs
+        See Also
+        --------
+        :func:`compas_viewer.scene.StreamingPointcloudObject.upload`
+        """
+        for obj in list(self.uploads):
+            obj.upload()
 
     def paint(self):
         """
@@ -597,25 +832,59 @@ class Renderer(QOpenGLWidget):
         :func:`compas_viewer.components.render.Render.paint_instance`
         """
 
+        self.frametimer.begin()
+
         #  Matrix update
         viewworld = self.camera.viewworld()
         self.update_projection()
+        self.frametimer.lap("projection")
         # Object categorization
-        tag_objs, vector_objs, mesh_objs = self.sort_objects_from_category((obj for obj in self.scene.objects if obj.is_visible))
-
-        # Draw model objects in the scene
+        tag_objs, vector_objs, mesh_objs = self.renderlists.lists()
+        self.frametimer.lap("categorization")
+        # Before culling, such that objects outside the view or hidden still finish loading
+        self.upload()
+        self.frametimer.lap("upload")
+        self.frame_stats["objects"] = len(mesh_objs)
+        self.frame_stats["culled"] = 0
+        self.frame_stats["occluded"] = 0
+        drawn_objs = mesh_objs
+        if self.config.frustumculling:
+            drawn_objs = self.cull_objects(drawn_objs, viewworld)
+        occlusionculling = self.config.occlusionculling and self.rendermode not in ("ghosted", "oit")
+        if occlusionculling:
+            drawn_objs = self.occlusion.cull(drawn_objs, viewworld)
+        self.frametimer.lap("culling")
+
+        # Draw the opaque objects in the scene, sorted by state
         self.shader_model.bind()
         self.shader_model.uniform4x4("viewworld", viewworld)
-        for obj in self.sort_objects_from_viewworld(mesh_objs, viewworld):
-            obj.draw(self.shader_model, self.rendermode == "wireframe", self.rendermode == "lighted")
+        self.renderqueue.draw_opaque(self.shader_model, mesh_objs, drawn_objs, viewworld)
         self.shader_model.release()
 
+        # Test the bounding boxes against the depth of the opaque objects, for the next frames
+        if occlusionculling:
+            self.shader_instance.bind()
+            self.shader_instance.uniform4x4("viewworld", viewworld)
+            self.occlusion.query(self.shader_instance)
+            self.shader_instance.release()
+            self.frametimer.lap("occlusion")
+
+        # Draw the transparent objects back to front, or blend them without sorting them
+        if self.rendermode == "oit":
+            self.oit.draw(self.renderqueue.transparent_objects(drawn_objs), viewworld)
+            self.frametimer.lap("transparent")
+        else:
+            self.shader_model.bind()
+            self.renderqueue.draw_transparent(self.shader_model, drawn_objs, viewworld)
+            self.shader_model.release()
+
         # Draw vector arrows
         self.shader_arrow.bind()
         self.shader_arrow.uniform4x4("viewworld", viewworld)
         for obj in vector_objs:
             obj.draw(self.shader_arrow)
         self.shader_arrow.release()
+        self.frametimer.lap("vectors")
 
         # Draw text tag sprites
         self.shader_tag.bind()
@@ -623,6 +892,7 @@ class Renderer(QOpenGLWidget):
         for obj in tag_objs:
             obj.draw(self.shader_tag, self.camera.position)
         self.shader_tag.release()
+        self.frametimer.lap("tags")
 
         # draw 2D box for multi-selection
         if self.selector.on_drag_selection and self.selector.enable_selector:
@@ -636,6 +906,8 @@ class Renderer(QOpenGLWidget):
                 self.viewer.layout.config.window.width,
                 self.viewer.layout.config.window.height,
             )
+        self.frametimer.lap("overlay")
+        self.frametimer.end()
 
     def paint_instance(self):
         """
@@ -653,10 +925,10 @@ class Renderer(QOpenGLWidget):
         viewworld = self.camera.viewworld()
         self.update_projection()
         # Object categorization
-        _, _, mesh_objs = self.sort_objects_from_category(tuple(self.scene.objects))
+        _, _, mesh_objs = self.renderlists.lists(visible=False)
         # Draw instance maps
-        GL.glDisable(GL.GL_POINT_SMOOTH)
-        GL.glDisable(GL.GL_LINE_SMOOTH)
+        glstate.disable(GL.GL_POINT_SMOOTH)
+        glstate.disable(GL.GL_LINE_SMOOTH)
 
         self.shader_instance.bind()
         self.shader_instance.uniform4x4("viewworld", viewworld)
@@ -664,5 +936,5 @@ class Renderer(QOpenGLWidget):
             obj.draw_instance(self.shader_instance, self.rendermode == "wireframe")
         self.shader_instance.release()
 
-        GL.glEnable(GL.GL_POINT_SMOOTH)
-        GL.glEnable(GL.GL_LINE_SMOOTH)
+        glstate.enable(GL.GL_POINT_SMOOTH)
+        glstate.enable(GL.GL_LINE_SMOOTH)
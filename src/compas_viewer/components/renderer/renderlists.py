@@ -0,0 +1,144 @@
+from typing import TYPE_CHECKING
+from typing import Literal
+
+from compas_viewer.scene import TagObject
+from compas_viewer.scene.collectionobject import CollectionObject
+from compas_viewer.scene.vectorobject import VectorObject
+
+if TYPE_CHECKING:
+    from compas_viewer.scene import ViewerSceneObject
+
+    from .renderer import Renderer
+
+
+RenderCategory = Literal["tag", "vector", "mesh"]
+
+
+class RenderLists:
+    """The tag, vector and mesh objects drawn by the renderer, kept up to date by the events of the scene.
+
+    The scene reports the objects which are added and removed, and the objects report changes of their visibility.
+    The lists are only rebuilt after such a change, so getting them in a frame in which nothing changed
+    does not depend on the number of objects.
+
+    Parameters
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+
+    Attributes
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+    version : int
+        The number of changes of the lists.
+
+    Notes
+    -----
+    The items of collections are listed in place of the collections, by their own category.
+
+    See Also
+    --------
+    :class:`compas_viewer.components.renderer.RenderQueue`
+    """
+
+    def __init__(self, renderer: "Renderer"):
+        self.renderer = renderer
+        self.version = 0
+        self._items: dict["ViewerSceneObject", list[tuple[RenderCategory, "ViewerSceneObject"]]] = {}
+        self._visible: dict["ViewerSceneObject", None] = {}
+        self._lists: dict[bool, tuple[list, list, list]] = {}
+
+    @staticmethod
+    def categorize(obj: "ViewerSceneObject") -> list[tuple[RenderCategory, "ViewerSceneObject"]]:
+        """The render categories of an object, or of the items of a collection.
+
+        Parameters
+        ----------
+        obj : :class:`compas_viewer.scene.ViewerSceneObject`
+            The object.
+
+        Returns
+        -------
+        list[tuple[Literal["tag", "vector", "mesh"], :class:`compas_viewer.scene.ViewerSceneObject`]]
+            The categories and the objects drawn.
+        """
+        items = obj.objects if isinstance(obj, CollectionObject) else [obj]
+        categories = []
+        for item in items:
+            if isinstance(item, TagObject):
+                categories.append(("tag", item))
+            elif isinstance(item, VectorObject):
+                categories.append(("vector", item))
+            else:
+                categories.append(("mesh", item))
+        return categories
+
+    def add(self, obj: "ViewerSceneObject"):
+        """Add an object which is added to the scene.
+
+        Parameters
+        ----------
+        obj : :class:`compas_viewer.scene.ViewerSceneObject`
+            The object.
+        """
+        self._items[obj] = self.categorize(obj)
+        if obj.is_visible:
+            self._visible[obj] = None
+        self._changed()
+
+    def remove(self, obj: "ViewerSceneObject"):
+        """Remove an object which is removed from the scene.
+
+        Parameters
+        ----------
+        obj : :class:`compas_viewer.scene.ViewerSceneObject`
+            The object.
+        """
+        if self._items.pop(obj, None) is not None:
+            self._visible.pop(obj, None)
+            self._changed()
+
+    def set_visible(self, obj: "ViewerSceneObject", visible: bool):
+        """Show or hide an object of the lists.
+
+        Parameters
+        ----------
+        obj : :class:`compas_viewer.scene.ViewerSceneObject`
+            The object. Objects which are not in the scene are ignored.
+        visible : bool
+            Whether the object is visible.
+        """
+        if obj not in self._items or (obj in self._visible) == visible:
+            return
+        if visible:
+            # The visible objects keep the order of the scene.
+            self._visible = {item: None for item in self._items if item is obj or item in self._visible}
+        else:
+            del self._visible[obj]
+        self._changed()
+
+    def _changed(self):
+        self._lists = {}
+        self.version += 1
+
+    def lists(self, visible: bool = True) -> tuple[list["TagObject"], list["VectorObject"], list["ViewerSceneObject"]]:
+        """The tag, vector and mesh objects.
+
+        Parameters
+        ----------
+        visible : bool, optional
+            Whether to only list the visible objects. Default is True.
+
+        Returns
+        -------
+        tuple[list[:class:`compas_viewer.scene.TagObject`], list[:class:`compas_viewer.scene.VectorObject`], list[:class:`compas_viewer.scene.ViewerSceneObject`]]
+            The lists, which are the same list objects until the next change.
+        """
+        if visible not in self._lists:
+            lists = {"tag": [], "vector": [], "mesh": []}
+            for obj in self._visible if visible else self._items:
+                for category, item in self._items[obj]:
+                    lists[category].append(item)
+            self._lists[visible] = (lists["tag"], lists["vector"], lists["mesh"])
+        return self._lists[visible]
@@ -0,0 +1,333 @@
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Literal
+from typing import Optional
+
+from numpy import array
+from numpy import float64
+from numpy import inf
+from numpy import int64
+from numpy import isnan
+from numpy import lexsort
+from numpy import ndarray
+from numpy import nonzero
+from numpy import zeros
+
+from compas_viewer.scene.sceneobject import ViewerSceneObject
+
+if TYPE_CHECKING:
+    from .renderer import Renderer
+    from .shaders import Shader
+
+
+class DrawItem:
+    """One draw call of a scene object, with the state it needs.
+
+    Parameters
+    ----------
+    obj : :class:`compas_viewer.scene.ViewerSceneObject`
+        The object drawn.
+    kind : Literal["frontface", "backface", "line", "point"]
+        The kind of primitives drawn.
+    buffer : dict[str, Any]
+        The buffers of the primitives.
+
+    Attributes
+    ----------
+    key : tuple
+        The state of the draw call: background objects first,
+        then faces, lines and points, then the line width or point size.
+    """
+
+    # The order of the kinds of primitives, and their element types in the model shader.
+    KINDS = {"frontface": (0, 2), "backface": (1, 2), "line": (2, 1), "point": (3, 0)}
+
+    def __init__(self, obj: ViewerSceneObject, kind: Literal["frontface", "backface", "line", "point"], buffer: dict[str, Any]):
+        self.obj = obj
+        self.kind = kind
+        self.buffer = buffer
+        size = obj.lineswidth if kind == "line" else obj.pointssize if kind == "point" else 0
+        self.key = (not obj.background, self.KINDS[kind][0], size)
+
+    def __repr__(self):
+        return f"DrawItem({self.obj.name}, {self.kind})"
+
+
+class RenderQueue:
+    """The draw calls of the opaque objects, sorted by state and then front to back.
+
+    The draw items are collected from the visible objects once and kept until the version of the scene,
+    the render mode or the opacity of the view changes. Every frame, the items of the objects left after
+    culling are sorted by their state key and, within the same state, by the distance of their objects
+    to the camera, nearest first, which lets the depth test reject the hidden fragments early.
+    The order is kept as long as the camera and the culled objects do not change.
+
+    Parameters
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+
+    Attributes
+    ----------
+    renderer : :class:`compas_viewer.components.renderer.Renderer`
+        The renderer instance.
+    items : list[:class:`DrawItem`]
+        The draw items of the opaque objects.
+    custom : list[:class:`compas_viewer.scene.ViewerSceneObject`]
+        The opaque objects which draw themselves, such as objects with a level-of-detail chain.
+    transparent : list[:class:`compas_viewer.scene.ViewerSceneObject`]
+        The objects with an opacity below one, drawn back to front after the opaque ones.
+        Their world-space centers are kept in one array, and their order is kept as long as
+        the camera and the culled objects do not change.
+
+    Notes
+    -----
+    Setting the display settings of an object, such as its opacity, line width, point size,
+    the visibility of its points, lines and faces, or whether it is drawn on the background,
+    increments the version of the scene, such that the draw items are collected again.
+    The selection is read at every draw.
+
+    See Also
+    --------
+    :class:`compas_viewer.components.renderer.RenderLists`
+    """
+
+    def __init__(self, renderer: "Renderer"):
+        self.renderer = renderer
+        self.scene = renderer.scene
+        self.items: list[DrawItem] = []
+        self.custom: list[ViewerSceneObject] = []
+        self.transparent: list[ViewerSceneObject] = []
+        self._key: Optional[tuple] = None
+        self._index: dict[ViewerSceneObject, int] = {}
+        self._centers = zeros((0, 3))
+        self._unboxed = zeros(0, dtype=bool)
+        self._objects = zeros(0, dtype=int64)
+        self._groups = zeros(0, dtype=int64)
+        self._order_key: Optional[tuple] = None
+        self._order = zeros(0, dtype=int64)
+        self._transparent_index: dict[ViewerSceneObject, int] = {}
+        self._transparent_centers = zeros((0, 3))
+        self._transparent_key: Optional[tuple] = None
+        self._transparent_order: list[ViewerSceneObject] = []
+
+    def build(self, objs: list[ViewerSceneObject]):
+        """Collect the draw items of the objects.
+
+        Parameters
+        ----------
+        objs : list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The visible objects of the scene, before culling.
+        """
+        wireframe = self.renderer.rendermode == "wireframe"
+        self.items = []
+        self.custom = []
+        self.transparent = []
+        opaque = []
+        for obj in objs:
+            if obj.opacity * self.renderer.opacity < 1 and obj.bounding_box_center is not None:
+                self.transparent.append(obj)
+            elif obj.lod or type(obj).draw is not ViewerSceneObject.draw:
+                self.custom.append(obj)
+            else:
+                opaque.append(obj)
+
+        self._transparent_index = {obj: i for i, obj in enumerate(self.transparent)}
+        self._transparent_centers = self.scene.bounds_centers(self.transparent)
+        self._transparent_key = None
+
+        self._index = {obj: i for i, obj in enumerate(opaque)}
+        self._centers = self.scene.bounds_centers(opaque)
+        self._unboxed = isnan(self._centers[:, 0])
+        self._centers[self._unboxed] = 0
+        objects = []
+        for i, obj in enumerate(opaque):
+            buffers = []
+            if not wireframe and obj.show_faces:
+                buffers += [("frontface", obj._frontfaces_buffer), ("backface", obj._backfaces_buffer)]
+            if obj.show_lines:
+                buffers.append(("line", obj._lines_buffer))
+            if obj.show_points:
+                buffers.append(("point", obj._points_buffer))
+            for kind, buffer in buffers:
+                if buffer is not None:
+                    self.items.append(DrawItem(obj, kind, buffer))  # type: ignore
+                    objects.append(i)
+
+        keys = sorted(set(item.key for item in self.items))
+        groups = {key: i for i, key in enumerate(keys)}
+        self._objects = array(objects, dtype=int64)
+        self._groups = array([groups[item.key] for item in self.items], dtype=int64)
+        self._order_key = None
+
+    def order(self, objs: list[ViewerSceneObject], viewworld: list[list[float]]) -> list[int]:
+        """The indices of the items of the objects to be drawn, in drawing order.
+
+        Parameters
+        ----------
+        objs : list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The objects left after culling.
+        viewworld : list[list[float]]
+            The viewworld matrix.
+
+        Returns
+        -------
+        list[int]
+            The indices of the items.
+        """
+        view = array(viewworld, dtype=float64)
+        key = (view.tobytes(), tuple(objs))
+        if key != self._order_key:
+            drawn = self._drawn(self._index, objs)
+            # The view direction is -z, so the nearest objects have the largest z.
+            depths = self._centers @ view[2, :3] + view[2, 3]
+            depths[self._unboxed] = -inf
+            selected = nonzero(drawn[self._objects])[0]
+            self._order = selected[lexsort((-depths[self._objects[selected]], self._groups[selected]))]
+            self._order_key = key
+        return self._order.tolist()
+
+    def sort_transparent(self, objs: list[ViewerSceneObject], viewworld: list[list[float]]) -> list[ViewerSceneObject]:
+        """The transparent objects to be drawn, sorted back to front.
+
+        Parameters
+        ----------
+        objs : list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The objects left after culling.
+        viewworld : list[list[float]]
+            The viewworld matrix.
+
+        Returns
+        -------
+        list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The transparent objects among ``objs``, the farthest first.
+
+        Notes
+        -----
+        The depths of all centers are computed with one product with the viewworld matrix
+        and sorted with ``argsort``. Nothing is computed if the camera and the objects are the same as in the last call.
+        """
+        view = array(viewworld, dtype=float64)
+        key = (view.tobytes(), tuple(objs))
+        if key != self._transparent_key:
+            drawn = self._drawn(self._transparent_index, objs)
+            depths = self._transparent_centers @ view[2, :3] + view[2, 3]
+            selected = nonzero(drawn)[0]
+            order = selected[depths[selected].argsort(kind="stable")]
+            self._transparent_order = [self.transparent[i] for i in order.tolist()]
+            self._transparent_key = key
+        return self._transparent_order
+
+    def _drawn(self, index: dict[ViewerSceneObject, int], objs: list[ViewerSceneObject]) -> ndarray:
+        drawn = zeros(len(index), dtype=bool)
+        for obj in objs:
+            i = index.get(obj)
+            if i is not None:
+                drawn[i] = True
+        return drawn
+
+    def transparent_objects(self, objs: list[ViewerSceneObject]) -> list[ViewerSceneObject]:
+        """The transparent objects to be drawn, in any order.
+
+        Parameters
+        ----------
+        objs : list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The objects left after culling.
+
+        Returns
+        -------
+        list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The transparent objects among ``objs``.
+        """
+        drawn = self._drawn(self._transparent_index, objs)
+        return [self.transparent[i] for i in nonzero(drawn)[0].tolist()]
+
+    def draw_opaque(
+        self,
+        shader: "Shader",
+        candidates: list[ViewerSceneObject],
+        objs: list[ViewerSceneObject],
+        viewworld: list[list[float]],
+    ):
+        """Draw the opaque objects with the model shader, sorted by state and then front to back.
+
+        Parameters
+        ----------
+        shader : :class:`compas_viewer.components.renderer.shaders.Shader`
+            The model shader, bound, with the projection and viewworld matrices set.
+        candidates : list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The visible objects of the scene, from which the items are built.
+        objs : list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The objects left after culling.
+        viewworld : list[list[float]]
+            The viewworld matrix.
+
+        Notes
+        -----
+        The building and sorting of the items and the drawing of the opaque objects
+        are timed as the "sorting" and "opaque" phases of the frame timer of the renderer.
+        """
+        renderer = self.renderer
+        key = (self.scene.version, renderer.rendermode, renderer.opacity)
+        if key != self._key:
+            self.build(candidates)
+            self._key = key
+
+        order = self.order(objs, viewworld)
+        renderer.frametimer.lap("sorting")
+
+        is_lighted = renderer.rendermode == "lighted"
+        shader.enable_attribute("position")
+        shader.enable_attribute("color")
+        for i in order:
+            item = self.items[i]
+            obj = item.obj
+            buffer = item.buffer
+            shader.uniform4x4("transform", obj.transform_buffer)
+            shader.uniform1i("is_selected", obj.is_selected)
+            shader.uniform1f("object_opacity", obj.opacity)
+            shader.uniform1i("is_lighted", is_lighted and item.kind in ("frontface", "backface"))
+            shader.uniform1i("element_type", DrawItem.KINDS[item.kind][1])
+            shader.bind_attribute("position", buffer["positions"])
+            shader.bind_attribute("color", buffer["colors"], step=4)
+            if item.kind == "line":
+                shader.draw_lines(width=obj.lineswidth, elements=buffer["elements"], n=buffer["n"], background=obj.background)
+            elif item.kind == "point":
+                shader.draw_points(size=obj.pointssize, elements=buffer["elements"], n=buffer["n"], background=obj.background)
+            else:
+                shader.draw_triangles(elements=buffer["elements"], n=buffer["n"], background=obj.background)
+
+        drawn = set(objs)
+        for obj in self.custom:
+            if obj in drawn:
+                obj.draw(shader, renderer.rendermode == "wireframe", is_lighted)
+        shader.disable_attribute("position")
+        shader.disable_attribute("color")
+        renderer.frametimer.lap("opaque")
+
+    def draw_transparent(self, shader: "Shader", objs: list[ViewerSceneObject], viewworld: list[list[float]]):
+        """Draw the transparent objects with the model shader, back to front.
+
+        Parameters
+        ----------
+        shader : :class:`compas_viewer.components.renderer.shaders.Shader`
+            The model shader, bound, with the projection and viewworld matrices set.
+        objs : list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The objects left after culling.
+        viewworld : list[list[float]]
+            The viewworld matrix.
+
+        Notes
+        -----
+        This is drawn after :meth:`draw_opaque`, from the items built by it.
+        The sorting and the drawing are timed as the "transparent" phase of the frame timer of the renderer.
+        """
+        renderer = self.renderer
+        is_lighted = renderer.rendermode == "lighted"
+        shader.enable_attribute("position")
+        shader.enable_attribute("color")
+        for obj in self.sort_transparent(objs, viewworld):
+            obj.draw(shader, renderer.rendermode == "wireframe", is_lighted)
+        shader.disable_attribute("position")
+        shader.disable_attribute("color")
+        renderer.frametimer.lap("transparent")
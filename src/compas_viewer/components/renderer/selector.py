@@ -1,17 +1,27 @@
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import Optional
 
-from numpy import all
-from numpy import any
 from numpy import array
+from numpy import column_stack
 from numpy import frombuffer
+from numpy import ones
 from numpy import uint8
-from numpy import unique
 from OpenGL import GL
 from PySide6.QtCore import QObject
 from PySide6.QtCore import QPoint
+from PySide6.QtCore import QSize
 from PySide6.QtCore import Signal
+from PySide6.QtOpenGL import QOpenGLFramebufferObject
+
+from compas.geometry import transform_points_numpy
+from compas_viewer.spatial import frustum_planes
 
 if TYPE_CHECKING:
+    from compas_viewer.scene import ViewerSceneObject
+
+    from .elementpicker import ElementKind
+    from .raycaster import PickResult
     from .renderer import Renderer
 
 
@@ -31,6 +41,19 @@ class Selector(QObject):
         Enable the selector.
     selectioncolor : :class:`compas.colors.Color`
         The color of the selected items.
+    dragmode : Literal["instance", "cpu", "element"]
+        How the drag selection finds the objects in the selection box.
+    pickmode : Literal["instance", "ray", "element"]
+        How a click finds the object under the cursor.
+    elementkinds : tuple[Literal["point", "line", "face"], ...]
+        The kinds of elements picked in the "element" modes.
+    last_pick : :class:`compas_viewer.components.renderer.raycaster.PickResult` | None
+        The element and point hit by the last click, if the pick mode is "ray".
+    last_elements : dict[:class:`compas_viewer.scene.ViewerSceneObject`, dict[Literal["point", "line", "face"], list]]
+        The keys of the vertices, edges and faces found by the last click or drag in an "element" mode.
+    selected_elements : dict[:class:`compas_viewer.scene.ViewerSceneObject`, dict[Literal["point", "line", "face"], list]]
+        The keys of the selected vertices, edges and faces per object and kind.
+        The objects which own selected elements are selected as well.
     ANTI_ALIASING_FACTOR : int
         The anti-aliasing factor for the drag selection.
 
@@ -64,6 +87,16 @@ class Selector(QObject):
         self.scene = renderer.scene
         self.controller = renderer.viewer.controller
         self.selectioncolor = renderer.config.selector.selectioncolor
+        self.dragmode = renderer.config.selector.dragmode
+        self.pickmode = renderer.config.selector.pickmode
+        self.elementkinds = renderer.config.selector.elementkinds
+        self.last_pick: Optional["PickResult"] = None
+        self.last_elements: dict["ViewerSceneObject", dict["ElementKind", list[Any]]] = {}
+        self.selected_elements: dict["ViewerSceneObject", dict["ElementKind", list[Any]]] = {}
+
+        #  Instance map
+        self._instance_fbo: Optional[QOpenGLFramebufferObject] = None
+        self._instance_key: Optional[tuple] = None
 
         #  Drag selection
         self.on_drag_selection: bool = False
@@ -83,14 +116,12 @@ class Selector(QObject):
         for _, obj in self.renderer.scene.instance_colors.items():
             obj.is_selected = False
 
-        x = self.controller.mouse.last_pos.x()
-        y = self.controller.mouse.last_pos.y()
-        instance_color = self.read_instance_color((x, y, x, y))
-        unique_color = unique(instance_color, axis=0, return_counts=False)
-
-        selected_obj = self.renderer.scene.instance_colors.get(tuple(unique_color[0]))  # type: ignore
+        selected_obj = self.pick_object(self.controller.mouse.last_pos.x(), self.controller.mouse.last_pos.y())
         if selected_obj:
             selected_obj.is_selected = True
+        if self.pickmode == "element":
+            self.selected_elements = {}
+            self.select_elements(self.last_elements)
 
         # Update the layout.
         self.viewer.layout.update()
@@ -98,13 +129,10 @@ class Selector(QObject):
     def deselect_action(self):
         """Deselect the object under the mouse cursor."""
 
-        x = self.controller.mouse.last_pos.x()
-        y = self.controller.mouse.last_pos.y()
-        instance_color = self.read_instance_color((x, y, x, y))
-        unique_color = unique(instance_color, axis=0, return_counts=False)
-
-        selected_obj = self.renderer.scene.instance_colors.get(tuple(unique_color[0]))  # type: ignore
-        if selected_obj:
+        selected_obj = self.pick_object(self.controller.mouse.last_pos.x(), self.controller.mouse.last_pos.y())
+        if self.pickmode == "element":
+            self.deselect_elements(self.last_elements)
+        elif selected_obj:
             selected_obj.is_selected = False
 
     def multiselect_action(self):
@@ -114,18 +142,47 @@ class Selector(QObject):
         --------
         :func:`compas_viewer.components.renderer.selector.Selector.select_action`
         """
-        x = self.controller.mouse.last_pos.x()
-        y = self.controller.mouse.last_pos.y()
-        instance_color = self.read_instance_color((x, y, x, y))
-        unique_color = unique(instance_color, axis=0, return_counts=False)
-
-        selected_obj = self.renderer.scene.instance_colors.get(tuple(unique_color[0]))  # type: ignore
+        selected_obj = self.pick_object(self.controller.mouse.last_pos.x(), self.controller.mouse.last_pos.y())
         if selected_obj:
             selected_obj.is_selected = True
+        if self.pickmode == "element":
+            self.select_elements(self.last_elements)
 
         # Update the layout.
         self.viewer.layout.update()
 
+    def pick_object(self, x: int, y: int) -> Optional["ViewerSceneObject"]:
+        """
+        Find the selectable object under a point of the screen, with the method of the :attr:`pickmode`.
+
+        Parameters
+        ----------
+        x, y : int
+            The screen coordinates of the point.
+
+        Returns
+        -------
+        :class:`compas_viewer.scene.ViewerSceneObject` | None
+            The object, or None if there is no object under the point.
+
+        See Also
+        --------
+        :func:`compas_viewer.components.renderer.selector.Selector.read_instance_color`
+        :func:`compas_viewer.components.renderer.RayCaster.pick`
+        :func:`compas_viewer.components.renderer.ElementPicker.pick`
+        """
+        if self.pickmode == "ray":
+            self.last_pick = self.renderer.raycaster.pick(x, y)
+            return self.last_pick.obj if self.last_pick else None
+
+        if self.pickmode == "element":
+            hit = self.renderer.elementpicker.pick(x, y, kinds=self.elementkinds)
+            self.last_elements = {hit[0]: {hit[1]: [hit[2]]}} if hit else {}
+            return hit[0] if hit else None
+
+        objs = self.scene.instance_objects(self.read_instance_color((x, y, x, y)))
+        return objs[0] if objs else None
+
     def drag_selection_action(self):
         """Drag select the objects in the rectangle area."""
 
@@ -137,17 +194,11 @@ class Selector(QObject):
         for _, obj in self.renderer.scene.instance_colors.items():
             obj.is_selected = False
 
-        instance_color = self.read_instance_color((self.drag_start_pt.x(), self.drag_start_pt.y(), self.drag_end_pt.x(), self.drag_end_pt.y()))
-        unique_colors = unique(instance_color, axis=0, return_counts=True)
-        unique_colors = array([unique_colors[0][i] for i, count in enumerate(unique_colors[1]) if count > self.ANTI_ALIASING_FACTOR])
-
-        if len(unique_colors) == 0:
-            return
-
-        for color, obj in self.renderer.scene.instance_colors.items():
-            if any(all(color == unique_colors, axis=1)):
-                obj.is_selected = True
-                continue
+        for obj in self.objects_in_box((self.drag_start_pt.x(), self.drag_start_pt.y(), self.drag_end_pt.x(), self.drag_end_pt.y())):
+            obj.is_selected = True
+        if self.dragmode == "element":
+            self.selected_elements = {}
+            self.select_elements(self.last_elements)
 
     def drag_deselection_action(self):
         """Drag deselect the objects in the rectangle area. Similar to the drag selection action.
@@ -157,21 +208,209 @@ class Selector(QObject):
         :func:`compas_viewer.components.renderer.selector.Selector.drag_selection_action`
         """
 
-        instance_color = self.read_instance_color((self.drag_start_pt.x(), self.drag_start_pt.y(), self.drag_end_pt.x(), self.drag_end_pt.y()))
-        unique_colors = unique(instance_color, axis=0, return_counts=True)
-        unique_colors = array([unique_colors[0][i] for i, count in enumerate(unique_colors[1]) if count > self.ANTI_ALIASING_FACTOR])
-
-        if len(unique_colors) == 0:
+        objs = self.objects_in_box((self.drag_start_pt.x(), self.drag_start_pt.y(), self.drag_end_pt.x(), self.drag_end_pt.y()))
+        if self.dragmode == "element":
+            self.deselect_elements(self.last_elements)
             return
+        for obj in objs:
+            obj.is_selected = False
+
+    def objects_in_box(self, box: tuple[int, int, int, int]) -> list["ViewerSceneObject"]:
+        """
+        Find the selectable objects in a box area of the screen, with the method of the :attr:`dragmode`.
+
+        Parameters
+        ----------
+        box : tuple[int, int, int, int]
+            The box area [x1, y1, x2, y2] in screen coordinates.
+
+        Returns
+        -------
+        list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The objects in the box.
+
+        See Also
+        --------
+        :func:`compas_viewer.components.renderer.selector.Selector.read_instance_color`
+        :func:`compas_viewer.components.renderer.selector.Selector.project_objects_in_box`
+        :func:`compas_viewer.components.renderer.ElementPicker.pick_box`
+        """
+        if self.dragmode == "cpu":
+            return self.project_objects_in_box(box)
+
+        if self.dragmode == "element":
+            self.last_elements = self.renderer.elementpicker.pick_box(box, kinds=self.elementkinds)
+            return list(self.last_elements)
+
+        return self.scene.instance_objects(self.read_instance_color(box), min_count=self.ANTI_ALIASING_FACTOR)
+
+    def select_elements(self, elements: dict["ViewerSceneObject", dict["ElementKind", list[Any]]]):
+        """
+        Add elements to the selected elements, and select the objects which own them.
+
+        Parameters
+        ----------
+        elements : dict[:class:`compas_viewer.scene.ViewerSceneObject`, dict[Literal["point", "line", "face"], list]]
+            The keys of the vertices, edges and faces per object and kind, as found by the :class:`compas_viewer.components.renderer.ElementPicker`.
+        """
+        for obj, kinds in elements.items():
+            selected = self.selected_elements.setdefault(obj, {})
+            for kind, keys in kinds.items():
+                selected[kind] = list(dict.fromkeys(selected.get(kind, []) + list(keys)))
+            obj.is_selected = True
 
-        for color, obj in self.renderer.scene.instance_colors.items():
-            if any(all(color == unique_colors, axis=1)):
+    def deselect_elements(self, elements: dict["ViewerSceneObject", dict["ElementKind", list[Any]]]):
+        """
+        Remove elements from the selected elements, and deselect the objects left without selected elements.
+
+        Parameters
+        ----------
+        elements : dict[:class:`compas_viewer.scene.ViewerSceneObject`, dict[Literal["point", "line", "face"], list]]
+            The keys of the vertices, edges and faces per object and kind.
+        """
+        for obj, kinds in elements.items():
+            selected = self.selected_elements.get(obj)
+            if selected is None:
+                continue
+            for kind, keys in kinds.items():
+                removed = set(keys)
+                selected[kind] = [key for key in selected.get(kind, []) if key not in removed]
+                if not selected[kind]:
+                    del selected[kind]
+            if not selected:
+                del self.selected_elements[obj]
                 obj.is_selected = False
+
+    def project_objects_in_box(self, box: tuple[int, int, int, int]) -> list["ViewerSceneObject"]:
+        """
+        Find the selectable objects in a box area of the screen without reading back from the GPU.
+
+        Parameters
+        ----------
+        box : tuple[int, int, int, int]
+            The box area [x1, y1, x2, y2] in screen coordinates.
+
+        Returns
+        -------
+        list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The objects in the box.
+
+        Notes
+        -----
+        The candidates are the objects whose bounding boxes intersect the frustum of the selection box,
+        found through the bounding volume hierarchy of the scene.
+        Objects whose bounding boxes are entirely inside that frustum are selected directly,
+        the others only if at least one of their vertices projects inside the selection box.
+        Unlike the instance map, this does not take occlusion into account.
+
+        See Also
+        --------
+        :func:`compas_viewer.scene.ViewerScene.query_frustum`
+        """
+        x1, y1, x2, y2 = box
+        width = self.viewer.layout.config.window.width
+        height = self.viewer.layout.config.window.height
+        xmin, xmax = 2 * min(x1, x2) / width - 1, 2 * max(x1, x2) / width - 1
+        ymin, ymax = 1 - 2 * max(y1, y2) / height, 1 - 2 * min(y1, y2) / height
+
+        camera = self.renderer.camera
+        matrix = array(camera.projection(width, height)) @ array(camera.viewworld())
+        planes = frustum_planes(matrix, window=(xmin, ymin, xmax, ymax))
+
+        objs = []
+        for obj in self.scene.query_frustum(planes):
+            if obj.is_locked or not obj.is_visible or obj.instance_color.rgb255 not in self.scene.instance_colors:
+                continue
+
+            lo, hi = obj.bounding_box  # type: ignore
+            corners = array([[x, y, z, 1] for x in (lo[0], hi[0]) for y in (lo[1], hi[1]) for z in (lo[2], hi[2])])
+            if (corners @ planes.T >= 0).all():
+                objs.append(obj)
+                continue
+
+            positions = obj.positions_array()
+            if positions is None:
+                # Objects without vertex data are selected by their bounds.
+                objs.append(obj)
                 continue
 
+            points = transform_points_numpy(positions, obj.worldtransformation)
+            clip = column_stack([points, ones(len(points))]) @ (matrix.T)
+            w = clip[:, 3]
+            front = w > 0
+            x = clip[front, 0] / w[front]
+            y = clip[front, 1] / w[front]
+            if ((x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)).any():
+                objs.append(obj)
+
+        return objs
+
+    def instance_map_key(self) -> tuple:
+        """
+        The state on which the instance map depends.
+
+        Returns
+        -------
+        tuple
+            The version of the scene, the size of the view, the render and view modes, and the camera matrices.
+
+        See Also
+        --------
+        :attr:`compas_viewer.scene.ViewerScene.version`
+        """
+        width = self.viewer.layout.config.window.width
+        height = self.viewer.layout.config.window.height
+        camera = self.renderer.camera
+        return (
+            self.scene.version,
+            width,
+            height,
+            self.renderer.devicePixelRatio(),
+            self.renderer.rendermode,
+            self.renderer.viewmode,
+            tuple(array(camera.viewworld()).flat),
+            tuple(array(camera.projection(width, height)).flat),
+        )
+
+    def paint_instance_map(self) -> QOpenGLFramebufferObject:
+        """
+        Paint the instance map into an offscreen framebuffer, unless it is up to date.
+
+        Returns
+        -------
+        :PySide6:`PySide6/QtOpenGL/QOpenGLFramebufferObject`
+            The framebuffer holding the instance map.
+
+        Notes
+        -----
+        The instance map is only repainted when the :meth:`instance_map_key` has changed since the last paint,
+        so repeated clicks and hover queries on a static view only read pixels back.
+        The OpenGL context of the renderer has to be current.
+
+        References
+        ----------
+        * https://doc.qt.io/qt-6/qopenglframebufferobject.html
+        """
+        r = self.renderer.devicePixelRatio()
+        size = QSize(int(self.viewer.layout.config.window.width * r), int(self.viewer.layout.config.window.height * r))
+        if self._instance_fbo is None or self._instance_fbo.size() != size:
+            self._instance_fbo = QOpenGLFramebufferObject(size, QOpenGLFramebufferObject.Attachment.Depth)
+            self._instance_key = None
+
+        key = self.instance_map_key()
+        if key != self._instance_key:
+            self._instance_fbo.bind()
+            GL.glViewport(0, 0, size.width(), size.height())
+            self.renderer.clear()
+            self.renderer.paint_instance()
+            GL.glBindFramebuffer(GL.GL_FRAMEBUFFER, self.renderer.defaultFramebufferObject())
+            # The key is taken before painting, objects still loading may change the scene while being drawn.
+            self._instance_key = key
+        return self._instance_fbo
+
     def read_instance_color(self, box: tuple[int, int, int, int]):
         """
-        Paint the instance map quickly, and then read the color of the specified area.
+        Read the colors of the specified area of the instance map.
 
         Parameters
         ----------
@@ -183,7 +422,8 @@ class Selector(QObject):
         The instance map is used by the selector to identify selected objects.
         The mechanism of a :class:`compas_viewer.components.renderer.selector.Selector`
         is picking the color from instance map and then find the corresponding object.
-        Anti aliasing, which is always force opened in many machines,  can cause color picking inaccuracy.
+        The map is painted into an offscreen framebuffer without anti aliasing,
+        and only repainted when the scene or the camera has changed.
 
         The instance buffer created by the GL is based on the "device-independent pixels",
         while "physical pixels" is the common unit. The method :func:`PySide6.QtGui.QPaintDevice.devicePixelRatio()`
@@ -195,6 +435,7 @@ class Selector(QObject):
         See Also
         --------
         :func:`compas_viewer.components.renderer.selector.Selector.ANTI_ALIASING_FACTOR`
+        :func:`compas_viewer.components.renderer.selector.Selector.paint_instance_map`
         :attr:`compas_viewer.components.renderer.rendermode`
 
         References
@@ -211,15 +452,17 @@ class Selector(QObject):
         height = max(self.PIXEL_SELECTION_INCREMENTAL, abs(y1 - y2))
         r = self.renderer.devicePixelRatio()
 
-        # 1. Repaint the canvas with instance color.
+        # 1. Paint the instance map offscreen, if the scene or the camera has changed.
         self.renderer.makeCurrent()
-        self.renderer.paintGL(is_instance=True)
+        fbo = self.paint_instance_map()
 
         # 2. Read the instance buffer.
-        instance_buffer = GL.glReadPixels(x * r, y * r, width * r, height * r, GL.GL_RGB, GL.GL_UNSIGNED_BYTE)
+        #      RGBA rows are always aligned, which RGB rows of odd widths are not.
+        fbo.bind()
+        instance_buffer = GL.glReadPixels(x * r, y * r, width * r, height * r, GL.GL_RGBA, GL.GL_UNSIGNED_BYTE)
+        GL.glBindFramebuffer(GL.GL_FRAMEBUFFER, self.renderer.defaultFramebufferObject())
 
         # 3. Return the instance color.
-        #      From 1-3, the canvas goes through a quick repaint process, which should be not noticeable to the user.
-        instance_map = frombuffer(buffer=instance_buffer, dtype=uint8).reshape(-1, 3)
+        instance_map = frombuffer(buffer=instance_buffer, dtype=uint8).reshape(-1, 4)[:, :3]
 
         return instance_map
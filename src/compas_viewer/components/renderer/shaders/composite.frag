@@ -0,0 +1,15 @@
+#version 120
+
+varying vec2 uv;
+
+uniform sampler2D accumulation;
+uniform sampler2D weights;
+
+void main() {
+    vec4 accum = texture2D(accumulation, uv);
+    float revealage = accum.a;
+    if(revealage >= 1.0)
+        discard;
+    float weight = texture2D(weights, uv).r;
+    gl_FragColor = vec4(accum.rgb / max(weight, 1e-5), 1.0 - revealage);
+}
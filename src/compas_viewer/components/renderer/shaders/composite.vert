@@ -0,0 +1,10 @@
+#version 120
+
+attribute vec3 position;
+
+varying vec2 uv;
+
+void main() {
+    uv = position.xy * 0.5 + 0.5;
+    gl_Position = vec4(position.xy, 0.0, 1.0);
+}
@@ -0,0 +1,8 @@
+#version 120
+
+varying vec4 element_color;
+
+void main()
+{
+    gl_FragColor = element_color;
+}
@@ -0,0 +1,22 @@
+#version 120
+
+attribute vec3 position;
+attribute float element;
+
+uniform mat4 projection;
+uniform mat4 viewworld;
+uniform mat4 transform;
+uniform float range;
+uniform float depth_offset;
+
+varying vec4 element_color;
+
+void main()
+{
+    // The element index plus one in the RGB bytes and the range in the alpha byte.
+    // All operations are exact for integers below 2^24.
+    float id = element + 1.0;
+    element_color = vec4(floor(id / 65536.0), mod(floor(id / 256.0), 256.0), mod(id, 256.0), range) / 255.0;
+    gl_Position = projection * viewworld * transform * vec4(position, 1.0);
+    gl_Position.z -= depth_offset * gl_Position.w;
+}
@@ -0,0 +1,43 @@
+#version 120
+
+varying vec4 vertex_color;
+varying vec3 ec_pos;
+
+uniform float opacity;
+uniform float object_opacity;
+uniform bool is_lighted;
+uniform bool is_selected;
+uniform vec3 selection_color;
+uniform int element_type;
+
+void main() {
+    float alpha = opacity * object_opacity * vertex_color.a;
+    vec3 color;
+    color = vertex_color.rgb;
+    if(is_selected) {
+        if(element_type == 0) {
+            color = selection_color * 0.9;
+        } else if(element_type == 1) {
+            color = selection_color * 0.8;
+        } else {
+            color = selection_color;
+        }
+        if(alpha < 0.5)
+            alpha = 0.5;
+    }
+
+    if(is_lighted) {
+        vec3 ec_normal = normalize(cross(dFdx(ec_pos), dFdy(ec_pos)));
+        vec3 L = normalize(-ec_pos);
+        color = color * dot(ec_normal, L);
+    }
+
+    // Weight of the fragment, decreasing with the depth (McGuire and Bavoil, 2013, equation 10).
+    float z = 1.0 - gl_FragCoord.z * 0.9;
+    float weight = clamp(pow(min(1.0, alpha * 10.0) + 0.01, 3.0) * 1e8 * z * z * z, 1e-2, 3e3);
+
+    // The premultiplied weighted color, and the alpha which multiplies the revealage.
+    gl_FragData[0] = vec4(color * alpha * weight, alpha);
+    // The weighted alpha.
+    gl_FragData[1] = vec4(alpha * weight, 0.0, 0.0, 0.0);
+}
@@ -2,16 +2,54 @@ from pathlib import Path
 from typing import Any
 from typing import Union
 
-from numpy import array
+from numpy import asarray
+from numpy import float32
 from OpenGL import GL
 
+from compas_viewer.gl import glcounters
+from compas_viewer.gl import glstate
+
 
 class Shader:
-    """The shader used by the OpenGL view."""
+    """The shader used by the OpenGL view.
+
+    Parameters
+    ----------
+    name : str, optional
+        The name of the shader files, without the ``.vert`` and ``.frag`` extensions.
+
+    Attributes
+    ----------
+    program : int
+        The shader program.
+    uniforms : dict[str, int]
+        The locations of the active uniforms, resolved once after linking.
+    attributes : dict[str, int]
+        The locations of the active attributes, resolved once after linking.
+    locations : dict[str, int]
+        The locations of the enabled attributes.
+
+    Notes
+    -----
+    The last value set for every uniform is remembered, and setting the same value again does not call OpenGL,
+    as uniforms keep their values in the program until they are changed.
+    Uniforms and attributes which are not active in the program, because they are not declared or
+    optimized away by the compiler, are ignored.
+    """
 
     def __init__(self, name: str = "mesh"):
         self.program = make_shader_program(name)
+        self.uniforms = active_uniforms(self.program)
+        self.attributes = active_attributes(self.program)
         self.locations = {}
+        self._values: dict[int, Any] = {}
+
+    def _changed(self, location: int, value: Any) -> bool:
+        """Whether a uniform has to be set, remembering its new value."""
+        if location < 0 or self._values.get(location) == value:
+            return False
+        self._values[location] = value
+        return True
 
     def uniform4x4(self, name: str, value: list[list[float]]):
         """Store a uniform 4x4 transformation matrix in the shader program at a named location.
@@ -21,11 +59,12 @@ class Shader:
         name : str
             The name of the location in the shader program.
         value : list[list[float]]
-            A 4x4 transformation matrix.
+            A 4x4 transformation matrix, in rows. A float32 array is used without copying.
         """
-        _value = array(value)
-        location = GL.glGetUniformLocation(self.program, name)
-        GL.glUniformMatrix4fv(location, 1, True, _value)
+        location = self.uniforms.get(name, -1)
+        _value = asarray(value, dtype=float32)
+        if self._changed(location, _value.tobytes()):
+            GL.glUniformMatrix4fv(location, 1, True, _value)
 
     def uniform1i(self, name: str, value: int):
         """Store a uniform integer in the shader program at a named location.
@@ -37,8 +76,9 @@ class Shader:
         value : int
             An integer value.
         """
-        location = GL.glGetUniformLocation(self.program, name)
-        GL.glUniform1i(location, value)
+        location = self.uniforms.get(name, -1)
+        if self._changed(location, int(value)):
+            GL.glUniform1i(location, value)
 
     def uniform1f(self, name: str, value: float):
         """Store a uniform float in the shader program at a named location.
@@ -50,8 +90,9 @@ class Shader:
         value : float
             A float value.
         """
-        location = GL.glGetUniformLocation(self.program, name)
-        GL.glUniform1f(location, value)
+        location = self.uniforms.get(name, -1)
+        if self._changed(location, float(value)):
+            GL.glUniform1f(location, value)
 
     def uniform3f(self, name: str, value: Union[tuple[float, float, float], list[float]]):
         """Store a uniform list of 3 floats in the shader program at a named location.
@@ -63,10 +104,11 @@ class Shader:
         value : Union[tuple[float, float, float], list[float]]
             An iterable of 3 floats.
         """
-        location = GL.glGetUniformLocation(self.program, name)
-        GL.glUniform3f(location, *value)
+        location = self.uniforms.get(name, -1)
+        if self._changed(location, tuple(value)):
+            GL.glUniform3f(location, *value)
 
-    def uniformText(self, name: str, texture: Any):
+    def uniformText(self, name: str, texture: Any, unit: int = 0):
         """Store a uniform texture in the shader program at a named location.
 
         Parameters
@@ -75,20 +117,24 @@ class Shader:
             The name of the location in the shader program.
         texture : Any
             The texture to store.
+        unit : int, optional
+            The texture unit the texture is bound to. Default is 0.
         """
-        # location = GL.glGetUniformLocation(self.program, name)
-        # print(location)
-        GL.glActiveTexture(GL.GL_TEXTURE0 + 0)  # type: ignore
+        self.uniform1i(name, unit)
+        GL.glActiveTexture(GL.GL_TEXTURE0 + unit)  # type: ignore
         GL.glBindTexture(GL.GL_TEXTURE_2D, texture)
+        if unit:
+            GL.glActiveTexture(GL.GL_TEXTURE0)
 
     def bind(self):
         """Bind the shader program."""
-        GL.glUseProgram(self.program)
+        glstate.use_program(self.program)
 
     def release(self):
-        """Release (unbind) the shader program."""
-        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
-        GL.glUseProgram(0)
+        """Release (unbind) the shader program, and disable the attributes which are still enabled."""
+        glstate.disable_attributes()
+        glstate.bind_buffer(GL.GL_ARRAY_BUFFER, 0)
+        glstate.use_program(0)
 
     def enable_attribute(self, name: str):
         """Enable a named attribute in the shader program.
@@ -98,8 +144,9 @@ class Shader:
         name : str
             The name of the attribute.
         """
-        location = GL.glGetAttribLocation(self.program, name)
-        GL.glEnableVertexAttribArray(location)
+        location = self.attributes.get(name, -1)
+        if location >= 0:
+            glstate.enable_attribute(location)
         self.locations[name] = location
 
     def bind_attribute(self, name: str, value: Any, step: int = 3):
@@ -115,11 +162,23 @@ class Shader:
             The step size of the attribute.
         """
         location = self.locations[name]
-        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, value)
-        GL.glVertexAttribPointer(location, step, GL.GL_FLOAT, False, 0, None)
+        if location < 0:
+            return
+        glstate.attribute_pointer(location, value, step)
 
     def disable_attribute(self, name: str):
-        GL.glDisableVertexAttribArray(self.locations[name])
+        """Stop using a named attribute.
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute.
+
+        Notes
+        -----
+        The attribute array stays enabled until another object disables it or the shader is released,
+        as the next object of the same shader mostly enables it again.
+        """
         del self.locations[name]
 
     def draw_triangles(self, elements: Any = None, n: int = 0, background: bool = False):
@@ -133,16 +192,17 @@ class Shader:
         n : int, optional
             The number of elements.
         background : bool, optional
-            Draw in background.
+            Draw in background, with the depth test disabled.
 
         """
+        glstate.set_capability(GL.GL_DEPTH_TEST, not background)
         if elements:
-            if background:
-                GL.glDisable(GL.GL_DEPTH_TEST)
-            GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, elements)
+            glstate.bind_buffer(GL.GL_ELEMENT_ARRAY_BUFFER, elements)
             GL.glDrawElements(GL.GL_TRIANGLES, n, GL.GL_UNSIGNED_INT, None)
         else:
             GL.glDrawArrays(GL.GL_TRIANGLES, 0, GL.GL_BUFFER_SIZE)
+        if glcounters.enabled:
+            glcounters.draw(GL.GL_TRIANGLES, n if elements else 0)
 
     def draw_lines(self, elements: Any = None, n: int = 0, width: float = 1, background: bool = False):
         """
@@ -157,17 +217,17 @@ class Shader:
         width : float, optional
             The width of the lines.
         background : bool, optional
-            Draw in background.
+            Draw in background, with the depth test disabled.
         """
+        glstate.set_capability(GL.GL_DEPTH_TEST, not background)
+        glstate.line_width(width)
         if elements:
-            if background:
-                GL.glDisable(GL.GL_DEPTH_TEST)
-            GL.glLineWidth(width)
-            GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, elements)
+            glstate.bind_buffer(GL.GL_ELEMENT_ARRAY_BUFFER, elements)
             GL.glDrawElements(GL.GL_LINES, n, GL.GL_UNSIGNED_INT, None)
-            GL.glEnable(GL.GL_DEPTH_TEST)
         else:
             GL.glDrawArrays(GL.GL_LINES, 0, GL.GL_BUFFER_SIZE)
+        if glcounters.enabled:
+            glcounters.draw(GL.GL_LINES, n if elements else 0)
 
     def draw_points(self, size: float = 1, elements: Any = None, n: int = 0, background: bool = False):
         """
@@ -182,16 +242,17 @@ class Shader:
         n : int, optional
             The number of elements.
         background : bool, optional
-            Draw in background.
+            Draw in background, with the depth test disabled.
         """
-        GL.glPointSize(size)
+        glstate.set_capability(GL.GL_DEPTH_TEST, not background)
+        glstate.point_size(size)
         if elements:
-            if background:
-                GL.glDisable(GL.GL_DEPTH_TEST)
-            GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, elements)
+            glstate.bind_buffer(GL.GL_ELEMENT_ARRAY_BUFFER, elements)
             GL.glDrawElements(GL.GL_POINTS, n, GL.GL_UNSIGNED_INT, None)
         else:
             GL.glDrawArrays(GL.GL_POINTS, 0, GL.GL_BUFFER_SIZE)
+        if glcounters.enabled:
+            glcounters.draw(GL.GL_POINTS, n if elements else 0)
 
     def draw_texts(self, elements: Any = None, n: int = 0):
         """
@@ -204,16 +265,18 @@ class Shader:
         n : int, optional
             The number of elements.
         """
-        GL.glDisable(GL.GL_POINT_SMOOTH)
-        GL.glEnable(GL.GL_POINT_SPRITE)
-        GL.glEnable(GL.GL_PROGRAM_POINT_SIZE)
+        glstate.disable(GL.GL_POINT_SMOOTH)
+        glstate.enable(GL.GL_POINT_SPRITE)
+        glstate.enable(GL.GL_PROGRAM_POINT_SIZE)
         if elements:
-            GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, elements)
+            glstate.bind_buffer(GL.GL_ELEMENT_ARRAY_BUFFER, elements)
             GL.glDrawElements(GL.GL_POINTS, n, GL.GL_UNSIGNED_INT, None)
         else:
             GL.glDrawArrays(GL.GL_POINTS, 0, GL.GL_BUFFER_SIZE)
-        GL.glDisable(GL.GL_POINT_SPRITE)
-        GL.glEnable(GL.GL_POINT_SMOOTH)
+        if glcounters.enabled:
+            glcounters.draw(GL.GL_POINTS, n if elements else 0)
+        glstate.disable(GL.GL_POINT_SPRITE)
+        glstate.enable(GL.GL_POINT_SMOOTH)
 
     def draw_arrows(self, elements: Any, n: int, width: float, background: bool = False):
         """
@@ -228,20 +291,19 @@ class Shader:
         width : float
             The width of the arrows.
         background : bool, optional
-            Draw in background.
+            Draw in background, with the depth test disabled.
         """
-        GL.glDisable(GL.GL_POINT_SMOOTH)
-
+        glstate.disable(GL.GL_POINT_SMOOTH)
+        glstate.set_capability(GL.GL_DEPTH_TEST, not background)
         if elements:
-            if background:
-                GL.glDisable(GL.GL_DEPTH_TEST)
-            GL.glLineWidth(width)
-            GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, elements)
+            glstate.line_width(width)
+            glstate.bind_buffer(GL.GL_ELEMENT_ARRAY_BUFFER, elements)
             GL.glDrawElements(GL.GL_LINES, n, GL.GL_UNSIGNED_INT, None)
-            GL.glEnable(GL.GL_DEPTH_TEST)
         else:
             GL.glDrawArrays(GL.GL_LINES, 0, GL.GL_BUFFER_SIZE)
-        GL.glEnable(GL.GL_POINT_SMOOTH)
+        if glcounters.enabled:
+            glcounters.draw(GL.GL_LINES, n if elements else 0)
+        glstate.enable(GL.GL_POINT_SMOOTH)
 
     def draw_2d_box(self, box_coords: tuple[float, float, float, float], width: int, height: int):
         """Draw a 2D box. Mostly used for box selection.
@@ -264,7 +326,7 @@ class Shader:
             x1, x2 = x2, x1
         if y1 > y2:
             y1, y2 = y2, y1
-        GL.glLineWidth(1)
+        glstate.line_width(1)
         GL.glBegin(GL.GL_LINE_LOOP)
         GL.glColor3f(0, 0, 0)
         GL.glVertex2f(x1, y1)
@@ -304,6 +366,48 @@ def make_shader_program(name: str):
     return program
 
 
+def active_uniforms(program: int) -> dict[str, int]:
+    """Find the locations of the active uniforms of a linked shader program.
+
+    Parameters
+    ----------
+    program : int
+        The shader program.
+
+    Returns
+    -------
+    dict[str, int]
+        The location of every active uniform by name. Arrays are listed by their name without index.
+    """
+    uniforms = {}
+    for index in range(int(GL.glGetProgramiv(program, GL.GL_ACTIVE_UNIFORMS))):
+        name = GL.glGetActiveUniform(program, index)[0]
+        name = (name.decode() if isinstance(name, bytes) else str(name)).rstrip("\x00").removesuffix("[0]")
+        uniforms[name] = int(GL.glGetUniformLocation(program, name))
+    return uniforms
+
+
+def active_attributes(program: int) -> dict[str, int]:
+    """Find the locations of the active attributes of a linked shader program.
+
+    Parameters
+    ----------
+    program : int
+        The shader program.
+
+    Returns
+    -------
+    dict[str, int]
+        The location of every active attribute by name.
+    """
+    attributes = {}
+    for index in range(int(GL.glGetProgramiv(program, GL.GL_ACTIVE_ATTRIBUTES))):
+        name = GL.glGetActiveAttrib(program, index)[0]
+        name = (name.decode() if isinstance(name, bytes) else str(name)).rstrip("\x00")
+        attributes[name] = int(GL.glGetAttribLocation(program, name))
+    return attributes
+
+
 def compile_vertex_shader(source: str):
     """Compile a vertex shader."""
     shader = GL.glCreateShader(GL.GL_VERTEX_SHADER)
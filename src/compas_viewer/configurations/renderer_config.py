@@ -1,5 +1,6 @@
 from pathlib import Path
 from typing import Literal
+from typing import Sequence
 from typing import TypedDict
 
 from compas.colors import Color
@@ -19,6 +20,20 @@ class SelectorConfig:
         Enable the selector.
     selectioncolor : Color
         The color of the selected object.
+    dragmode : Literal["instance", "cpu", "element"], optional
+        How the drag selection finds the objects in the selection box.
+        "instance" reads back the instance map from the GPU,
+        "cpu" projects the object bounds and vertices with NumPy,
+        "element" selects the visible vertices, edges and faces with the :class:`compas_viewer.components.renderer.ElementPicker`.
+        Default is "instance".
+    pickmode : Literal["instance", "ray", "element"], optional
+        How a click finds the object under the cursor.
+        "instance" reads back the instance map from the GPU,
+        "ray" casts a ray from the camera with the :class:`compas_viewer.components.renderer.RayCaster`,
+        "element" picks the vertex, edge or face under the cursor with the :class:`compas_viewer.components.renderer.ElementPicker`.
+        Default is "instance".
+    elementkinds : Sequence[Literal["point", "line", "face"]], optional
+        The kinds of elements picked in the "element" modes. Default is all kinds.
 
     See Also
     --------
@@ -27,10 +42,20 @@ class SelectorConfig:
 
     """
 
-    def __init__(self, enable_selector: bool, selectioncolor: Color):
+    def __init__(
+        self,
+        enable_selector: bool,
+        selectioncolor: Color,
+        dragmode: Literal["instance", "cpu", "element"] = "instance",
+        pickmode: Literal["instance", "ray", "element"] = "instance",
+        elementkinds: Sequence[Literal["point", "line", "face"]] = ("point", "line", "face"),
+    ):
         super().__init__()
         self.enable_selector = enable_selector
         self.selectioncolor = selectioncolor
+        self.dragmode = dragmode
+        self.pickmode = pickmode
+        self.elementkinds = tuple(elementkinds)
 
 
 class CameraConfig:
@@ -104,8 +129,10 @@ class RendererConfig(Config):
         Whether to show the z-grid or not.
     viewmode : Literal["front", "right", "top", "perspective"]
         The viewmode of the camera.
-    rendermode : Literal["wireframe", "shaded", "ghosted", "lighted", "instance"]
+    rendermode : Literal["wireframe", "shaded", "ghosted", "oit", "lighted", "instance"]
         The rendermode of the renderer.
+        The "oit" mode is the "ghosted" mode, with the transparent objects blended in any order
+        by :class:`compas_viewer.components.renderer.WeightedBlendedOIT` instead of sorted back to front.
     backgroundcolor : Color
         The background color of the renderer.
     ghostopacity : float
@@ -114,13 +141,23 @@ class RendererConfig(Config):
         The camera configuration of the renderer.
     selector : :class:`compas_viewer.configurations.renderer_config.SelectorConfigType`
         The selector configuration of the renderer.
+    frustumculling : bool, optional
+        Whether to skip the objects outside the view frustum. Default is True.
+    occlusionculling : bool, optional
+        Whether to skip the objects hidden behind others, found with occlusion queries of the previous frames. Default is False.
+    gputiming : bool, optional
+        Whether to measure the GPU time of the phases of the frames with timer queries,
+        reported by :func:`compas_viewer.components.renderer.Renderer.stats`. Default is True.
+    show_overlay : bool, optional
+        Whether to show the performance counters over the canvas,
+        see :class:`compas_viewer.components.renderer.PerformanceOverlay`. Default is False.
 
     Attributes
     ----------
     CameraConfigType : :class:`compas_viewer.configurations.renderer_config.CameraConfigType`
         The type template for the the camera: {fov: float, near: float, far: float, ..., pan_delta: float}
     SelectorConfigType : :class:`compas_viewer.configurations.renderer_config.SelectorConfigType`
-        The type template for the the selector: {enable_selector: bool, selectioncolor: Color}
+        The type template for the the selector: {enable_selector: bool, selectioncolor: Color, dragmode: str, pickmode: str, elementkinds: list[str]}
 
     See Also
     --------
@@ -141,6 +178,9 @@ class RendererConfig(Config):
     class SelectorConfigType(TypedDict):
         enable_selector: bool
         selectioncolor: Color
+        dragmode: Literal["instance", "cpu", "element"]
+        pickmode: Literal["instance", "ray", "element"]
+        elementkinds: Sequence[Literal["point", "line", "face"]]
 
     def __init__(
         self,
@@ -148,11 +188,15 @@ class RendererConfig(Config):
         gridsize: tuple[float, int, float, int],
         show_gridz: bool,
         viewmode: Literal["front", "right", "top", "perspective"],
-        rendermode: Literal["wireframe", "shaded", "ghosted", "lighted", "instance"],
+        rendermode: Literal["wireframe", "shaded", "ghosted", "oit", "lighted", "instance"],
         backgroundcolor: Color,
         ghostopacity: float,
         camera: CameraConfigType,
         selector: SelectorConfigType,
+        frustumculling: bool = True,
+        occlusionculling: bool = False,
+        gputiming: bool = True,
+        show_overlay: bool = False,
     ):
         super().__init__()
         self.show_grid = show_grid
@@ -164,6 +208,10 @@ class RendererConfig(Config):
         self.ghostopacity = ghostopacity
         self.camera = CameraConfig(**camera)
         self.selector = SelectorConfig(**selector)
+        self.frustumculling = frustumculling
+        self.occlusionculling = occlusionculling
+        self.gputiming = gputiming
+        self.show_overlay = show_overlay
 
     @classmethod
     def from_default(cls) -> "RendererConfig":
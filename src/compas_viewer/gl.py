@@ -1,5 +1,9 @@
 import ctypes as ct
 
+from numpy import ascontiguousarray
+from numpy import float32
+from numpy import ndarray
+from numpy import uint32
 from OpenGL import GL
 
 
@@ -38,13 +42,322 @@ def gl_info() -> str:
     return info
 
 
+class GLState:
+    """Track the OpenGL state set by the viewer, and skip the changes which would not change it.
+
+    PyOpenGL calls are expensive compared to the work they do, and the drawing code sets
+    the same state for every object. All state changes of :mod:`compas_viewer.gl`, the shaders
+    and the renderer go through :data:`glstate`, which only calls OpenGL when the value differs
+    from the last value it has set.
+
+    Attributes
+    ----------
+    issued : int
+        The number of state changes passed to OpenGL since the last :meth:`invalidate`.
+    skipped : int
+        The number of state changes skipped since the last :meth:`invalidate`.
+
+    Notes
+    -----
+    The tracker assumes that the state it tracks is only changed through it.
+    State which is changed by Qt, such as the bound framebuffer and the viewport, is not tracked.
+    The renderer invalidates the tracker at the start of every frame, so that state changed
+    outside the viewer between frames is set again.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from compas_viewer.gl import glstate
+
+        glstate.enable(GL.GL_DEPTH_TEST)
+        glstate.line_width(2.0)
+    """
+
+    def __init__(self):
+        self.invalidate()
+
+    def invalidate(self):
+        """Forget the tracked state, such that the next change of every state is passed to OpenGL."""
+        self._capabilities: dict[int, bool] = {}
+        self._values: dict[str, tuple] = {}
+        self._buffers: dict[int, int] = {}
+        self._arrays: set[int] = set()
+        self._pointers: dict[int, tuple[int, int]] = {}
+        self.issued = 0
+        self.skipped = 0
+
+    def _changed(self, name: str, value: tuple) -> bool:
+        if self._values.get(name) == value:
+            self.skipped += 1
+            return False
+        self._values[name] = value
+        self.issued += 1
+        return True
+
+    def set_capability(self, capability: int, enabled: bool):
+        """Enable or disable a capability, such as ``GL_DEPTH_TEST`` or ``GL_BLEND``.
+
+        Parameters
+        ----------
+        capability : int
+            The capability.
+        enabled : bool
+            Whether to enable the capability.
+        """
+        if self._capabilities.get(capability) == enabled:
+            self.skipped += 1
+            return
+        self._capabilities[capability] = enabled
+        self.issued += 1
+        if enabled:
+            GL.glEnable(capability)
+        else:
+            GL.glDisable(capability)
+
+    def enable(self, capability: int):
+        """Enable a capability, see :meth:`set_capability`."""
+        self.set_capability(capability, True)
+
+    def disable(self, capability: int):
+        """Disable a capability, see :meth:`set_capability`."""
+        self.set_capability(capability, False)
+
+    def blend_func(self, sfactor: int, dfactor: int):
+        """Set the blending factors."""
+        if self._changed("blend_func", (sfactor, dfactor, sfactor, dfactor)):
+            GL.glBlendFunc(sfactor, dfactor)
+
+    def blend_func_separate(self, sfactor_rgb: int, dfactor_rgb: int, sfactor_alpha: int, dfactor_alpha: int):
+        """Set the blending factors of the color and the alpha channels separately."""
+        if self._changed("blend_func", (sfactor_rgb, dfactor_rgb, sfactor_alpha, dfactor_alpha)):
+            GL.glBlendFuncSeparate(sfactor_rgb, dfactor_rgb, sfactor_alpha, dfactor_alpha)
+
+    def depth_func(self, func: int):
+        """Set the depth comparison function."""
+        if self._changed("depth_func", (func,)):
+            GL.glDepthFunc(func)
+
+    def depth_mask(self, flag: bool):
+        """Enable or disable writing to the depth buffer."""
+        if self._changed("depth_mask", (bool(flag),)):
+            GL.glDepthMask(flag)
+
+    def color_mask(self, red: bool, green: bool, blue: bool, alpha: bool):
+        """Enable or disable writing to the color channels."""
+        if self._changed("color_mask", (bool(red), bool(green), bool(blue), bool(alpha))):
+            GL.glColorMask(red, green, blue, alpha)
+
+    def line_width(self, width: float):
+        """Set the width of lines."""
+        if self._changed("line_width", (float(width),)):
+            GL.glLineWidth(width)
+
+    def point_size(self, size: float):
+        """Set the size of points."""
+        if self._changed("point_size", (float(size),)):
+            GL.glPointSize(size)
+
+    def polygon_offset(self, factor: float, units: float):
+        """Set the scale and units of the polygon depth offset."""
+        if self._changed("polygon_offset", (float(factor), float(units))):
+            GL.glPolygonOffset(factor, units)
+
+    def clear_color(self, red: float, green: float, blue: float, alpha: float):
+        """Set the color with which the color buffer is cleared."""
+        if self._changed("clear_color", (float(red), float(green), float(blue), float(alpha))):
+            GL.glClearColor(red, green, blue, alpha)
+
+    def use_program(self, program: int):
+        """Bind a shader program, or 0 to unbind it."""
+        if self._changed("program", (int(program),)):
+            GL.glUseProgram(program)
+
+    def bind_buffer(self, target: int, buffer: int):
+        """Bind a buffer, or 0 to unbind it.
+
+        Parameters
+        ----------
+        target : int
+            ``GL_ARRAY_BUFFER`` or ``GL_ELEMENT_ARRAY_BUFFER``.
+        buffer : int
+            The ID of the buffer.
+        """
+        buffer = int(buffer)
+        if self._buffers.get(target) == buffer:
+            self.skipped += 1
+            return
+        self._buffers[target] = buffer
+        self.issued += 1
+        GL.glBindBuffer(target, buffer)
+
+    def enable_attribute(self, location: int):
+        """Enable the vertex attribute array of a location."""
+        if location in self._arrays:
+            self.skipped += 1
+            return
+        self._arrays.add(location)
+        self.issued += 1
+        GL.glEnableVertexAttribArray(location)
+
+    def disable_attribute(self, location: int):
+        """Disable the vertex attribute array of a location."""
+        if location not in self._arrays:
+            self.skipped += 1
+            return
+        self._arrays.discard(location)
+        self.issued += 1
+        GL.glDisableVertexAttribArray(location)
+
+    def disable_attributes(self):
+        """Disable all enabled vertex attribute arrays."""
+        for location in list(self._arrays):
+            self.disable_attribute(location)
+
+    def attribute_pointer(self, location: int, buffer: int, size: int):
+        """Point a vertex attribute to a buffer of floats.
+
+        Parameters
+        ----------
+        location : int
+            The location of the attribute.
+        buffer : int
+            The ID of the vertex buffer.
+        size : int
+            The number of floats per vertex.
+        """
+        pointer = (int(buffer), size)
+        if self._pointers.get(location) == pointer:
+            self.skipped += 1
+            return
+        self.bind_buffer(GL.GL_ARRAY_BUFFER, buffer)
+        self._pointers[location] = pointer
+        self.issued += 1
+        GL.glVertexAttribPointer(location, size, GL.GL_FLOAT, False, 0, None)
+
+    def forget_buffers(self, buffers):
+        """Forget the bindings of deleted buffers, which OpenGL unbinds.
+
+        Parameters
+        ----------
+        buffers : list[int]
+            The IDs of the buffers.
+        """
+        deleted = set(int(buffer) for buffer in buffers)
+        for target, buffer in list(self._buffers.items()):
+            if buffer in deleted:
+                self._buffers[target] = 0
+        for location, (buffer, _) in list(self._pointers.items()):
+            if buffer in deleted:
+                del self._pointers[location]
+
+
+glstate = GLState()
+
+
+class GLCounters:
+    """Count the draw calls and primitives of a frame, and the memory of the buffers made by :mod:`compas_viewer.gl`.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether the draw calls are counted. The shaders check this flag before counting,
+        so the counting costs one attribute lookup per draw call while it is off.
+    draw_calls : int
+        The number of draw calls since the last :meth:`reset`.
+    triangles : int
+        The number of triangles drawn since the last :meth:`reset`.
+    lines : int
+        The number of lines drawn since the last :meth:`reset`.
+    points : int
+        The number of points drawn since the last :meth:`reset`.
+    buffers : int
+        The number of live buffers.
+    buffer_bytes : int
+        The size of the live buffers, in bytes.
+
+    Notes
+    -----
+    The buffers are always counted, as they are only made and deleted when objects change.
+    The renderer resets the draw counts at the start of every frame, and enables them
+    while the performance overlay is shown.
+
+    See Also
+    --------
+    :class:`compas_viewer.components.renderer.PerformanceOverlay`
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.buffers = 0
+        self.buffer_bytes = 0
+        self._sizes: dict[int, int] = {}
+        self.reset()
+
+    def reset(self):
+        """Reset the draw counts."""
+        self.draw_calls = 0
+        self.triangles = 0
+        self.lines = 0
+        self.points = 0
+
+    def draw(self, mode: int, n: int):
+        """Count a draw call.
+
+        Parameters
+        ----------
+        mode : int
+            The primitive type, ``GL_TRIANGLES``, ``GL_LINES`` or ``GL_POINTS``.
+        n : int
+            The number of elements drawn.
+        """
+        self.draw_calls += 1
+        if mode == GL.GL_TRIANGLES:
+            self.triangles += n // 3
+        elif mode == GL.GL_LINES:
+            self.lines += n // 2
+        else:
+            self.points += n
+
+    def allocated(self, buffer: int, size: int):
+        """Count a new buffer.
+
+        Parameters
+        ----------
+        buffer : int
+            The ID of the buffer.
+        size : int
+            The size of the buffer, in bytes.
+        """
+        self.buffers += 1
+        self.buffer_bytes += size
+        self._sizes[int(buffer)] = size
+
+    def released(self, buffers):
+        """Forget deleted buffers.
+
+        Parameters
+        ----------
+        buffers : list[int]
+            The IDs of the buffers.
+        """
+        for buffer in buffers:
+            size = self._sizes.pop(int(buffer), None)
+            if size is not None:
+                self.buffers -= 1
+                self.buffer_bytes -= size
+
+
+glcounters = GLCounters()
+
+
 def make_vertex_buffer(data, dynamic=False):
     """Make a vertex buffer from the given data.
 
     Parameters
     ----------
-    data : list[float]
-        A flat list of floats.
+    data : list[float] | ndarray
+        A flat list of floats, or a NumPy array which is uploaded without copying it into Python objects.
     dynamic : bool, optional
         If True, the buffer is optimized for dynamic access.
 
@@ -54,13 +367,18 @@ def make_vertex_buffer(data, dynamic=False):
         Vertex buffer ID.
     """
     access = GL.GL_DYNAMIC_DRAW if dynamic else GL.GL_STATIC_DRAW
-    n = len(data)
-    size = n * ct.sizeof(ct.c_float)
+    if isinstance(data, ndarray):
+        data = ascontiguousarray(data, dtype=float32)
+        size = data.nbytes
+    else:
+        n = len(data)
+        size = n * ct.sizeof(ct.c_float)
+        data = (ct.c_float * n)(*data)
     vbo = GL.glGenBuffers(1)
-    data = (ct.c_float * n)(*data)
-    GL.glBindBuffer(GL.GL_ARRAY_BUFFER, vbo)
+    glstate.bind_buffer(GL.GL_ARRAY_BUFFER, vbo)
     GL.glBufferData(GL.GL_ARRAY_BUFFER, size, data, access)
-    GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+    glstate.bind_buffer(GL.GL_ARRAY_BUFFER, 0)
+    glcounters.allocated(vbo, size)
     return vbo
 
 
@@ -69,8 +387,8 @@ def make_index_buffer(data, dynamic=False):
 
     Parameters
     ----------
-    data : list[int]
-        A flat list of ints.
+    data : list[int] | ndarray
+        A flat list of ints, or a NumPy array which is uploaded without copying it into Python objects.
     dynamic : bool, optional
         If True, the buffer is optimized for dynamic access.
 
@@ -80,13 +398,18 @@ def make_index_buffer(data, dynamic=False):
         Element buffer ID.
     """
     access = GL.GL_DYNAMIC_DRAW if dynamic else GL.GL_STATIC_DRAW
-    n = len(data)
-    size = n * ct.sizeof(ct.c_uint)
+    if isinstance(data, ndarray):
+        data = ascontiguousarray(data, dtype=uint32)
+        size = data.nbytes
+    else:
+        n = len(data)
+        size = n * ct.sizeof(ct.c_uint)
+        data = (ct.c_int * n)(*data)
     vbo = GL.glGenBuffers(1)
-    data = (ct.c_int * n)(*data)
-    GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, vbo)
+    glstate.bind_buffer(GL.GL_ELEMENT_ARRAY_BUFFER, vbo)
     GL.glBufferData(GL.GL_ELEMENT_ARRAY_BUFFER, size, data, access)
-    GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, 0)
+    glstate.bind_buffer(GL.GL_ELEMENT_ARRAY_BUFFER, 0)
+    glcounters.allocated(vbo, size)
     return vbo
 
 
@@ -95,17 +418,21 @@ def update_vertex_buffer(data, buffer):
 
     Parameters
     ----------
-    data : list[float]
-        A flat list of floats.
+    data : list[float] | ndarray
+        A flat list of floats, or a NumPy array.
     buffer : int
         The ID of the buffer.
     """
-    n = len(data)
-    size = n * ct.sizeof(ct.c_float)
-    data = (ct.c_float * n)(*data)
-    GL.glBindBuffer(GL.GL_ARRAY_BUFFER, buffer)
+    if isinstance(data, ndarray):
+        data = ascontiguousarray(data, dtype=float32)
+        size = data.nbytes
+    else:
+        n = len(data)
+        size = n * ct.sizeof(ct.c_float)
+        data = (ct.c_float * n)(*data)
+    glstate.bind_buffer(GL.GL_ARRAY_BUFFER, buffer)
     GL.glBufferSubData(GL.GL_ARRAY_BUFFER, 0, size, data)
-    GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+    glstate.bind_buffer(GL.GL_ARRAY_BUFFER, 0)
 
 
 def update_index_buffer(data, buffer):
@@ -113,14 +440,58 @@ def update_index_buffer(data, buffer):
 
     Parameters
     ----------
-    data : list[int]
-        A flat list of ints.
+    data : list[int] | ndarray
+        A flat list of ints, or a NumPy array.
     buffer : int
         The ID of the buffer.
     """
-    n = len(data)
-    size = n * ct.sizeof(ct.c_uint)
-    data = (ct.c_int * n)(*data)
-    GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, buffer)
+    if isinstance(data, ndarray):
+        data = ascontiguousarray(data, dtype=uint32)
+        size = data.nbytes
+    else:
+        n = len(data)
+        size = n * ct.sizeof(ct.c_uint)
+        data = (ct.c_int * n)(*data)
+    glstate.bind_buffer(GL.GL_ELEMENT_ARRAY_BUFFER, buffer)
     GL.glBufferSubData(GL.GL_ELEMENT_ARRAY_BUFFER, 0, size, data)
-    GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, 0)
+    glstate.bind_buffer(GL.GL_ELEMENT_ARRAY_BUFFER, 0)
+
+
+def make_pixel_buffer(size):
+    """Make a pixel pack buffer, into which pixels are read back from a framebuffer without waiting for the GPU.
+
+    Parameters
+    ----------
+    size : int
+        The size of the buffer, in bytes.
+
+    Returns
+    -------
+    int
+        Pixel buffer ID.
+
+    Notes
+    -----
+    While the buffer is bound to ``GL_PIXEL_PACK_BUFFER``, ``glReadPixels`` copies the pixels into it and returns
+    at once. The pixels are read from the buffer with ``glMapBuffer`` later, when the copy is done.
+    """
+    pbo = GL.glGenBuffers(1)
+    GL.glBindBuffer(GL.GL_PIXEL_PACK_BUFFER, pbo)
+    GL.glBufferData(GL.GL_PIXEL_PACK_BUFFER, size, None, GL.GL_STREAM_READ)
+    GL.glBindBuffer(GL.GL_PIXEL_PACK_BUFFER, 0)
+    glcounters.allocated(pbo, size)
+    return pbo
+
+
+def delete_buffers(buffers):
+    """Delete vertex or element buffers and release their GPU memory.
+
+    Parameters
+    ----------
+    buffers : list[int]
+        The IDs of the buffers.
+    """
+    if buffers:
+        GL.glDeleteBuffers(len(buffers), buffers)
+        glstate.forget_buffers(buffers)
+        glcounters.released(buffers)
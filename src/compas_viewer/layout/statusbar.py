@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING
+from typing import Optional
 
 if TYPE_CHECKING:
     from .layout import Layout
@@ -44,7 +45,27 @@ class StatusbarLayout:
         self._statusbar.addWidget(self.statusText, 1)
 
         if self.config.show_fps:
-            # TODO
-            NotImplementedError("Status bar FPS not implemented yet")
-            # self.statusFps = QLabel("fps: ")
-            # self.statusbar.addWidget
+            self.statusFps = QLabel("fps: -")
+            self._statusbar.addPermanentWidget(self.statusFps)
+
+    def fps(self, fps: float, frametime: Optional[float] = None):
+        """
+        Show the frame rate of the renderer.
+
+        Parameters
+        ----------
+        fps : float
+            The number of frames per second.
+        frametime : float, optional
+            The mean CPU time of a frame, in milliseconds.
+
+        Notes
+        -----
+        This is called by :func:`compas_viewer.components.renderer.Renderer.paintGL` about once per second
+        while frames are painted. As frames are only painted when something changes,
+        the last rate stays shown while the view is still.
+        """
+        text = f"fps: {fps:.0f}"
+        if frametime is not None:
+            text += f" | frame: {frametime:.1f} ms"
+        self.statusFps.setText(text)
@@ -0,0 +1,404 @@
+"""
+Streaming readers for point files.
+
+Every reader is a generator which parses a file in chunks and yields ``(positions, colors)`` tuples,
+with the positions as a float32 array of shape (k, 3) and the colors as a uint8 RGBA array of shape (k, 4),
+or None if the file has no colors.
+Binary files are memory-mapped, such that only the chunk being parsed is read from disk.
+"""
+
+import struct
+from itertools import islice
+from pathlib import Path
+from typing import Callable
+from typing import Generator
+from typing import Optional
+from typing import Union
+
+from numpy import asarray
+from numpy import column_stack
+from numpy import dtype
+from numpy import float32
+from numpy import float64
+from numpy import full
+from numpy import load
+from numpy import loadtxt
+from numpy import memmap
+from numpy import ndarray
+from numpy import uint8
+
+PointChunk = tuple[ndarray, Optional[ndarray]]
+
+PLY_TYPES = {
+    "char": "i1",
+    "int8": "i1",
+    "uchar": "u1",
+    "uint8": "u1",
+    "short": "i2",
+    "int16": "i2",
+    "ushort": "u2",
+    "uint16": "u2",
+    "int": "i4",
+    "int32": "i4",
+    "uint": "u4",
+    "uint32": "u4",
+    "float": "f4",
+    "float32": "f4",
+    "double": "f8",
+    "float64": "f8",
+}
+
+# Byte offset of the RGB channels in the point records of the LAS point data formats.
+LAS_RGB_OFFSETS = {2: 20, 3: 28, 5: 28, 7: 30, 8: 30, 10: 30}
+
+
+def _color_maximum(columns: ndarray) -> int:
+    """Find the value of full intensity of the color columns of a file, from its first chunk with colors.
+
+    Returns 255 for 8-bit colors, 65535 for 16-bit colors, and 1 for floats in the range [0, 1].
+    The scale is found once per file, such that all chunks of a file are scaled alike.
+    """
+    columns = asarray(columns)
+    if columns.dtype == uint8:
+        return 255
+    if columns.dtype.kind in "iu":
+        return 65535 if columns.dtype.itemsize == 2 or columns.max(initial=0) > 255 else 255
+    if columns.max(initial=0) > 255:
+        return 65535
+    return 255 if columns.max(initial=0) > 1 else 1
+
+
+def _colors(columns: ndarray, maximum: int = 255) -> ndarray:
+    """Convert color columns of shape (k, 3) or (k, 4) to uint8 RGBA.
+
+    Parameters
+    ----------
+    columns : ndarray
+        The colors.
+    maximum : int, optional
+        The value of full intensity: 255 for 8-bit colors, 65535 for 16-bit colors, and 1 for floats in the range [0, 1].
+    """
+    columns = asarray(columns)
+    if columns.dtype == uint8:
+        rgba = columns
+    elif maximum == 65535:
+        rgba = (columns >> 8 if columns.dtype.kind in "iu" else columns.clip(0, 65535) / 257).astype(uint8)
+    elif maximum == 255:
+        rgba = columns.clip(0, 255).astype(uint8)
+    else:
+        rgba = (columns.clip(0, 1) * 255 + 0.5).astype(uint8)
+    if rgba.shape[1] == 3:
+        rgba = column_stack([rgba, full(len(rgba), 255, dtype=uint8)])
+    return rgba
+
+
+class _ColorScale:
+    """The value of full intensity of the colors of a file, found from its first chunk with colors."""
+
+    def __init__(self, maximum: Optional[int] = None):
+        self.maximum = maximum
+
+    def __call__(self, columns: ndarray) -> ndarray:
+        if self.maximum is None:
+            self.maximum = _color_maximum(columns)
+        return _colors(columns, self.maximum)
+
+
+def _split_columns(data: ndarray, colors: Optional[slice], scale: _ColorScale) -> PointChunk:
+    """Split a 2D array into XYZ positions and the optional RGB(A) colors in a slice of its columns."""
+    positions = asarray(data[:, :3], dtype=float32)
+    if colors is not None:
+        return positions, scale(data[:, colors])
+    return positions, None
+
+
+# ==========================================================================
+# PLY
+# ==========================================================================
+
+
+def _read_ply_header(path: Path) -> tuple[str, int, int, list[tuple[str, str]], int]:
+    """Parse the header of a PLY file.
+
+    Returns
+    -------
+    tuple[str, int, int, list[tuple[str, str]], int]
+        The format, the number of vertices, the number of header lines,
+        the names and NumPy types of the vertex properties, and the header size in bytes.
+    """
+    with open(path, "rb") as f:
+        if f.readline().strip() != b"ply":
+            raise ValueError(f"The file {path} is not a PLY file.")
+        fmt = ""
+        count = 0
+        lines = 1
+        properties: list[tuple[str, str]] = []
+        element = None
+        while True:
+            line = f.readline()
+            if not line:
+                raise ValueError(f"The PLY header of {path} has no end.")
+            lines += 1
+            words = line.decode("ascii", errors="replace").split()
+            if not words:
+                continue
+            if words[0] == "format":
+                fmt = words[1]
+            elif words[0] == "element":
+                element = words[1]
+                if element == "vertex":
+                    count = int(words[2])
+                elif not count:
+                    raise ValueError(f"The PLY file {path} has elements before the vertices, which is not supported.")
+            elif words[0] == "property" and element == "vertex":
+                if words[1] == "list":
+                    raise ValueError(f"The PLY file {path} has list properties on vertices, which is not supported.")
+                properties.append((words[2], PLY_TYPES[words[1]]))
+            elif words[0] == "end_header":
+                return fmt, count, lines, properties, f.tell()
+
+
+def read_ply(path: Union[str, Path], chunksize: int = 1_000_000) -> Generator[PointChunk, None, None]:
+    """Read the vertices of a binary or ASCII PLY file in chunks.
+
+    Parameters
+    ----------
+    path : str | :class:`pathlib.Path`
+        The path to the file.
+    chunksize : int, optional
+        The number of points per chunk.
+
+    Yields
+    ------
+    tuple[ndarray, ndarray | None]
+        The positions and RGBA colors of the points in the chunk.
+    """
+    path = Path(path)
+    fmt, count, lines, properties, offset = _read_ply_header(path)
+    names = [name for name, _ in properties]
+    color_names = [name for name in ("red", "green", "blue", "alpha") if name in names]
+    if len(color_names) < 3:
+        color_names = [name for name in ("r", "g", "b", "a") if name in names]
+
+    scale = _ColorScale()
+    if fmt == "ascii":
+        xyz = [names.index(name) for name in "xyz"]
+        rgb = [names.index(name) for name in color_names] if len(color_names) >= 3 else None
+        with open(path, "r") as f:
+            rows = islice(f, lines, None)
+            remaining = count
+            while remaining > 0:
+                chunk = loadtxt(islice(rows, min(chunksize, remaining)), dtype=float64, ndmin=2)
+                if not len(chunk):
+                    break
+                remaining -= len(chunk)
+                colors = scale(chunk[:, rgb].astype(properties[rgb[0]][1])) if rgb else None
+                yield asarray(chunk[:, xyz], dtype=float32), colors
+        return
+
+    if fmt not in ("binary_little_endian", "binary_big_endian"):
+        raise ValueError(f"The PLY format {fmt} is not supported.")
+    order = "<" if fmt == "binary_little_endian" else ">"
+    vertices = memmap(path, dtype=dtype([(name, order + t) for name, t in properties]), mode="r", offset=offset, shape=(count,))
+    for start in range(0, count, chunksize):
+        chunk = vertices[start : start + chunksize]  # noqa: E203
+        positions = column_stack([chunk["x"], chunk["y"], chunk["z"]]).astype(float32)
+        colors = scale(column_stack([chunk[name] for name in color_names])) if len(color_names) >= 3 else None
+        yield positions, colors
+
+
+# ==========================================================================
+# XYZ / CSV
+# ==========================================================================
+
+
+def read_xyz(path: Union[str, Path], chunksize: int = 1_000_000) -> Generator[PointChunk, None, None]:
+    """Read an XYZ, TXT, CSV or PTS point file in chunks.
+
+    Every line holds the coordinates of one point, optionally followed by its color,
+    separated by whitespace, commas or semicolons. With six columns, the color is RGB.
+    With seven columns, the fourth is the intensity, as in PTS files, and the color is in the last three.
+    A non-numeric header line, or a first line with the number of points, is skipped.
+    The colors are 8-bit, 16-bit or floats in the range [0, 1], as found from the first chunk.
+
+    Parameters
+    ----------
+    path : str | :class:`pathlib.Path`
+        The path to the file.
+    chunksize : int, optional
+        The number of points per chunk.
+
+    Yields
+    ------
+    tuple[ndarray, ndarray | None]
+        The positions and RGBA colors of the points in the chunk.
+    """
+    scale = _ColorScale()
+    with open(path, "r") as f:
+        first = f.readline()
+        delimiter = "," if "," in first else ";" if ";" in first else None
+        try:
+            values = [float(word) for word in first.split(delimiter)]
+            pending = [first] if len(values) > 1 else []
+        except ValueError:
+            pending = []
+        colors = None
+        while True:
+            rows = pending + list(islice(f, chunksize - len(pending)))
+            pending = []
+            if not rows:
+                break
+            data = loadtxt(rows, dtype=float64, delimiter=delimiter, ndmin=2)
+            if colors is None and data.shape[1] >= 6:
+                colors = slice(4, 7) if data.shape[1] == 7 else slice(3, 6)
+            yield _split_columns(data, colors, scale)
+
+
+# ==========================================================================
+# NPY
+# ==========================================================================
+
+
+def read_npy(path: Union[str, Path], chunksize: int = 1_000_000) -> Generator[PointChunk, None, None]:
+    """Read a NumPy ``.npy`` point array in chunks.
+
+    The array has the shape (n, 3) with coordinates, or (n, 6) or (n, 7) with coordinates and RGB or RGBA colors.
+    It is memory-mapped, such that only the chunk being converted is read from disk.
+
+    Parameters
+    ----------
+    path : str | :class:`pathlib.Path`
+        The path to the file.
+    chunksize : int, optional
+        The number of points per chunk.
+
+    Yields
+    ------
+    tuple[ndarray, ndarray | None]
+        The positions and RGBA colors of the points in the chunk.
+    """
+    data = load(path, mmap_mode="r")
+    if data.ndim != 2 or data.shape[1] < 3:
+        raise ValueError(f"Expected an array of shape (n, 3), (n, 6) or (n, 7) in {path}, got {data.shape}.")
+    colors = slice(3, 7) if data.shape[1] >= 6 else None
+    scale = _ColorScale()
+    for start in range(0, len(data), chunksize):
+        yield _split_columns(data[start : start + chunksize], colors, scale)  # noqa: E203
+
+
+# ==========================================================================
+# LAS
+# ==========================================================================
+
+
+def read_las(path: Union[str, Path], chunksize: int = 1_000_000) -> Generator[PointChunk, None, None]:
+    """Read an uncompressed LAS file in chunks.
+
+    Parameters
+    ----------
+    path : str | :class:`pathlib.Path`
+        The path to the file.
+    chunksize : int, optional
+        The number of points per chunk.
+
+    Yields
+    ------
+    tuple[ndarray, ndarray | None]
+        The positions and RGBA colors of the points in the chunk.
+
+    Notes
+    -----
+    Compressed LAZ files are not supported.
+
+    References
+    ----------
+    * https://www.asprs.org/wp-content/uploads/2019/07/LAS_1_4_r15.pdf
+    """
+    with open(path, "rb") as f:
+        header = f.read(375)
+    if header[:4] != b"LASF":
+        raise ValueError(f"The file {path} is not a LAS file.")
+    (offset,) = struct.unpack_from("<I", header, 96)
+    point_format = header[104] & 0x3F
+    (record_length,) = struct.unpack_from("<H", header, 105)
+    (count,) = struct.unpack_from("<I", header, 107)
+    if not count and len(header) >= 255:
+        (count,) = struct.unpack_from("<Q", header, 247)
+    scale = struct.unpack_from("<3d", header, 131)
+    origin = struct.unpack_from("<3d", header, 155)
+
+    fields = [("xyz", "<3i4", 0)]
+    if point_format in LAS_RGB_OFFSETS:
+        fields.append(("rgb", "<3u2", LAS_RGB_OFFSETS[point_format]))
+    records = memmap(
+        path,
+        dtype=dtype({"names": [n for n, _, _ in fields], "formats": [t for _, t, _ in fields], "offsets": [o for _, _, o in fields], "itemsize": record_length}),
+        mode="r",
+        offset=offset,
+        shape=(count,),
+    )
+    for start in range(0, count, chunksize):
+        chunk = records[start : start + chunksize]  # noqa: E203
+        positions = (chunk["xyz"] * asarray(scale) + asarray(origin)).astype(float32)
+        # The colors of LAS files are always 16-bit.
+        colors = _colors(chunk["rgb"], 65535) if "rgb" in records.dtype.names else None  # type: ignore
+        yield positions, colors
+
+
+POINT_READERS: dict[str, Callable[..., Generator[PointChunk, None, None]]] = {
+    ".ply": read_ply,
+    ".xyz": read_xyz,
+    ".txt": read_xyz,
+    ".csv": read_xyz,
+    ".pts": read_xyz,
+    ".npy": read_npy,
+    ".las": read_las,
+}
+
+
+def is_point_file(path: Union[str, Path]) -> bool:
+    """Check if a file can be read by one of the point readers.
+
+    Parameters
+    ----------
+    path : str | :class:`pathlib.Path`
+        The path to the file.
+
+    Returns
+    -------
+    bool
+    """
+    return Path(path).suffix.lower() in POINT_READERS
+
+
+def read_points(path: Union[str, Path], chunksize: int = 1_000_000) -> Generator[PointChunk, None, None]:
+    """Read a point file in chunks, with the reader matching its extension.
+
+    Parameters
+    ----------
+    path : str | :class:`pathlib.Path`
+        The path to the file.
+    chunksize : int, optional
+        The number of points per chunk.
+
+    Yields
+    ------
+    tuple[ndarray, ndarray | None]
+        The positions and RGBA colors of the points in the chunk.
+
+    Raises
+    ------
+    ValueError
+        If the extension of the file is not supported.
+
+    See Also
+    --------
+    :func:`compas_viewer.readers.read_ply`
+    :func:`compas_viewer.readers.read_xyz`
+    :func:`compas_viewer.readers.read_npy`
+    :func:`compas_viewer.readers.read_las`
+    """
+    reader = POINT_READERS.get(Path(path).suffix.lower())
+    if reader is None:
+        raise ValueError(f"The file {path} is not a supported point file: {', '.join(POINT_READERS)}.")
+    return reader(path, chunksize=chunksize)
@@ -33,6 +33,8 @@ from .meshobject import MeshObject
 from .graphobject import GraphObject
 from .pointobject import PointObject
 from .pointcloudobject import PointcloudObject
+from .lodpointcloudobject import LODPointcloudObject, LODPointcloud
+from .streamingpointcloudobject import StreamingPointcloudObject, StreamingPointcloud
 from .lineobject import LineObject
 from .vectorobject import VectorObject
 from .tagobject import TagObject, Tag
@@ -69,6 +71,8 @@ def register_scene_objects():
     register(Graph, GraphObject, context="Viewer")
     register(Point, PointObject, context="Viewer")
     register(Pointcloud, PointcloudObject, context="Viewer")
+    register(LODPointcloud, LODPointcloudObject, context="Viewer")
+    register(StreamingPointcloud, StreamingPointcloudObject, context="Viewer")
     register(Line, LineObject, context="Viewer")
     register(Tag, TagObject, context="Viewer")
     register(Frame, FrameObject, context="Viewer")
@@ -104,6 +108,11 @@ __all__ = [
     "MeshObject",
     "Point",
     "PointObject",
+    "PointcloudObject",
+    "LODPointcloud",
+    "LODPointcloudObject",
+    "StreamingPointcloud",
+    "StreamingPointcloudObject",
     "Line",
     "LineObject",
     "Tag",
@@ -31,11 +31,13 @@ class GraphObject(ViewerSceneObject, BaseGraphObject):
         colors = []
         elements = []
         i = 0
+        self._points_keys = []
 
         for node in self.graph.nodes():
             positions.append(self.graph.node_coordinates(node))
             colors.append(self.nodecolor.default)
             elements.append([i])
+            self._points_keys.append(node)
             i += 1
         return positions, colors, elements
 
@@ -44,6 +46,7 @@ class GraphObject(ViewerSceneObject, BaseGraphObject):
         colors = []
         elements = []
         i = 0
+        self._lines_keys = []
 
         for u, v in self.graph.edges():
             color = self.edgecolor.default
@@ -52,6 +55,7 @@ class GraphObject(ViewerSceneObject, BaseGraphObject):
             colors.append(color)
             colors.append(color)
             elements.append([i + 0, i + 1])
+            self._lines_keys.append((u, v))
             i += 2
         return positions, colors, elements
 
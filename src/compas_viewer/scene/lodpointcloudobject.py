@@ -0,0 +1,365 @@
+from collections import OrderedDict
+from threading import Thread
+from typing import Any
+from typing import Optional
+
+from numpy import arange
+from numpy import array
+from numpy import asarray
+from numpy import float32
+from numpy import ndarray
+from numpy import tile
+from PySide6.QtCore import QTimer
+
+from compas.geometry import Geometry
+from compas.geometry import transform_points_numpy
+from compas.scene import GeometryObject
+from compas_viewer.components.renderer.shaders import Shader
+from compas_viewer.gl import delete_buffers
+from compas_viewer.gl import make_index_buffer
+from compas_viewer.gl import make_vertex_buffer
+from compas_viewer.spatial import Octree
+from compas_viewer.spatial import frustum_planes
+
+from .sceneobject import ViewerSceneObject
+
+
+class LODPointcloud(Geometry):
+    """A point cloud stored in NumPy arrays, which is displayed through an octree level of detail.
+
+    Parameters
+    ----------
+    points : array-like, optional
+        The point coordinates, as an array of shape (n, 3).
+    colors : array-like, optional
+        The point colors, as an array of shape (n, 3) or (n, 4), either as uint8 or as floats in the range [0, 1].
+    octree : :class:`compas_viewer.spatial.Octree`, optional
+        A prebuilt octree, for example loaded from an on-disk index with :meth:`compas_viewer.spatial.Octree.load`.
+
+    Attributes
+    ----------
+    points : ndarray
+        The point coordinates.
+    colors : ndarray
+        The point colors.
+    octree : :class:`compas_viewer.spatial.Octree`
+        The octree over the points. None until it is built.
+
+    See Also
+    --------
+    :class:`compas_viewer.scene.LODPointcloudObject`
+    :class:`compas_viewer.spatial.Octree`
+    """
+
+    def __init__(self, points=None, colors=None, octree: Optional[Octree] = None, name: Optional[str] = None):
+        super().__init__(name=name)
+        if points is None and octree is None:
+            raise ValueError("Either points or an octree is required.")
+        self.points: Optional[ndarray] = None if points is None else asarray(points, dtype=float32)
+        self.colors: Optional[ndarray] = None if colors is None else asarray(colors)
+        self.octree = octree
+
+    @classmethod
+    def from_index(cls, path, mmap: bool = True) -> "LODPointcloud":
+        """Construct a point cloud from an on-disk octree index.
+
+        Parameters
+        ----------
+        path : str | :class:`pathlib.Path`
+            The folder of the index, as written by :meth:`compas_viewer.spatial.Octree.save`.
+        mmap : bool, optional
+            Memory-map the points, so that only the drawn nodes are read from disk.
+
+        Returns
+        -------
+        :class:`compas_viewer.scene.LODPointcloud`
+        """
+        return cls(octree=Octree.load(path, mmap=mmap))
+
+    @property
+    def bounds(self) -> ndarray:
+        """The min and max corners of the points, as an array of shape (2, 3)."""
+        if self.points is not None:
+            return array([self.points.min(axis=0), self.points.max(axis=0)])
+        return self.octree.bounds  # type: ignore
+
+    def transform(self, transformation):
+        """Transform the point cloud.
+
+        Parameters
+        ----------
+        transformation : :class:`compas.geometry.Transformation`
+            The transformation used to transform the geometry.
+
+        Notes
+        -----
+        The octree is discarded and has to be rebuilt.
+        For moving a point cloud in the viewer, prefer the ``transformation`` of the scene object.
+        """
+        if self.points is None:
+            self.points = self.octree.positions  # type: ignore
+            self.colors = self.octree.colors  # type: ignore
+        self.points = transform_points_numpy(self.points, transformation).astype(float32)
+        self.octree = None
+
+
+class LODPointcloudObject(ViewerSceneObject, GeometryObject):
+    """Viewer scene object for displaying huge point clouds with an octree level of detail.
+
+    Every frame, the octree nodes are selected against a screen-space error budget and a point budget.
+    The selected nodes are uploaded to the GPU on demand and kept in a least-recently-used cache.
+
+    Parameters
+    ----------
+    pointcloud : :class:`compas_viewer.scene.LODPointcloud`
+        The point cloud to display.
+    point_budget : int, optional
+        The maximum number of points drawn per frame.
+    error_budget : float, optional
+        The largest acceptable projected point spacing, in pixels.
+    cache_size : int, optional
+        The maximum number of points kept in GPU memory.
+    capacity : int, optional
+        The maximum number of points per octree node, used if the octree still has to be built.
+    pointcolor : :class:`compas.colors.Color`, optional
+        The color of the points if the point cloud has no colors.
+        Default is the value of `pointcolor` in `viewer.config`.
+    **kwargs : dict, optional
+        Additional options for the :class:`compas_viewer.scene.ViewerSceneObject`.
+
+    Attributes
+    ----------
+    nodes : list[int]
+        The octree nodes drawn in the last frame.
+    points_drawn : int
+        The number of points drawn in the last frame.
+
+    Notes
+    -----
+    If the point cloud has no octree yet, it is built in a background thread when the object is initialized.
+    Nothing is drawn until the octree is ready.
+
+    See Also
+    --------
+    :class:`compas_viewer.scene.PointcloudObject`
+    :class:`compas_viewer.spatial.Octree`
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from numpy.random import default_rng
+        from compas_viewer import Viewer
+        from compas_viewer.scene import LODPointcloud
+
+        viewer = Viewer()
+        points = default_rng(0).random((10_000_000, 3)) * 100
+        viewer.scene.add(LODPointcloud(points, colors=points / 100), point_budget=2_000_000)
+        viewer.show()
+    """
+
+    POINT_BUDGET = 1_000_000
+    ERROR_BUDGET = 1.0
+    CACHE_SIZE = 4_000_000
+    CAPACITY = 20_000
+
+    # The number of nodes uploaded per frame, to keep the interaction smooth while loading.
+    UPLOADS_PER_FRAME = 16
+
+    def __init__(
+        self,
+        pointcloud: LODPointcloud,
+        point_budget: Optional[int] = None,
+        error_budget: Optional[float] = None,
+        cache_size: Optional[int] = None,
+        capacity: Optional[int] = None,
+        **kwargs,
+    ):
+        super().__init__(geometry=pointcloud, **kwargs)
+        self.geometry: LODPointcloud
+        self.show_points = True
+        self.pointcolor = kwargs.get("pointcolor") or self.viewer.config.pointcolor
+        self.point_budget = point_budget or self.POINT_BUDGET
+        self.error_budget = error_budget or self.ERROR_BUDGET
+        self.cache_size = cache_size or self.CACHE_SIZE
+        self.capacity = capacity or self.CAPACITY
+
+        self.nodes: list[int] = []
+        self.points_drawn = 0
+        self._cache: OrderedDict[int, dict[str, Any]] = OrderedDict()
+        self._cached_points = 0
+        self._elements_buffer = None
+        self._build_thread: Optional[Thread] = None
+
+    @property
+    def octree(self) -> Optional[Octree]:
+        return self.geometry.octree
+
+    def _read_points_data(self):
+        return None
+
+    def _read_lines_data(self):
+        return None
+
+    def _read_frontfaces_data(self):
+        return None
+
+    def _read_backfaces_data(self):
+        return None
+
+    # ==========================================================================
+    # Octree
+    # ==========================================================================
+
+    def _build_octree(self):
+        self.geometry.octree = Octree.from_points(self.geometry.points, self.geometry.colors, capacity=self.capacity)
+
+    def init(self):
+        """Initialize the object and start building the octree in the background if necessary."""
+        self.clear_cache()
+        self._update_matrix()
+        self._update_bounding_box(list(self.geometry.bounds))
+        if self.octree is None and (self._build_thread is None or not self._build_thread.is_alive()):
+            self._build_thread = Thread(target=self._build_octree, daemon=True)
+            self._build_thread.start()
+
+    def select_nodes(self) -> list[int]:
+        """Select the octree nodes to draw for the current camera.
+
+        Returns
+        -------
+        list[int]
+            The selected nodes.
+        """
+        octree = self.octree
+        if octree is None:
+            return []
+
+        camera = self.renderer.camera
+        width = self.viewer.layout.config.window.width
+        height = self.viewer.layout.config.window.height
+
+        matrix = array(camera.projection(width, height)) @ array(camera.viewworld())
+        eye = array(camera.position)
+        if self.transformation is not None:
+            worldtransformation = array(self.worldtransformation.matrix)
+            matrix = matrix @ worldtransformation
+            eye = transform_points_numpy([eye], self.worldtransformation.inverted())[0]
+
+        self.nodes, self.points_drawn = octree.select(
+            eye,
+            camera.pixelscale(width, height),
+            self.point_budget,
+            error_budget=self.error_budget,
+            orthographic=self.renderer.viewmode != "perspective",
+            planes=frustum_planes(matrix),
+        )
+        return self.nodes
+
+    # ==========================================================================
+    # Cache
+    # ==========================================================================
+
+    def _node_buffer(self, node: int) -> dict[str, Any]:
+        """Upload the points of a node to the GPU."""
+        octree: Octree = self.octree  # type: ignore
+        positions = octree.node_positions(node)
+        colors = octree.node_colors(node)
+        if colors is None:
+            colors = tile(array(self.pointcolor.rgba, dtype=float32), (len(positions), 1))
+        else:
+            colors = asarray(colors, dtype=float32) / 255
+        return {
+            "positions": make_vertex_buffer(positions),
+            "colors": make_vertex_buffer(colors),
+            "n": len(positions),
+        }
+
+    def _cached_buffers(self, nodes: list[int]) -> list[dict[str, Any]]:
+        """Get the buffers of the nodes from the cache, uploading a limited number of missing nodes."""
+        buffers = []
+        uploads = 0
+        for node in nodes:
+            buffer = self._cache.get(node)
+            if buffer is None:
+                if uploads >= self.UPLOADS_PER_FRAME:
+                    continue
+                buffer = self._node_buffer(node)
+                self._cache[node] = buffer
+                self._cached_points += buffer["n"]
+                uploads += 1
+            else:
+                self._cache.move_to_end(node)
+            buffers.append(buffer)
+
+        if uploads:
+            self.scene.invalidate()
+        if self._elements_buffer is None:
+            self._elements_buffer = make_index_buffer(arange(int(self.octree.counts.max())))  # type: ignore
+
+        if len(buffers) < len(nodes):
+            # Keep loading in the next frames.
+            QTimer.singleShot(0, self.renderer.update)
+
+        self._evict(keep=len(buffers))
+        return buffers
+
+    def _evict(self, keep: int = 0):
+        """Evict the least recently used nodes until the cache fits in its size, but keep the last ``keep`` nodes."""
+        while self._cached_points > self.cache_size and len(self._cache) > keep:
+            _, buffer = self._cache.popitem(last=False)
+            self._cached_points -= buffer["n"]
+            delete_buffers([buffer["positions"], buffer["colors"]])
+
+    def clear_cache(self):
+        """Release all node buffers from the GPU."""
+        while self._cache:
+            _, buffer = self._cache.popitem()
+            delete_buffers([buffer["positions"], buffer["colors"]])
+        self._cached_points = 0
+        if self._elements_buffer is not None:
+            delete_buffers([self._elements_buffer])
+            self._elements_buffer = None
+
+    # ==========================================================================
+    # Draw
+    # ==========================================================================
+
+    def draw(self, shader: Shader, wireframe: bool, is_lighted: bool):
+        """Draw the selected octree nodes from their buffers."""
+        if self.octree is None:
+            # Check again once the octree is built.
+            QTimer.singleShot(100, self.renderer.update)
+            return
+        if not self.show_points:
+            return
+
+        buffers = self._cached_buffers(self.select_nodes())
+        shader.enable_attribute("position")
+        shader.enable_attribute("color")
+        shader.uniform1i("is_selected", self.is_selected)
+        shader.uniform4x4("transform", self.transform_buffer)
+        shader.uniform1i("is_lighted", False)
+        shader.uniform1f("object_opacity", self.opacity)
+        shader.uniform1i("element_type", 0)
+        for buffer in buffers:
+            shader.bind_attribute("position", buffer["positions"])
+            shader.bind_attribute("color", buffer["colors"], step=4)
+            shader.draw_points(size=self.pointssize, elements=self._elements_buffer, n=buffer["n"], background=self.background)
+        shader.disable_attribute("position")
+        shader.disable_attribute("color")
+
+    def draw_instance(self, shader, wireframe: bool):
+        """Draw the nodes of the last frame for picking."""
+        if self.octree is None or not self.show_points:
+            return
+        shader.enable_attribute("position")
+        shader.uniform3f("instance_color", self.instance_color.rgb)
+        shader.uniform4x4("transform", self.transform_buffer)
+        for node in self.nodes:
+            buffer = self._cache.get(node)
+            if buffer is None:
+                continue
+            shader.bind_attribute("position", buffer["positions"])
+            shader.draw_points(size=self.pointssize, elements=self._elements_buffer, n=buffer["n"])
+        shader.disable_attribute("position")
@@ -33,6 +33,12 @@ class MeshObject(ViewerSceneObject, BaseMeshObject):
         True to hide the coplanar edges. Defaults to the value of `hide_coplanaredges` in `viewer.config`.
     use_vertexcolors : bool, optional
         True to use vertex color. Defaults to the value of `use_vertexcolors` in `viewer.config`.
+    lod : bool, optional
+        True to draw the faces with a level-of-detail chain of simplified meshes,
+        built in the background with quadric error simplification. Defaults to False.
+    sort_triangles : bool, optional
+        True to sort the triangles back to front when the mesh is transparent,
+        for meshes which overlap themselves. Defaults to False.
     **kwargs : dict, optional
         Additional options for the :class:`compas_viewer.scene.ViewerSceneObject` and :class:`compas.scene.MeshObject`.
 
@@ -44,10 +50,15 @@ class MeshObject(ViewerSceneObject, BaseMeshObject):
         True to use vertex color. Defaults to False.
     hide_coplanaredges : bool
         True to hide the coplanar edges.
+    lod : bool
+        True to draw the faces with a level-of-detail chain.
+    sort_triangles : bool
+        True to sort the triangles back to front when the mesh is transparent.
 
     See Also
     --------
     :class:`compas.datastructures.Mesh`
+    :func:`compas_viewer.spatial.simplify_chain`
     """
 
     def __init__(
@@ -58,6 +69,8 @@ class MeshObject(ViewerSceneObject, BaseMeshObject):
         facecolor: Optional[ColorDictValueType] = None,
         hide_coplanaredges: Optional[bool] = None,
         use_vertexcolors: Optional[bool] = None,
+        lod: bool = False,
+        sort_triangles: bool = False,
         **kwargs,
     ):
         super().__init__(mesh=mesh, **kwargs)
@@ -66,6 +79,8 @@ class MeshObject(ViewerSceneObject, BaseMeshObject):
 
         self.hide_coplanaredges = hide_coplanaredges if hide_coplanaredges is not None else self.viewer.config.hide_coplanaredges
         self.use_vertexcolors = use_vertexcolors if use_vertexcolors is not None else self.viewer.config.use_vertexcolors
+        self.lod = lod
+        self.sort_triangles = sort_triangles
 
         if not vertexcolor:
             self.vertexcolor = self.viewer.config.pointcolor
@@ -93,11 +108,13 @@ class MeshObject(ViewerSceneObject, BaseMeshObject):
         colors = []
         elements = []
         i = 0
+        self._points_keys = []
 
         for vertex in self.mesh.vertices():
             positions.append(self.mesh.vertex_coordinates(vertex))
             colors.append(self.vertexcolor[vertex] or self.vertexcolor.default)  # type: ignore
             elements.append([i])
+            self._points_keys.append(vertex)
             i += 1
         return positions, colors, elements
 
@@ -106,6 +123,7 @@ class MeshObject(ViewerSceneObject, BaseMeshObject):
         colors = []
         elements = []
         i = 0
+        self._lines_keys = []
 
         for u, v in self.mesh.edges():
             color = self.edgecolor[(u, v)] or self.edgecolor.default  # type: ignore
@@ -125,6 +143,7 @@ class MeshObject(ViewerSceneObject, BaseMeshObject):
             colors.append(color)
             colors.append(color)
             elements.append([i + 0, i + 1])
+            self._lines_keys.append((u, v))
             i += 2
         return positions, colors, elements
 
@@ -133,6 +152,7 @@ class MeshObject(ViewerSceneObject, BaseMeshObject):
         colors = []
         elements = []
         i = 0
+        self._frontfaces_keys = []
 
         for face in self.mesh.faces():
             vertices = self.mesh.face_vertices(face)
@@ -151,6 +171,7 @@ class MeshObject(ViewerSceneObject, BaseMeshObject):
                     colors.append(color)
                     colors.append(color)
                 elements.append([i + 0, i + 1, i + 2])
+                self._frontfaces_keys.append(face)
                 i += 3
             elif len(vertices) == 4:
                 a, b, c, d = vertices
@@ -176,6 +197,7 @@ class MeshObject(ViewerSceneObject, BaseMeshObject):
                     colors.append(color)
                 elements.append([i + 0, i + 1, i + 2])
                 elements.append([i + 3, i + 4, i + 5])
+                self._frontfaces_keys += [face, face]
                 i += 6
             else:
                 points = [self.mesh.vertex_coordinates(vertex) for vertex in vertices]
@@ -193,6 +215,7 @@ class MeshObject(ViewerSceneObject, BaseMeshObject):
                         colors.append(color)
                         colors.append(color)
                     elements.append([i + 0, i + 1, i + 2])
+                    self._frontfaces_keys.append(face)
                     i += 3
 
         return positions, colors, elements
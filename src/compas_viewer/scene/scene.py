@@ -1,15 +1,29 @@
-from random import randint
-from random import seed
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Generator
 from typing import Optional
 from typing import Union
 
+from numpy import argsort
+from numpy import asarray
+from numpy import ascontiguousarray
+from numpy import bincount
+from numpy import concatenate
+from numpy import full
+from numpy import full_like
+from numpy import int64
+from numpy import nan
+from numpy import ndarray
+from numpy import uint8
+from numpy import zeros
+
 from compas.colors import Color
 from compas.datastructures import Datastructure
 from compas.geometry import Geometry
 from compas.scene import Scene
+from compas_viewer.spatial import BVH
+from compas_viewer.spatial import boxes_in_frustum
 
 from .sceneobject import ViewerSceneObject
 
@@ -17,38 +31,66 @@ if TYPE_CHECKING:
     from compas_viewer import Viewer
 
 
-def instance_colors_generator(i: int = 0) -> Generator:
+def instance_colors_generator(i: int = 1) -> Generator:
     """
-    Generate a set of non-repetitive random colors for instance colors.
+    Generate the instance colors of the objects, which encode sequential integer IDs in their RGB channels.
 
     Parameters
     ----------
     i : int, optional
-        Seed for the random number generator. Default is ``0``.
+        The first ID. Default is ``1``, as ``0`` (black) is reserved.
 
     Yields
     ------
     tuple of int
         A tuple of three integers representing the RGB color of the instance.
+
+    Raises
+    ------
+    RuntimeError
+        If all colors are used. White is never generated, as it is the default background.
+
+    See Also
+    --------
+    :func:`compas_viewer.scene.scene.instance_ids`
     """
+    while i < 0xFFFFFF:
+        yield (i >> 16 & 0xFF, i >> 8 & 0xFF, i & 0xFF)
+        i += 1
+    raise RuntimeError("All instance colors are used.")
+
 
-    dim = 255
-    seed(i)
-    existed = []
+def instance_ids(colors) -> ndarray:
+    """
+    Decode the integer IDs of instance colors.
 
-    while True:
-        n = randint(0, dim**3)
+    Parameters
+    ----------
+    colors : array-like
+        The RGB or RGBA colors as integers between 0 and 255, as an array of shape (n, 3) or (n, 4).
 
-        if n in existed:
-            continue
+    Returns
+    -------
+    ndarray
+        The IDs, as an array of shape (n,).
 
-        existed.append(n)
+    Examples
+    --------
+    >>> instance_ids([[0, 0, 1], [0, 1, 0], [1, 0, 0]]).tolist()
+    [1, 256, 65536]
+    """
+    colors = asarray(colors)
+    colors = colors.reshape(-1, colors.shape[-1])
+    if colors.dtype == uint8 and colors.shape[1] == 4:
+        # Read every RGBA pixel as one big-endian integer, dropping the alpha byte.
+        return (ascontiguousarray(colors).view(">u4").ravel() >> 8).astype(int64)
+    colors = colors.astype(int64)
+    return (colors[:, 0] << 16) | (colors[:, 1] << 8) | colors[:, 2]
 
-        r = n // dim**2
-        g = (n - r * dim**2) // dim
-        b = n - r * dim**2 - g * dim
 
-        yield (r, g, b)
+def _instance_id(rgb: tuple[int, int, int]) -> int:
+    """Decode the integer ID of a single instance color."""
+    return rgb[0] << 16 | rgb[1] << 8 | rgb[2]
 
 
 class ViewerScene(Scene):
@@ -64,6 +106,15 @@ class ViewerScene(Scene):
     context : str, optional
         The context of the scene.
 
+    Attributes
+    ----------
+    version : int
+        A counter incremented by :meth:`invalidate` whenever objects are added or removed,
+        shown or hidden, transformed or updated. Views of the scene which are expensive to
+        compute, such as the instance map of the selector, are cached until it changes.
+    batching : bool
+        Whether the updates of the objects are collected by :meth:`batch`.
+
     See Also
     --------
     :class:`compas.scene.Scene`
@@ -79,6 +130,22 @@ class ViewerScene(Scene):
         #  Selection
         self.instance_colors: dict[tuple[int, int, int], ViewerSceneObject] = {}
         self._instance_colors_generator = instance_colors_generator()
+        #  The lookup table of the instance IDs, and which of them are selectable.
+        self._instance_objects: ndarray = full(64, None, dtype=object)
+        self._instance_selectable: ndarray = zeros(64, dtype=bool)
+
+        #  Changes
+        self.version = 0
+
+        #  Batches
+        self._batch_depth = 0
+        self._batch: dict[ViewerSceneObject, tuple[bool, bool, bool]] = {}
+
+        #  Culling
+        self._bounds: ndarray = full((64, 2, 3), nan)
+        self._bounds_objects: list[ViewerSceneObject] = []
+        self._bvh: Optional[BVH] = None
+        self._bvh_outdated = False
 
     def add(
         self,
@@ -191,5 +258,407 @@ class ViewerScene(Scene):
             u=u,
             **kwargs,
         )
+        self.viewer.renderer.renderlists.add(sceneobject)
+        self.invalidate()
 
         return sceneobject
+
+    def remove(self, sceneobject: ViewerSceneObject):
+        """
+        Remove an object from the scene.
+
+        Parameters
+        ----------
+        sceneobject : :class:`compas_viewer.scene.ViewerSceneObject`
+            The object to remove, with its children.
+
+        Notes
+        -----
+        The removed objects are also dropped from the instance lookup table, the bounds table,
+        the uploads of the renderer and the pending updates of an open batch.
+        """
+        removed = [sceneobject]
+        for obj in removed:
+            removed += obj.children
+        super().remove(sceneobject)
+        for obj in removed:
+            self.viewer.renderer.renderlists.remove(obj)
+            self.viewer.renderer.uploads.pop(obj, None)
+            self.set_selectable(obj, False)
+            self._instance_objects[_instance_id(obj.instance_color.rgb255)] = None
+            self.remove_bounds(obj)
+            self._batch.pop(obj, None)
+        self.invalidate()
+
+    # ==========================================================================
+    # Instances
+    # ==========================================================================
+
+    def register_instance(self, sceneobject: ViewerSceneObject) -> Color:
+        """
+        Assign the next instance color to an object.
+
+        Parameters
+        ----------
+        sceneobject : :class:`compas_viewer.scene.ViewerSceneObject`
+            The object.
+
+        Returns
+        -------
+        :class:`compas.colors.Color`
+            The instance color, which encodes the ID of the object in the lookup table of the scene.
+        """
+        rgb = next(self._instance_colors_generator)
+        i = _instance_id(rgb)
+        while i >= len(self._instance_objects):
+            self._instance_objects = concatenate([self._instance_objects, full(len(self._instance_objects), None, dtype=object)])
+            self._instance_selectable = concatenate([self._instance_selectable, zeros(len(self._instance_selectable), dtype=bool)])
+        self._instance_objects[i] = sceneobject
+        sceneobject.instance_color = Color.from_rgb255(*rgb)
+        self.set_selectable(sceneobject, not sceneobject.is_locked)
+        return sceneobject.instance_color
+
+    def set_selectable(self, sceneobject: ViewerSceneObject, selectable: bool):
+        """
+        Add an object to, or remove it from, the selectable instances.
+
+        Parameters
+        ----------
+        sceneobject : :class:`compas_viewer.scene.ViewerSceneObject`
+            The object.
+        selectable : bool
+            Whether the object can be selected.
+        """
+        rgb = sceneobject.instance_color.rgb255
+        self._instance_selectable[_instance_id(rgb)] = selectable
+        if selectable:
+            self.instance_colors[rgb] = sceneobject
+        else:
+            self.instance_colors.pop(rgb, None)
+
+    def instance_objects(self, colors, min_count: int = 0) -> list[ViewerSceneObject]:
+        """
+        Find the selectable objects of the pixels of an instance map.
+
+        Parameters
+        ----------
+        colors : array-like
+            The colors of the pixels, as an array of shape (n, 3) or (n, 4).
+        min_count : int, optional
+            Objects covering this number of pixels or less are ignored.
+
+        Returns
+        -------
+        list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The selectable objects, sorted by the number of pixels they cover, the most first.
+
+        Notes
+        -----
+        The pixels are decoded to IDs at once, counted with :func:`numpy.bincount` and looked up in a table,
+        which takes a few milliseconds even for a full view of a scene with a hundred thousand objects.
+        """
+        n = len(self._instance_objects)
+        ids = instance_ids(colors)
+        ids[ids >= n] = 0
+        counts = bincount(ids, minlength=n)
+        ids = ((counts > min_count) & self._instance_selectable).nonzero()[0]
+        ids = ids[argsort(-counts[ids], kind="stable")]
+        return self._instance_objects[ids].tolist()
+
+    def invalidate(self):
+        """
+        Mark the scene as changed, such that the cached views of it are recomputed.
+
+        See Also
+        --------
+        :attr:`compas_viewer.scene.ViewerScene.version`
+        """
+        self.version += 1
+
+    # ==========================================================================
+    # Batches
+    # ==========================================================================
+
+    @property
+    def batching(self) -> bool:
+        return self._batch_depth > 0
+
+    @contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        """
+        Collect the updates of the objects in a block, and apply them together when it exits.
+
+        Yields
+        ------
+        None
+
+        Notes
+        -----
+        Repeated updates of the same object are merged, with the union of what they update,
+        so the data of every object is flattened and uploaded once. The buffers are uploaded in one pass
+        when the outermost block exits, even if it exits with an exception, followed by one change of
+        :attr:`version` and one repaint request. Nested blocks are merged into the outermost one.
+
+        Examples
+        --------
+        >>> with viewer.scene.batch():  # doctest: +SKIP
+        ...     for obj in viewer.scene.objects:
+        ...         obj.transformation = step
+        ...         obj.update(update_colors=False, update_elements=False)
+
+        See Also
+        --------
+        :func:`compas_viewer.scene.ViewerSceneObject.update`
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def defer_update(self, obj: ViewerSceneObject, update_positions: bool, update_colors: bool, update_elements: bool) -> bool:
+        """
+        Collect the update of an object, if a batch is open.
+
+        Parameters
+        ----------
+        obj : :class:`compas_viewer.scene.ViewerSceneObject`
+            The updated object.
+        update_positions : bool
+            Whether to update the positions of the object.
+        update_colors : bool
+            Whether to update the colors of the object.
+        update_elements : bool
+            Whether to update the elements of the object.
+
+        Returns
+        -------
+        bool
+            Whether the update is deferred to the end of the batch.
+        """
+        if not self.batching:
+            return False
+        positions, colors, elements = self._batch.get(obj, (False, False, False))
+        self._batch[obj] = (positions or update_positions, colors or update_colors, elements or update_elements)
+        return True
+
+    def flush(self):
+        """
+        Apply the updates collected by the open batch, and request one repaint.
+
+        Notes
+        -----
+        If the update of an object raises an exception, the updates of the other objects
+        and the repaint request are still applied, and the first exception is raised afterwards.
+
+        See Also
+        --------
+        :func:`compas_viewer.scene.ViewerScene.batch`
+        """
+        batch, self._batch = self._batch, {}
+        if not batch:
+            return
+        error: Optional[Exception] = None
+        for obj, (update_positions, update_colors, update_elements) in batch.items():
+            try:
+                obj.update_buffers(update_positions, update_colors, update_elements)
+            except Exception as e:
+                error = error or e
+        self.invalidate()
+        self.viewer.renderer.update()
+        if error is not None:
+            raise error
+
+    # ==========================================================================
+    # Bounds
+    # ==========================================================================
+
+    def update_bounds(self, obj: ViewerSceneObject, bounds: ndarray):
+        """
+        Store the world-space bounding box of an object in the bounds table of the scene.
+
+        Parameters
+        ----------
+        obj : :class:`compas_viewer.scene.ViewerSceneObject`
+            The object.
+        bounds : ndarray
+            The min and max corners of the bounding box, as an array of shape (2, 3).
+
+        Notes
+        -----
+        The table holds the boxes of all objects in one array,
+        such that they can be tested against the view frustum at once.
+        """
+        if obj._bounds_index is None:
+            obj._bounds_index = len(self._bounds_objects)
+            self._bounds_objects.append(obj)
+            if obj._bounds_index >= len(self._bounds):
+                self._bounds = concatenate([self._bounds, full_like(self._bounds, nan)])
+        self._bounds[obj._bounds_index] = bounds
+        self._bvh_outdated = True
+
+    def remove_bounds(self, obj: ViewerSceneObject):
+        """
+        Remove the bounding box of an object from the bounds table of the scene.
+
+        Parameters
+        ----------
+        obj : :class:`compas_viewer.scene.ViewerSceneObject`
+            The object.
+
+        Notes
+        -----
+        The last row of the table is moved into the row of the object, such that the table stays dense,
+        and the hierarchy is rebuilt at the next query.
+        """
+        i = obj._bounds_index
+        if i is None:
+            return
+        last = self._bounds_objects.pop()
+        if last is not obj:
+            self._bounds_objects[i] = last
+            last._bounds_index = i
+            self._bounds[i] = self._bounds[len(self._bounds_objects)]
+        self._bounds[len(self._bounds_objects)] = nan
+        obj._bounds_index = None
+        self._bvh = None
+
+    def bounds_centers(self, objs: list[ViewerSceneObject]) -> ndarray:
+        """
+        The centers of the world-space bounding boxes of objects, from the bounds table of the scene.
+
+        Parameters
+        ----------
+        objs : list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The objects.
+
+        Returns
+        -------
+        ndarray
+            The centers, as an array of shape (n, 3), with NaN for the objects without a bounding box.
+        """
+        centers = full((len(objs), 3), nan)
+        indices = [(i, obj._bounds_index) for i, obj in enumerate(objs) if obj._bounds_index is not None]
+        if indices:
+            rows, table = zip(*indices)
+            centers[list(rows)] = self._bounds[list(table)].mean(axis=1)
+        return centers
+
+    def cull(self, planes: ndarray) -> ndarray:
+        """
+        Test the bounding boxes of all objects against the planes of a view frustum.
+
+        Parameters
+        ----------
+        planes : ndarray
+            The inward facing planes of the frustum, as an array of shape (6, 4).
+
+        Returns
+        -------
+        ndarray
+            A boolean array indexed by the ``_bounds_index`` of the objects, False for the objects outside the frustum.
+
+        See Also
+        --------
+        :func:`compas_viewer.spatial.boxes_in_frustum`
+        """
+        return boxes_in_frustum(self._bounds[: len(self._bounds_objects)], planes)
+
+    @property
+    def bvh(self) -> BVH:
+        """
+        The bounding volume hierarchy over the world-space bounding boxes of the objects.
+
+        The hierarchy is rebuilt when objects were added,
+        and refitted when the boxes of the existing objects have changed.
+
+        Returns
+        -------
+        :class:`compas_viewer.spatial.BVH`
+        """
+        n = len(self._bounds_objects)
+        if self._bvh is None or len(self._bvh) != n:
+            # The hierarchy keeps a view on the table, such that a refit sees the updated boxes.
+            self._bvh = BVH(self._bounds[:n])
+        elif self._bvh_outdated:
+            self._bvh.refit()
+        self._bvh_outdated = False
+        return self._bvh
+
+    def query_box(self, lo, hi) -> list[ViewerSceneObject]:
+        """
+        Find the objects whose bounding boxes overlap a box.
+
+        Parameters
+        ----------
+        lo : array-like
+            The min corner of the box.
+        hi : array-like
+            The max corner of the box.
+
+        Returns
+        -------
+        list[:class:`compas_viewer.scene.ViewerSceneObject`]
+        """
+        return [self._bounds_objects[i] for i in self.bvh.query_box(lo, hi)]
+
+    def query_frustum(self, planes) -> list[ViewerSceneObject]:
+        """
+        Find the objects whose bounding boxes are (partly) inside a frustum.
+
+        Parameters
+        ----------
+        planes : array-like
+            The inward facing planes of the frustum, as an array of shape (k, 4).
+
+        Returns
+        -------
+        list[:class:`compas_viewer.scene.ViewerSceneObject`]
+
+        See Also
+        --------
+        :func:`compas_viewer.spatial.frustum_planes`
+        """
+        return [self._bounds_objects[i] for i in self.bvh.query_frustum(planes)]
+
+    def query_ray(self, origin, direction, pad: float = 0.0) -> list[ViewerSceneObject]:
+        """
+        Find the objects whose bounding boxes are hit by a ray.
+
+        Parameters
+        ----------
+        origin : array-like
+            The start point of the ray.
+        direction : array-like
+            The direction of the ray.
+        pad : float, optional
+            The distance by which the bounding boxes are inflated.
+
+        Returns
+        -------
+        list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The objects, sorted by the distance along the ray at which it enters their bounding boxes.
+        """
+        items, _ = self.bvh.query_ray(origin, direction, pad=pad)
+        return [self._bounds_objects[i] for i in items]
+
+    def nearest(self, point, k: int = 1) -> list[ViewerSceneObject]:
+        """
+        Find the objects whose bounding boxes are nearest to a point.
+
+        Parameters
+        ----------
+        point : array-like
+            The query point.
+        k : int, optional
+            The number of objects to find.
+
+        Returns
+        -------
+        list[:class:`compas_viewer.scene.ViewerSceneObject`]
+            The objects, sorted by the distance from the point to their bounding boxes.
+        """
+        items, _ = self.bvh.nearest(point, k=k)
+        return [self._bounds_objects[i] for i in items]
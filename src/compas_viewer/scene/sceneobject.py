@@ -1,10 +1,23 @@
+import time
+from threading import Thread
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Literal
 from typing import Optional
 
+from numpy import arange
 from numpy import array
 from numpy import average
+from numpy import concatenate
+from numpy import cos
+from numpy import float32
+from numpy import float64
 from numpy import identity
+from numpy import int64
+from numpy import ndarray
+from numpy.linalg import norm
+from OpenGL import GL
+from PySide6.QtCore import QTimer
 
 from compas.colors import Color
 from compas.geometry import Point
@@ -13,10 +26,15 @@ from compas.geometry import transform_points_numpy
 from compas.itertools import flatten
 from compas.scene import SceneObject
 from compas_viewer.components.renderer.shaders import Shader
+from compas_viewer.gl import delete_buffers
+from compas_viewer.gl import glstate
 from compas_viewer.gl import make_index_buffer
 from compas_viewer.gl import make_vertex_buffer
 from compas_viewer.gl import update_index_buffer
 from compas_viewer.gl import update_vertex_buffer
+from compas_viewer.spatial import BVH
+from compas_viewer.spatial import primitive_boxes
+from compas_viewer.spatial import simplify_chain
 
 if TYPE_CHECKING:
     from compas_viewer import Viewer
@@ -25,6 +43,9 @@ if TYPE_CHECKING:
 # Type template of point/line/face data for generating the buffers.
 ShaderDataType = tuple[list[Point], list[Color], list[list[int]]]
 
+# The transform of objects without transformation.
+IDENTITY = identity(4, dtype=float32).flatten()
+
 
 class ViewerSceneObject(SceneObject):
     """
@@ -80,15 +101,46 @@ class ViewerSceneObject(SceneObject):
     background : bool
         Whether the object is drawn on the background with depth test disabled.
     bounding_box : list[float], read-only
-        The min and max corners of object bounding box, as a numpy array of shape (2, 3).
+        The min and max corners of the world-space axis-aligned bounding box of the object, as a numpy array of shape (2, 3).
+        It is updated when the transformation of the object changes.
     bounding_box_center : :class:`compas.geometry.Point`, read-only
         The center of object bounding box, as a point.
+    transform_buffer : ndarray, read-only
+        The flattened float32 matrix of the transformation of the object, set as the ``transform`` uniform of every draw.
+    lod : bool
+        Whether the faces are drawn with a level-of-detail chain of simplified meshes.
+    lod_level : int
+        The level of detail drawn in the last frame, 0 being the full resolution.
+    sort_triangles : bool
+        Whether the frontface triangles are sorted back to front when the object is transparent.
+
+    Notes
+    -----
+    The level-of-detail chain is built in a background thread from the frontfaces data,
+    and built again only when the data is read again, for example by :meth:`init`.
+    A coarser level is drawn when the projected diameter of the bounding box is smaller than
+    ``LOD_PIXELS * sqrt(LOD_RATIO) ** level`` pixels, which keeps the number of triangles per pixel roughly constant.
+    The thresholds are widened by ``LOD_HYSTERESIS`` in the direction of the switch to avoid popping.
+    Points and lines are only drawn at full resolution.
+
+    The triangles of a transparent object with ``sort_triangles`` are sorted by the depth of their centroids
+    in a background thread, when the view direction has turned by more than ``TRIANGLE_SORT_ANGLE`` radians
+    since the last sort, and at most once every ``TRIANGLE_SORT_INTERVAL`` seconds.
+    Only the element buffer of the sorted triangles is rewritten. They are drawn on both sides in one pass,
+    instead of the frontfaces and the backfaces in two passes.
 
     See Also
     --------
     :class:`compas.scene.SceneObject`
     """
 
+    LOD_LEVELS = 3
+    LOD_RATIO = 0.25
+    LOD_PIXELS = 400.0
+    LOD_HYSTERESIS = 0.15
+    TRIANGLE_SORT_ANGLE = 0.05
+    TRIANGLE_SORT_INTERVAL = 0.1
+
     def __init__(
         self,
         viewer: "Viewer",
@@ -105,10 +157,11 @@ class ViewerSceneObject(SceneObject):
         **kwargs,
     ):
         #  Basic
-        super().__init__(**kwargs)
+        # The scene is set first, since the setters of the display settings invalidate it.
         self.viewer = viewer
         self.scene = viewer.scene
         self.renderer = viewer.renderer
+        super().__init__(**kwargs)
         self.is_visible = is_visible
         self.show_points = self.viewer.config.show_points if show_points is None else show_points
         self.show_lines = self.viewer.config.show_lines if show_lines is None else show_lines
@@ -120,9 +173,7 @@ class ViewerSceneObject(SceneObject):
         #  Selection
         self._is_locked = is_locked
         self.is_selected = not is_locked and is_selected
-        self.instance_color = Color.from_rgb255(*next(self.scene._instance_colors_generator))
-        if not is_locked:
-            self.scene.instance_colors[self.instance_color.rgb255] = self
+        self.instance_color = self.scene.register_instance(self)
 
         #  Visual
         self.background: bool = False
@@ -130,9 +181,11 @@ class ViewerSceneObject(SceneObject):
 
         #  Geometric
         self.transformation: Optional[Transformation] = None
-        self._matrix_buffer: Optional[list[list[float]]] = None
+        self._matrix_buffer: Optional[ndarray] = None
         self._bounding_box: Optional[list[float]] = None
         self._bounding_box_center: Optional[Point] = None
+        self._local_bounding_box: Optional[ndarray] = None
+        self._bounds_index: Optional[int] = None
         self._is_collection = False
 
         #  Primitive
@@ -144,6 +197,108 @@ class ViewerSceneObject(SceneObject):
         self._lines_buffer: [dict[str, Any]] = None  # type: ignore
         self._frontfaces_buffer: [dict[str, Any]] = None  # type: ignore
         self._backfaces_buffer: [dict[str, Any]] = None  # type: ignore
+        self._positions_array: Optional[ndarray] = None
+
+        #  Picking
+        self._points_keys: Optional[list] = None
+        self._lines_keys: Optional[list] = None
+        self._frontfaces_keys: Optional[list] = None
+        self._pick_cache: dict[str, Optional[tuple[ndarray, BVH]]] = {}
+        self._primitives_cache: dict[str, Optional[ndarray]] = {}
+        self._element_buffers: dict[str, Optional[dict[str, Any]]] = {}
+        self._primitives_data: tuple = (None, None, None)
+
+        #  Level of detail
+        self.lod: bool = False
+        self.lod_level: int = 0
+        self._lod_chain: Optional[list] = None
+        self._lod_buffers: list[tuple[dict[str, Any], dict[str, Any]]] = []
+        self._lod_thread: Optional[Thread] = None
+        self._lod_data: Optional[ShaderDataType] = None
+        self._lod_generation: int = 0
+
+        #  Triangle sorting
+        self.sort_triangles: bool = False
+        self._sort_buffer: Optional[int] = None
+        self._sort_data: Optional[tuple[ndarray, ndarray]] = None
+        self._sort_result: Optional[ndarray] = None
+        self._sort_direction: Optional[ndarray] = None
+        self._sort_thread: Optional[Thread] = None
+        self._sort_time: float = 0.0
+        self._sort_generation: int = 0
+
+    @property
+    def is_visible(self) -> bool:
+        return self._is_visible
+
+    @is_visible.setter
+    def is_visible(self, value: bool):
+        self._is_visible = value
+        self.renderer.renderlists.set_visible(self, value)
+        self.scene.invalidate()
+
+    @property
+    def show_points(self) -> bool:
+        return self._show_points
+
+    @show_points.setter
+    def show_points(self, value: bool):
+        self._show_points = value
+        self.scene.invalidate()
+
+    @property
+    def show_lines(self) -> bool:
+        return self._show_lines
+
+    @show_lines.setter
+    def show_lines(self, value: bool):
+        self._show_lines = value
+        self.scene.invalidate()
+
+    @property
+    def show_faces(self) -> bool:
+        return self._show_faces
+
+    @show_faces.setter
+    def show_faces(self, value: bool):
+        self._show_faces = value
+        self.scene.invalidate()
+
+    @property
+    def lineswidth(self) -> float:
+        return self._lineswidth
+
+    @lineswidth.setter
+    def lineswidth(self, value: float):
+        self._lineswidth = value
+        self.scene.invalidate()
+
+    @property
+    def pointssize(self) -> float:
+        return self._pointssize
+
+    @pointssize.setter
+    def pointssize(self, value: float):
+        self._pointssize = value
+        self.scene.invalidate()
+
+    @property
+    def opacity(self) -> float:
+        return self._opacity
+
+    @opacity.setter
+    def opacity(self, value: float):
+        self._opacity = value
+        self.scene.invalidate()
+
+    @property
+    def background(self) -> bool:
+        return self._background
+
+    @background.setter
+    def background(self, value: bool):
+        self._background = value
+        self.scene.invalidate()
 
     @property
     def is_locked(self):
@@ -154,9 +309,7 @@ class ViewerSceneObject(SceneObject):
         self._is_locked = value
         if value:
             self.is_selected = False
-            self.scene.instance_colors.pop(self.instance_color.rgb255)
-        else:
-            self.scene.instance_colors[self.instance_color.rgb255] = self
+        self.scene.set_selectable(self, not value)
 
     @property
     def bounding_box(self):
@@ -166,6 +319,10 @@ class ViewerSceneObject(SceneObject):
     def bounding_box_center(self):
         return self._bounding_box_center
 
+    @property
+    def transform_buffer(self) -> ndarray:
+        return self._matrix_buffer if self._matrix_buffer is not None else IDENTITY
+
     # ==========================================================================
     # Reading geometric data, downstream classes should implement these properties.
     # ==========================================================================
@@ -193,7 +350,9 @@ class ViewerSceneObject(SceneObject):
     def _update_matrix(self):
         """Update the matrix from object's translation, rotation and scale"""
         if self.transformation is not None:
-            self._matrix_buffer = list(array(self.worldtransformation.matrix).flatten())
+            self._matrix_buffer = array(self.worldtransformation.matrix, dtype=float32).flatten()
+        self._update_world_bounding_box()
+        self.scene.invalidate()
 
         if self.children:
             for child in self.children:
@@ -293,8 +452,13 @@ class ViewerSceneObject(SceneObject):
         self._lines_data = self._read_lines_data()
         self._frontfaces_data = self._read_frontfaces_data()
         self._backfaces_data = self._read_backfaces_data()
+        self._positions_array = None
+        self.clear_primitives()
         self.make_buffers()
+        self.scene.invalidate()
         self._update_matrix()
+        if self.lod:
+            self.update_lod()
 
     def update(self, update_positions: bool = True, update_colors: bool = True, update_elements: bool = True):
         """Update the object.
@@ -307,10 +471,39 @@ class ViewerSceneObject(SceneObject):
             Whether to update colors of the object.
         update_elements : bool, optional
             Whether to update elements of the object.
+
+        Notes
+        -----
+        Within :func:`compas_viewer.scene.ViewerScene.batch`, the update is collected
+        and applied when the batch exits, together with the updates of the other objects.
         """
+        if self.scene.defer_update(self, update_positions, update_colors, update_elements):
+            return
+        self.update_buffers(update_positions, update_colors, update_elements)
+
+        #  Update the canvas.
+        self.scene.invalidate()
+        self.renderer.update()
+
+    def update_buffers(self, update_positions: bool = True, update_colors: bool = True, update_elements: bool = True):
+        """Update the matrix and the buffers of the object from its data, without requesting a repaint.
 
+        Parameters
+        ----------
+        update_positions : bool, optional
+            Whether to update positions of the object.
+        update_colors : bool, optional
+            Whether to update colors of the object.
+        update_elements : bool, optional
+            Whether to update elements of the object.
+        """
         # Update the matrix from object's translation, rotation and scale.
         self._update_matrix()
+        if update_positions or update_elements:
+            self.update_primitives()
+
+        if self.lod:
+            self.update_lod()
 
         # Update all buffers from object's data.
         if self._points_data is not None:
@@ -346,9 +539,6 @@ class ViewerSceneObject(SceneObject):
                 update_elements,
             )
 
-        #  Update the canvas.
-        self.renderer.update()
-
     def _update_bounding_box(self, positions: Optional[list[Point]] = None):
         """Update the bounding box of the object"""
         if positions is None:
@@ -363,38 +553,385 @@ class ViewerSceneObject(SceneObject):
                 return
 
         _positions = array(positions)
-        self._bounding_box = list(transform_points_numpy(array([_positions.min(axis=0), _positions.max(axis=0)]), self.worldtransformation))
-        self._bounding_box_center = Point(*list(average(a=array(self.bounding_box), axis=0)))
+        self._local_bounding_box = array([_positions.min(axis=0), _positions.max(axis=0)])
+        self._update_world_bounding_box()
+
+    def _update_world_bounding_box(self):
+        """Update the world-space bounding box from the local bounding box and the world transformation"""
+        if self._local_bounding_box is None:
+            return
+        lo, hi = self._local_bounding_box
+        corners = array([[x, y, z] for x in (lo[0], hi[0]) for y in (lo[1], hi[1]) for z in (lo[2], hi[2])])
+        corners = transform_points_numpy(corners, self.worldtransformation)
+        bounds = array([corners.min(axis=0), corners.max(axis=0)])
+        self._bounding_box = list(bounds)
+        self._bounding_box_center = Point(*list(average(a=bounds, axis=0)))
+        self.scene.update_bounds(self, bounds)
+
+    def positions_array(self) -> Optional[ndarray]:
+        """The local coordinates of all points, line vertices and face vertices of the object.
+
+        Returns
+        -------
+        ndarray | None
+            The coordinates as an array of shape (n, 3), or None if the object has no such data.
+            The array is cached until the data of the object is read again.
+        """
+        if self._positions_array is None:
+            positions = [data[0] for data in (self._points_data, self._lines_data, self._frontfaces_data) if data is not None and len(data[0])]
+            if not positions:
+                return None
+            self._positions_array = concatenate([array(p, dtype=float64).reshape(-1, 3) for p in positions])
+        return self._positions_array
+
+    def primitives(self, kind: Literal["point", "line", "face"]) -> Optional[ndarray]:
+        """The local coordinates of the points, lines or frontface triangles of the object.
+
+        Parameters
+        ----------
+        kind : Literal["point", "line", "face"]
+            The kind of primitives.
+
+        Returns
+        -------
+        ndarray | None
+            The primitives, as an array of shape (m, 2, 3) for points and lines,
+            where a point is a segment with identical end points, or of shape (m, 3, 3) for triangles.
+            None if the object has no such primitives.
+            The array is cached until the data of the object is read again.
+        """
+        if kind not in self._primitives_cache:
+            data = {"point": self._points_data, "line": self._lines_data, "face": self._frontfaces_data}[kind]
+            if data is None or not len(data[2]):
+                self._primitives_cache[kind] = None
+            else:
+                positions = array(data[0], dtype=float64).reshape(-1, 3)
+                elements = array(data[2], dtype=int64).reshape(len(data[2]), -1)
+                if kind == "point":
+                    elements = elements[:, [0, 0]]
+                self._primitives_cache[kind] = positions[elements]
+        return self._primitives_cache[kind]
+
+    def pick_primitives(self, kind: Literal["point", "line", "face"]) -> Optional[tuple[ndarray, BVH]]:
+        """The primitives of the object for ray picking, with a hierarchy over their bounds.
+
+        Parameters
+        ----------
+        kind : Literal["point", "line", "face"]
+            The kind of primitives: the points, the lines or the frontface triangles.
+
+        Returns
+        -------
+        tuple[ndarray, :class:`compas_viewer.spatial.BVH`] | None
+            The primitives, see :meth:`primitives`, and the hierarchy over their bounding boxes.
+            None if the object has no such primitives.
+            The hierarchy is built on first use and cached until the data of the object is read again.
+
+        See Also
+        --------
+        :class:`compas_viewer.components.renderer.RayCaster`
+        """
+        if kind not in self._pick_cache:
+            primitives = self.primitives(kind)
+            if primitives is None:
+                self._pick_cache[kind] = None
+            else:
+                # Large leaves keep the construction cheap, the primitives of a leaf are tested at once.
+                self._pick_cache[kind] = (primitives, BVH(primitive_boxes(primitives), leafsize=16))
+        return self._pick_cache[kind]
+
+    def update_primitives(self):
+        """Clear the cached primitives if the data of the object has been read again since they were cached.
+
+        Notes
+        -----
+        The primitives are in the coordinates of the object, so updates which only change the transformation
+        keep them, with their hierarchies and element buffers.
+        """
+        data = (self._points_data, self._lines_data, self._frontfaces_data)
+        if any(a is not b for a, b in zip(data, self._primitives_data)):
+            self._positions_array = None
+            self.clear_primitives()
+
+    def clear_primitives(self):
+        """Clear the cached primitives, their hierarchies and the element buffers, after the positions or elements have changed."""
+        self._primitives_data = (self._points_data, self._lines_data, self._frontfaces_data)
+        self._primitives_cache = {}
+        self._pick_cache = {}
+        buffers = [buffer for buffer in self._element_buffers.values() if buffer is not None]
+        self._element_buffers = {}
+        if buffers:
+            delete_buffers([b for buffer in buffers for b in (buffer["positions"], buffer["ids"], buffer["elements"])])
+        self._sort_generation += 1
+        self._sort_data = None
+        self._sort_result = None
+        self._sort_direction = None
+        if self._sort_buffer is not None:
+            delete_buffers([self._sort_buffer])
+            self._sort_buffer = None
+
+    def element_key(self, kind: Literal["point", "line", "face"], index: int) -> Any:
+        """The key of the element of the object which a picked primitive belongs to.
+
+        Parameters
+        ----------
+        kind : Literal["point", "line", "face"]
+            The kind of the primitive.
+        index : int
+            The index of the primitive in the point, line or frontface data.
+
+        Returns
+        -------
+        Any
+            The vertex, edge or face key for objects that record them, such as meshes, otherwise the index itself.
+        """
+        keys = {"point": self._points_keys, "line": self._lines_keys, "face": self._frontfaces_keys}[kind]
+        return keys[index] if keys is not None else index
+
+    def element_keys(self, kind: Literal["point", "line", "face"], indices) -> list:
+        """The keys of the elements which picked primitives belong to, without duplicates.
+
+        Parameters
+        ----------
+        kind : Literal["point", "line", "face"]
+            The kind of the primitives.
+        indices : array-like
+            The indices of the primitives in the point, line or frontface data.
+
+        Returns
+        -------
+        list
+            The vertex, edge or face keys in the order of their first primitive, see :meth:`element_key`.
+            Faces split into several triangles are only listed once.
+        """
+        keys = {"point": self._points_keys, "line": self._lines_keys, "face": self._frontfaces_keys}[kind]
+        indices = array(indices, dtype=int64).ravel().tolist()
+        if keys is None:
+            return list(dict.fromkeys(indices))
+        return list(dict.fromkeys([keys[i] for i in indices]))
+
+    # ==========================================================================
+    # level of detail
+    # ==========================================================================
+
+    def build_lod(self):
+        """Build the level-of-detail chain in a background thread, unless it is already built or being built.
+
+        Notes
+        -----
+        At most one build runs at a time. If the chain is cleared while it is being built,
+        the outdated chain is discarded and the build starts over once, from the current frontfaces data.
+        """
+        if self._lod_chain is not None or self._frontfaces_data is None or not len(self._frontfaces_data[2]):
+            return
+        self._lod_data = self._frontfaces_data
+        if self._lod_thread is not None and self._lod_thread.is_alive():
+            return
+        self._lod_thread = Thread(target=self._build_lod_chain, daemon=True)
+        self._lod_thread.start()
+
+    def _build_lod_chain(self):
+        while True:
+            generation = self._lod_generation
+            data = self._lod_data
+            if data is None:
+                return
+            positions, colors, elements = data
+            chain = simplify_chain(
+                array(positions, dtype=float64),
+                array(elements),
+                levels=self.LOD_LEVELS,
+                ratio=self.LOD_RATIO,
+                colors=array([color.rgba for color in colors]),
+            )
+            if generation == self._lod_generation:
+                self._lod_chain = chain
+                return
+
+    def update_lod(self):
+        """Rebuild the level-of-detail chain if the frontfaces data has been read again since it was built.
+
+        Notes
+        -----
+        Updates which only change the transformation keep the chain and its buffers.
+        """
+        if self._frontfaces_data is self._lod_data:
+            return
+        self.clear_lod()
+        self.build_lod()
+
+    def clear_lod(self):
+        """Discard the level-of-detail chain and release its buffers from the GPU."""
+        for frontfaces, backfaces in self._lod_buffers:
+            delete_buffers([frontfaces["positions"], frontfaces["colors"], frontfaces["elements"], backfaces["elements"]])
+        self._lod_buffers = []
+        self._lod_chain = None
+        self._lod_data = None
+        self._lod_generation += 1
+        self.lod_level = 0
+
+    def _upload_lod(self):
+        """Upload the levels of the chain which are built but have no buffers yet."""
+        for positions, triangles, colors in self._lod_chain[len(self._lod_buffers) :]:  # type: ignore # noqa: E203
+            # Unweld the triangles for flat shading, like the full resolution buffers.
+            positions = positions[triangles].reshape(-1, 3)
+            colors = colors[triangles].reshape(-1, colors.shape[1])
+            elements = arange(len(positions))
+            frontfaces = {
+                "positions": make_vertex_buffer(positions),
+                "colors": make_vertex_buffer(colors),
+                "elements": make_index_buffer(elements),
+                "n": len(elements),
+            }
+            backfaces = dict(frontfaces, elements=make_index_buffer(elements.reshape(-1, 3)[:, ::-1]))
+            self._lod_buffers.append((frontfaces, backfaces))
+
+    def select_lod_level(self) -> int:
+        """Select the level of detail for the current camera from the projected size of the bounding box.
+
+        Returns
+        -------
+        int
+            The level of detail, 0 being the full resolution.
+        """
+        if self._lod_chain is None or self._bounding_box is None:
+            self.lod_level = 0
+            return 0
+        if len(self._lod_buffers) < len(self._lod_chain):
+            self._upload_lod()
+
+        camera = self.renderer.camera
+        width = self.viewer.layout.config.window.width
+        height = self.viewer.layout.config.window.height
+        lo, hi = array(self._bounding_box)
+        diameter = float(((hi - lo) ** 2).sum() ** 0.5)
+        scale = camera.pixelscale(width, height)
+        if self.renderer.viewmode == "perspective":
+            distance = float((((lo + hi) / 2 - array(camera.position)) ** 2).sum() ** 0.5)
+            size = diameter * scale / max(distance - diameter / 2, 1e-9)
+        else:
+            size = diameter * scale
+
+        level = self.lod_level
+        step = self.LOD_RATIO**0.5
+        while level > 0 and size > self.LOD_PIXELS * step ** (level - 1) * (1 + self.LOD_HYSTERESIS):
+            level -= 1
+        while level < len(self._lod_buffers) and size < self.LOD_PIXELS * step**level * (1 - self.LOD_HYSTERESIS):
+            level += 1
+        self.lod_level = min(level, len(self._lod_buffers))
+        return self.lod_level
+
+    def _faces_buffers(self) -> tuple[Optional[dict[str, Any]], Optional[dict[str, Any]]]:
+        """The frontfaces and backfaces buffers of the current level of detail."""
+        if self.lod_level:
+            return self._lod_buffers[self.lod_level - 1]
+        return self._frontfaces_buffer, self._backfaces_buffer
+
+    def sorted_frontfaces(self) -> Optional[int]:
+        """The element buffer of the frontface triangles sorted back to front for the current view.
+
+        Returns
+        -------
+        int | None
+            The element buffer, or None if the object is opaque, is drawn at a coarser level of detail,
+            or if no sort has finished yet.
+
+        Notes
+        -----
+        A new sort is started in a background thread when the view direction has turned by more than
+        ``TRIANGLE_SORT_ANGLE`` since the last one, unless a sort is running or the last one started less than
+        ``TRIANGLE_SORT_INTERVAL`` seconds ago, in which case another frame is requested.
+        The result is uploaded in the next frame. Sorting is skipped in the "oit" render mode.
+        """
+        renderer = self.renderer
+        if self.lod_level or self._frontfaces_buffer is None or self._frontfaces_data is None or not len(self._frontfaces_data[2]):
+            return None
+        if self.opacity * renderer.opacity >= 1 or renderer.rendermode == "oit":
+            return None
+
+        result = self._sort_result
+        if result is not None:
+            self._sort_result = None
+            if self._sort_buffer is None:
+                self._sort_buffer = make_index_buffer(result)
+            else:
+                update_index_buffer(result, self._sort_buffer)
+
+        # The view direction in the coordinates of the object, the depth of a point being its dot product with it.
+        matrix = array(renderer.camera.viewworld(), dtype=float64) @ self.transform_buffer.reshape(4, 4)
+        direction = matrix[2, :3] / max(norm(matrix[2, :3]), 1e-12)
+        turned = self._sort_direction is None or float(direction @ self._sort_direction) < float(cos(self.TRIANGLE_SORT_ANGLE))
+        if self._sort_thread is not None and self._sort_thread.is_alive():
+            QTimer.singleShot(int(self.TRIANGLE_SORT_INTERVAL * 1000), renderer.update)
+        elif turned:
+            wait = self._sort_time + self.TRIANGLE_SORT_INTERVAL - time.perf_counter()
+            if wait > 0:
+                QTimer.singleShot(int(wait * 1000) + 1, renderer.update)
+            else:
+                self._sort_direction = direction
+                self._sort_time = time.perf_counter()
+                self._sort_thread = Thread(target=self._sort_triangles, args=(direction, self._sort_generation), daemon=True)
+                self._sort_thread.start()
+        return self._sort_buffer
+
+    def _sort_triangles(self, direction: ndarray, generation: int):
+        if self._sort_data is None:
+            triangles = array(self._frontfaces_data[2], dtype=int64).reshape(-1, 3)  # type: ignore
+            self._sort_data = (self.primitives("face").mean(axis=1), triangles)  # type: ignore
+        centroids, triangles = self._sort_data
+        # The view looks along -z, so the farthest triangles have the smallest depth.
+        order = (centroids @ direction).argsort(kind="stable")
+        if generation == self._sort_generation:
+            self._sort_result = triangles[order].ravel()
+
+    def pending_uploads(self) -> int:
+        """The number of results of background work which wait to be uploaded at the next draw.
+
+        Returns
+        -------
+        int
+            The levels of detail built but not uploaded, and the sorted triangles not uploaded.
+        """
+        pending = int(self._sort_result is not None)
+        if self._lod_chain is not None:
+            pending += len(self._lod_chain) - len(self._lod_buffers)
+        return pending
 
     def draw(self, shader: Shader, wireframe: bool, is_lighted: bool):
         """Draw the object from its buffers"""
         shader.enable_attribute("position")
         shader.enable_attribute("color")
         shader.uniform1i("is_selected", self.is_selected)
-        # Matrix
-        if self._matrix_buffer is not None:
-            shader.uniform4x4("transform", self._matrix_buffer)
+        shader.uniform4x4("transform", self.transform_buffer)
         shader.uniform1i("is_lighted", is_lighted)
         shader.uniform1f("object_opacity", self.opacity)
         shader.uniform1i("element_type", 2)
-        # Frontfaces
-        if self._frontfaces_buffer is not None and not wireframe and self.show_faces:
-            shader.bind_attribute("position", self._frontfaces_buffer["positions"])
-            shader.bind_attribute("color", self._frontfaces_buffer["colors"], step=4)
+        if self.lod:
+            self.select_lod_level()
+        frontfaces, backfaces = self._faces_buffers()
+        sorted_elements = self.sorted_frontfaces() if self.sort_triangles and not wireframe and self.show_faces else None
+        # Frontfaces, and their back sides if they are sorted
+        if frontfaces is not None and not wireframe and self.show_faces:
+            shader.bind_attribute("position", frontfaces["positions"])
+            shader.bind_attribute("color", frontfaces["colors"], step=4)
+            if sorted_elements is not None:
+                glstate.disable(GL.GL_CULL_FACE)
             shader.draw_triangles(
-                elements=self._frontfaces_buffer["elements"],
-                n=self._frontfaces_buffer["n"],
+                elements=frontfaces["elements"] if sorted_elements is None else sorted_elements,
+                n=frontfaces["n"],
                 background=self.background,
             )
+            if sorted_elements is not None:
+                glstate.enable(GL.GL_CULL_FACE)
         # Backfaces
-        if self._backfaces_buffer is not None and not wireframe and self.show_faces:
-            shader.bind_attribute("position", self._backfaces_buffer["positions"])
-            shader.bind_attribute("color", self._backfaces_buffer["colors"], step=4)
-            shader.draw_triangles(elements=self._backfaces_buffer["elements"], n=self._backfaces_buffer["n"], background=self.background)
+        if backfaces is not None and not wireframe and self.show_faces and sorted_elements is None:
+            shader.bind_attribute("position", backfaces["positions"])
+            shader.bind_attribute("color", backfaces["colors"], step=4)
+            shader.draw_triangles(elements=backfaces["elements"], n=backfaces["n"], background=self.background)
         shader.uniform1i("is_lighted", False)
         shader.uniform1i("element_type", 1)
         # Lines
-        if self._lines_buffer is not None and self.show_lines:
+        if self._lines_buffer is not None and self.show_lines and not self.lod_level:
             shader.bind_attribute("position", self._lines_buffer["positions"])
             shader.bind_attribute("color", self._lines_buffer["colors"], step=4)
             shader.draw_lines(
@@ -405,7 +942,7 @@ class ViewerSceneObject(SceneObject):
             )
         shader.uniform1i("element_type", 0)
         # Points
-        if self._points_buffer is not None and self.show_points:
+        if self._points_buffer is not None and self.show_points and not self.lod_level:
             shader.bind_attribute("position", self._points_buffer["positions"])
             shader.bind_attribute("color", self._points_buffer["colors"], step=4)
             shader.draw_points(
@@ -414,11 +951,6 @@ class ViewerSceneObject(SceneObject):
                 n=self._points_buffer["n"],
                 background=self.background,
             )
-        # Reset
-        shader.uniform1i("is_selected", 0)
-        shader.uniform1f("object_opacity", 1)
-        if self._matrix_buffer is not None:
-            shader.uniform4x4("transform", list(identity(4).flatten()))
         shader.disable_attribute("position")
         shader.disable_attribute("color")
 
@@ -426,31 +958,96 @@ class ViewerSceneObject(SceneObject):
         """Draw the object instance for picking"""
         shader.enable_attribute("position")
         shader.uniform3f("instance_color", self.instance_color.rgb)
-        # Matrix
-        if self._matrix_buffer is not None:
-            shader.uniform4x4("transform", self._matrix_buffer)
+        shader.uniform4x4("transform", self.transform_buffer)
         # Points
-        if self._points_buffer is not None and self.show_points:
+        if self._points_buffer is not None and self.show_points and not self.lod_level:
             shader.bind_attribute("position", self._points_buffer["positions"])
             shader.draw_points(size=self.pointssize, elements=self._points_buffer["elements"], n=self._points_buffer["n"])
         # Lines
-        if self._lines_buffer is not None and (self.show_lines or wireframe):
+        if self._lines_buffer is not None and (self.show_lines or wireframe) and not self.lod_level:
             shader.bind_attribute("position", self._lines_buffer["positions"])
             shader.draw_lines(
                 width=self.lineswidth + self.renderer.selector.PIXEL_SELECTION_INCREMENTAL,
                 elements=self._lines_buffer["elements"],
                 n=self._lines_buffer["n"],
             )
+        frontfaces, backfaces = self._faces_buffers()
         # Frontfaces
-        if self._frontfaces_buffer is not None and not wireframe and self.show_faces:
-            shader.bind_attribute("position", self._frontfaces_buffer["positions"])
-            shader.draw_triangles(elements=self._frontfaces_buffer["elements"], n=self._frontfaces_buffer["n"])
+        if frontfaces is not None and not wireframe and self.show_faces:
+            shader.bind_attribute("position", frontfaces["positions"])
+            shader.draw_triangles(elements=frontfaces["elements"], n=frontfaces["n"])
         # Backfaces
-        if self._backfaces_buffer is not None and not wireframe and self.show_faces:
-            shader.bind_attribute("position", self._backfaces_buffer["positions"])
-            shader.draw_triangles(elements=self._backfaces_buffer["elements"], n=self._backfaces_buffer["n"])
-        # Reset
-        if self._matrix_buffer is not None:
-            shader.uniform4x4("transform", identity(4).flatten())
-        shader.uniform3f("instance_color", [0, 0, 0])
+        if backfaces is not None and not wireframe and self.show_faces:
+            shader.bind_attribute("position", backfaces["positions"])
+            shader.draw_triangles(elements=backfaces["elements"], n=backfaces["n"])
+        shader.disable_attribute("position")
+
+    def element_buffer(self, kind: Literal["point", "line", "face"]) -> Optional[dict[str, Any]]:
+        """The buffers of the element ID map for one kind of primitives.
+
+        Parameters
+        ----------
+        kind : Literal["point", "line", "face"]
+            The kind of primitives.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            The buffer of the positions, the buffer of the primitive index of every vertex, the element buffer,
+            the number of vertices ``n`` and the number of primitives ``count``. None if the object has no such primitives.
+
+        Notes
+        -----
+        The primitives do not share vertices, such that every vertex carries the index of its own primitive
+        and every primitive is drawn in a single flat ID. The buffers are created on first use
+        and deleted when the positions or elements are updated.
+
+        See Also
+        --------
+        :class:`compas_viewer.components.renderer.ElementPicker`
+        """
+        if kind not in self._element_buffers:
+            primitives = self.primitives(kind)
+            if primitives is None:
+                self._element_buffers[kind] = None
+            else:
+                if kind == "point":
+                    primitives = primitives[:, :1]
+                count, k = primitives.shape[:2]
+                self._element_buffers[kind] = {
+                    "positions": make_vertex_buffer(primitives.reshape(-1)),
+                    "ids": make_vertex_buffer(arange(count).repeat(k)),
+                    "elements": make_index_buffer(arange(count * k)),
+                    "n": count * k,
+                    "count": count,
+                }
+        return self._element_buffers[kind]
+
+    def draw_elements(self, shader: Shader, kind: Literal["point", "line", "face"], increment: float = 0):
+        """Draw the IDs of the points, lines or frontface triangles of the object for element picking.
+
+        Parameters
+        ----------
+        shader : :class:`compas_viewer.components.renderer.shaders.Shader`
+            The element shader, with the range of the IDs set.
+        kind : Literal["point", "line", "face"]
+            The kind of primitives.
+        increment : float, optional
+            The size added to the points and the width added to the lines, in pixels.
+        """
+        buffer = self.element_buffer(kind)
+        if buffer is None:
+            return
+        shader.uniform4x4("transform", self.transform_buffer)
+        shader.enable_attribute("position")
+        shader.enable_attribute("element")
+        shader.bind_attribute("position", buffer["positions"])
+        shader.bind_attribute("element", buffer["ids"], step=1)
+        if kind == "point":
+            shader.draw_points(size=self.pointssize + increment, elements=buffer["elements"], n=buffer["n"])
+        elif kind == "line":
+            shader.draw_lines(width=self.lineswidth + increment, elements=buffer["elements"], n=buffer["n"])
+        else:
+            shader.draw_triangles(elements=buffer["elements"], n=buffer["n"])
+        shader.disable_attribute("element")
         shader.disable_attribute("position")
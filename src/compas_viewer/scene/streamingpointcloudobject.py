@@ -0,0 +1,281 @@
+import warnings
+from pathlib import Path
+from queue import Empty
+from queue import Full
+from queue import Queue
+from threading import Event
+from threading import Thread
+from typing import Any
+from typing import Optional
+from typing import Union
+
+from numpy import arange
+from numpy import array
+from numpy import asarray
+from numpy import float32
+from numpy import maximum
+from numpy import minimum
+from numpy import tile
+from PySide6.QtCore import QTimer
+
+from compas.geometry import Geometry
+from compas.scene import GeometryObject
+from compas_viewer.components.renderer.shaders import Shader
+from compas_viewer.gl import delete_buffers
+from compas_viewer.gl import make_index_buffer
+from compas_viewer.gl import make_vertex_buffer
+from compas_viewer.readers import read_points
+
+from .sceneobject import ViewerSceneObject
+
+
+class StreamingPointcloud(Geometry):
+    """A point cloud which is streamed from a point file.
+
+    Parameters
+    ----------
+    path : str | :class:`pathlib.Path`
+        The path to a point file supported by :func:`compas_viewer.readers.read_points`.
+    chunksize : int, optional
+        The number of points parsed and uploaded at once.
+
+    Attributes
+    ----------
+    path : :class:`pathlib.Path`
+        The path to the point file.
+    chunksize : int
+        The number of points per chunk.
+
+    See Also
+    --------
+    :class:`compas_viewer.scene.StreamingPointcloudObject`
+    :mod:`compas_viewer.readers`
+    """
+
+    def __init__(self, path: Union[str, Path], chunksize: int = 1_000_000, name: Optional[str] = None):
+        super().__init__(name=name or Path(path).name)
+        self.path = Path(path)
+        self.chunksize = chunksize
+
+    def transform(self, transformation):
+        raise NotImplementedError("A streamed point cloud cannot be transformed, use the transformation of its scene object instead.")
+
+
+class StreamingPointcloudObject(ViewerSceneObject, GeometryObject):
+    """Viewer scene object for displaying a point cloud while it is being read from a file.
+
+    The file is parsed in chunks on a background thread.
+    Every frame, a limited number of parsed chunks is uploaded to the GPU,
+    such that the viewer stays responsive and the point cloud appears progressively.
+    The chunks are uploaded by :meth:`compas_viewer.components.renderer.Renderer.upload` before culling,
+    such that the point cloud finishes loading while it is hidden or outside the view.
+
+    Parameters
+    ----------
+    pointcloud : :class:`compas_viewer.scene.StreamingPointcloud`
+        The point cloud to display.
+    pointcolor : :class:`compas.colors.Color`, optional
+        The color of the points if the file has no colors.
+        Default is the value of `pointcolor` in `viewer.config`.
+    **kwargs : dict, optional
+        Additional options for the :class:`compas_viewer.scene.ViewerSceneObject`.
+
+    Attributes
+    ----------
+    count : int
+        The number of points uploaded so far.
+    is_loaded : bool
+        True once the whole file is uploaded.
+    error : Exception | None
+        The error which stopped the reading of the file, if any.
+        The points uploaded before the error remain visible, and the point cloud is not loaded.
+
+    See Also
+    --------
+    :class:`compas_viewer.scene.LODPointcloudObject`
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from compas_viewer import Viewer
+        from compas_viewer.scene import StreamingPointcloud
+
+        viewer = Viewer()
+        viewer.scene.add(StreamingPointcloud("scan.ply"))
+        viewer.show()
+    """
+
+    # The number of parsed chunks waiting for upload, which bounds the memory used by the reader thread.
+    QUEUE_SIZE = 4
+
+    # The number of chunks uploaded per frame, to keep the interaction smooth while loading.
+    UPLOADS_PER_FRAME = 2
+
+    def __init__(self, pointcloud: StreamingPointcloud, **kwargs):
+        super().__init__(geometry=pointcloud, **kwargs)
+        self.geometry: StreamingPointcloud
+        self.show_points = True
+        self.pointcolor = kwargs.get("pointcolor") or self.viewer.config.pointcolor
+
+        self.count = 0
+        self.is_loaded = False
+        self.error: Optional[Exception] = None
+        self._chunks: list[dict[str, Any]] = []
+        self._elements_buffer = None
+        self._queue: Queue = Queue(maxsize=self.QUEUE_SIZE)
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+        self._bounds = None
+
+    def _read_points_data(self):
+        return None
+
+    def _read_lines_data(self):
+        return None
+
+    def _read_frontfaces_data(self):
+        return None
+
+    def _read_backfaces_data(self):
+        return None
+
+    # ==========================================================================
+    # Streaming
+    # ==========================================================================
+
+    def _put(self, item) -> bool:
+        """Put an item in the queue, waiting for space unless the streaming is stopped."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _read(self):
+        try:
+            for chunk in read_points(self.geometry.path, chunksize=self.geometry.chunksize):
+                if not self._put(chunk):
+                    return
+        except Exception as e:
+            self.error = e
+            warnings.warn(f"Reading {self.geometry.path} failed: {e}", RuntimeWarning)
+        self._put(None)
+
+    def init(self):
+        """Initialize the object and start reading the file in the background."""
+        self._update_matrix()
+        if self._thread is None:
+            self._thread = Thread(target=self._read, daemon=True)
+            self._thread.start()
+            self.renderer.uploads[self] = None
+
+    def stop(self):
+        """Stop reading the file. The points uploaded so far remain visible."""
+        self._stop.set()
+        self.renderer.uploads.pop(self, None)
+
+    def clear(self):
+        """Stop reading the file and release all point buffers from the GPU."""
+        self.stop()
+        for chunk in self._chunks:
+            delete_buffers([chunk["positions"], chunk["colors"]])
+        self._chunks = []
+        self.count = 0
+        if self._elements_buffer is not None:
+            delete_buffers([self._elements_buffer])
+            self._elements_buffer = None
+
+    def upload(self):
+        """Upload a limited number of parsed chunks, and schedule the next frame while the file is not loaded.
+
+        Notes
+        -----
+        This is called by the renderer at every frame, whether the object is drawn or not, until the file is loaded.
+        """
+        for _ in range(self.UPLOADS_PER_FRAME):
+            try:
+                chunk = self._queue.get_nowait()
+            except Empty:
+                break
+            if chunk is None:
+                if self.error is None:
+                    self.is_loaded = True
+                else:
+                    self._stop.set()
+                self.renderer.uploads.pop(self, None)
+                break
+            positions, colors = chunk
+            if not len(positions):
+                continue
+            if colors is None:
+                colors = tile(array(self.pointcolor.rgba, dtype=float32), (len(positions), 1))
+            else:
+                colors = asarray(colors, dtype=float32) / 255
+            self._chunks.append(
+                {
+                    "positions": make_vertex_buffer(positions),
+                    "colors": make_vertex_buffer(colors),
+                    "n": len(positions),
+                }
+            )
+            self.count += len(positions)
+
+            lo, hi = positions.min(axis=0), positions.max(axis=0)
+            if self._bounds is not None:
+                lo, hi = minimum(lo, self._bounds[0]), maximum(hi, self._bounds[1])
+            self._bounds = (lo, hi)
+            self._update_bounding_box([lo, hi])
+            self.scene.invalidate()
+
+        if self._elements_buffer is None and self._chunks:
+            self._elements_buffer = make_index_buffer(arange(max(self.geometry.chunksize, self._chunks[0]["n"])))
+
+        if not self.is_loaded and not self._stop.is_set():
+            QTimer.singleShot(0 if self._queue.qsize() else 50, self.renderer.update)
+
+    def pending_uploads(self) -> int:
+        """The number of chunks which are read but not uploaded yet.
+
+        Returns
+        -------
+        int
+            The number of chunks in the queue.
+        """
+        return self._queue.qsize()
+
+    # ==========================================================================
+    # Draw
+    # ==========================================================================
+
+    def draw(self, shader: Shader, wireframe: bool, is_lighted: bool):
+        """Draw all uploaded chunks."""
+        if not self.show_points or not self._chunks:
+            return
+        shader.enable_attribute("position")
+        shader.enable_attribute("color")
+        shader.uniform1i("is_selected", self.is_selected)
+        shader.uniform4x4("transform", self.transform_buffer)
+        shader.uniform1i("is_lighted", False)
+        shader.uniform1f("object_opacity", self.opacity)
+        shader.uniform1i("element_type", 0)
+        for chunk in self._chunks:
+            shader.bind_attribute("position", chunk["positions"])
+            shader.bind_attribute("color", chunk["colors"], step=4)
+            shader.draw_points(size=self.pointssize, elements=self._elements_buffer, n=chunk["n"], background=self.background)
+        shader.disable_attribute("position")
+        shader.disable_attribute("color")
+
+    def draw_instance(self, shader, wireframe: bool):
+        """Draw the uploaded chunks for picking."""
+        if not self.show_points or not self._chunks:
+            return
+        shader.enable_attribute("position")
+        shader.uniform3f("instance_color", self.instance_color.rgb)
+        shader.uniform4x4("transform", self.transform_buffer)
+        for chunk in self._chunks:
+            shader.bind_attribute("position", chunk["positions"])
+            shader.draw_points(size=self.pointssize, elements=self._elements_buffer, n=chunk["n"])
+        shader.disable_attribute("position")
@@ -0,0 +1,22 @@
+"""
+This package provides spatial data structures used by the renderer for level of detail, culling and picking.
+"""
+
+from .octree import Octree
+from .frustum import frustum_planes, boxes_in_frustum
+from .simplify import simplify_mesh, simplify_chain
+from .bvh import BVH
+from .raycast import ray_triangles, ray_segments, raycast_triangles, primitive_boxes
+
+__all__ = [
+    "Octree",
+    "BVH",
+    "frustum_planes",
+    "boxes_in_frustum",
+    "simplify_mesh",
+    "simplify_chain",
+    "ray_triangles",
+    "ray_segments",
+    "raycast_triangles",
+    "primitive_boxes",
+]
@@ -0,0 +1,310 @@
+from heapq import heappop
+from heapq import heappush
+from math import inf
+from typing import Optional
+
+from numpy import argsort
+from numpy import asarray
+from numpy import concatenate
+from numpy import errstate
+from numpy import float64
+from numpy import fmax
+from numpy import fmin
+from numpy import full
+from numpy import int64
+from numpy import isnan
+from numpy import maximum
+from numpy import nan
+from numpy import ndarray
+from numpy import zeros
+
+from .frustum import boxes_in_frustum
+
+
+class BVH:
+    """
+    Bounding volume hierarchy over axis-aligned boxes.
+
+    The hierarchy is built top-down by splitting the boxes at the median of their centers
+    along the longest axis. When the boxes move, :meth:`refit` updates the node boxes
+    without changing the topology, which is much cheaper than a rebuild.
+    All queries traverse the tree breadth-first, testing a whole level of nodes at once.
+
+    Parameters
+    ----------
+    boxes : array-like
+        The min and max corners of the boxes, as an array of shape (n, 2, 3).
+        Boxes with NaN coordinates are never returned by the queries.
+    leafsize : int, optional
+        The maximum number of boxes per leaf.
+
+    Attributes
+    ----------
+    boxes : ndarray
+        The boxes of the items.
+    order : ndarray
+        The items sorted by leaf, such that the items of every leaf are contiguous.
+    lo, hi : ndarray
+        The min and max corners of the node boxes, as arrays of shape (m, 3).
+    left, right : ndarray
+        The child nodes of every node, -1 for leaves.
+    starts, counts : ndarray
+        The range of every leaf in ``order``.
+
+    Examples
+    --------
+    >>> from numpy import array
+    >>> boxes = array([[[i, 0, 0], [i + 1, 1, 1]] for i in range(100)], dtype=float)
+    >>> bvh = BVH(boxes)
+    >>> sorted(bvh.query_box([10.5, 0, 0], [12.5, 1, 1]).tolist())
+    [10, 11, 12]
+    """
+
+    def __init__(self, boxes, leafsize: int = 4):
+        self.boxes = asarray(boxes, dtype=float64).reshape(-1, 2, 3)
+        self.leafsize = leafsize
+        self._build()
+
+    def __len__(self):
+        return len(self.boxes)
+
+    # ==========================================================================
+    # Construction
+    # ==========================================================================
+
+    def _build(self):
+        boxes = self.boxes
+        centers = boxes.mean(axis=1)
+        left, right, starts, counts, depths = [], [], [], [], []
+        chunks = []
+        offset = 0
+        valid = ~isnan(centers).any(axis=1)
+        stack = [(-1, False, valid.nonzero()[0], 0)]
+
+        while stack:
+            parent, is_right, items, depth = stack.pop()
+            node = len(left)
+            left.append(-1)
+            right.append(-1)
+            starts.append(0)
+            counts.append(0)
+            depths.append(depth)
+            if parent >= 0:
+                if is_right:
+                    right[parent] = node
+                else:
+                    left[parent] = node
+
+            if len(items) <= self.leafsize:
+                starts[node] = offset
+                counts[node] = len(items)
+                offset += len(items)
+                chunks.append(items)
+                continue
+
+            c = centers[items]
+            axis = int((c.max(axis=0) - c.min(axis=0)).argmax())
+            half = len(items) // 2
+            split = argsort(c[:, axis], kind="stable")
+            stack.append((node, True, items[split[half:]], depth + 1))
+            stack.append((node, False, items[split[:half]], depth + 1))
+
+        self.order = concatenate(chunks).astype(int64) if chunks else zeros(0, dtype=int64)
+        self.left = asarray(left, dtype=int64)
+        self.right = asarray(right, dtype=int64)
+        self.starts = asarray(starts, dtype=int64)
+        self.counts = asarray(counts, dtype=int64)
+        self.depths = asarray(depths, dtype=int64)
+        self._leaves = (self.left < 0).nonzero()[0]
+        self._levels = [(self.depths == d).nonzero()[0] for d in range(int(self.depths.max()) + 1)]
+        self.lo = full((len(left), 3), nan)
+        self.hi = full((len(left), 3), nan)
+        self.refit()
+
+    def refit(self, boxes=None):
+        """Update the node boxes bottom-up after the item boxes have moved.
+
+        Parameters
+        ----------
+        boxes : array-like, optional
+            The new boxes of the items, as an array of shape (n, 2, 3).
+            The number of boxes has to match the number of items the hierarchy was built with.
+        """
+        if boxes is not None:
+            boxes = asarray(boxes, dtype=float64).reshape(-1, 2, 3)
+            if len(boxes) != len(self.boxes):
+                raise ValueError(f"Expected {len(self.boxes)} boxes, got {len(boxes)}.")
+            self.boxes = boxes
+
+        leaves = self._leaves[self.counts[self._leaves] > 0]
+        if len(leaves):
+            ordered = self.boxes[self.order]
+            starts = self.starts[leaves]
+            with errstate(invalid="ignore"):
+                self.lo[leaves] = fmin.reduceat(ordered[:, 0], starts)
+                self.hi[leaves] = fmax.reduceat(ordered[:, 1], starts)
+
+        for nodes in reversed(self._levels):
+            nodes = nodes[self.left[nodes] >= 0]
+            if not len(nodes):
+                continue
+            a, b = self.left[nodes], self.right[nodes]
+            self.lo[nodes] = fmin(self.lo[a], self.lo[b])
+            self.hi[nodes] = fmax(self.hi[a], self.hi[b])
+
+    # ==========================================================================
+    # Queries
+    # ==========================================================================
+
+    def _traverse(self, test) -> ndarray:
+        """Collect the items of all leaves reached through nodes passing the test, and test the items themselves."""
+        if not len(self.order):
+            return zeros(0, dtype=int64)
+        frontier = asarray([0])
+        found = []
+        while len(frontier):
+            frontier = frontier[test(self.lo[frontier], self.hi[frontier])]
+            leaves = frontier[self.left[frontier] < 0]
+            for leaf in leaves.tolist():
+                found.append(self.order[self.starts[leaf] : self.starts[leaf] + self.counts[leaf]])  # noqa: E203
+            inner = frontier[self.left[frontier] >= 0]
+            frontier = concatenate([self.left[inner], self.right[inner]])
+        if not found:
+            return zeros(0, dtype=int64)
+        items = concatenate(found)
+        return items[test(self.boxes[items, 0], self.boxes[items, 1])]
+
+    def query_box(self, lo, hi) -> ndarray:
+        """Find the items whose boxes overlap a box.
+
+        Parameters
+        ----------
+        lo, hi : array-like
+            The min and max corners of the query box.
+
+        Returns
+        -------
+        ndarray
+            The indices of the items.
+        """
+        lo = asarray(lo, dtype=float64)
+        hi = asarray(hi, dtype=float64)
+        return self._traverse(lambda a, b: ((a <= hi) & (b >= lo)).all(axis=1))
+
+    def query_frustum(self, planes) -> ndarray:
+        """Find the items whose boxes are (partly) inside a frustum.
+
+        Parameters
+        ----------
+        planes : array-like
+            The inward facing planes of the frustum, as an array of shape (k, 4).
+
+        Returns
+        -------
+        ndarray
+            The indices of the items.
+
+        See Also
+        --------
+        :func:`compas_viewer.spatial.frustum_planes`
+        """
+        planes = asarray(planes, dtype=float64)
+
+        def test(a, b):
+            boxes = concatenate([a[:, None], b[:, None]], axis=1)
+            return boxes_in_frustum(boxes, planes) & ~isnan(a).any(axis=1)
+
+        return self._traverse(test)
+
+    def query_ray(self, origin, direction, tmax: float = inf, pad: float = 0.0) -> tuple[ndarray, ndarray]:
+        """Find the items whose boxes are hit by a ray.
+
+        Parameters
+        ----------
+        origin : array-like
+            The start point of the ray.
+        direction : array-like
+            The direction of the ray.
+        tmax : float, optional
+            The maximum ray parameter.
+        pad : float, optional
+            The distance by which all boxes are inflated,
+            to find items passing close to the ray, such as lines and points.
+
+        Returns
+        -------
+        tuple[ndarray, ndarray]
+            The indices of the items, sorted by the ray parameter at which the ray enters their boxes,
+            and these ray parameters.
+        """
+        origin = asarray(origin, dtype=float64)
+        direction = asarray(direction, dtype=float64)
+        with errstate(divide="ignore"):
+            inverse = 1.0 / direction
+
+        def entry(a, b):
+            with errstate(invalid="ignore"):
+                t1 = (a - pad - origin) * inverse
+                t2 = (b + pad - origin) * inverse
+                tnear = fmax.reduce(fmin(t1, t2), axis=1)
+                tfar = fmin.reduce(fmax(t1, t2), axis=1)
+            return maximum(tnear, 0), tfar
+
+        def test(a, b):
+            tnear, tfar = entry(a, b)
+            return (tnear <= tfar) & (tnear <= tmax)
+
+        items = self._traverse(test)
+        tnear, _ = entry(self.boxes[items, 0], self.boxes[items, 1])
+        order = argsort(tnear, kind="stable")
+        return items[order], tnear[order]
+
+    def nearest(self, point, k: int = 1, distance: Optional[float] = None) -> tuple[ndarray, ndarray]:
+        """Find the items whose boxes are nearest to a point.
+
+        Parameters
+        ----------
+        point : array-like
+            The query point.
+        k : int, optional
+            The number of items to find.
+        distance : float, optional
+            The maximum distance.
+
+        Returns
+        -------
+        tuple[ndarray, ndarray]
+            The indices of the items, sorted by the distance from the point to their boxes,
+            and these distances. The distance is zero for boxes containing the point.
+        """
+        point = asarray(point, dtype=float64)
+        limit = inf if distance is None else distance
+
+        def box_distance(a, b):
+            return float((maximum(maximum(a - point, point - b), 0) ** 2).sum() ** 0.5)
+
+        found: list[tuple[float, int]] = []
+        heap = [(0.0, 0)] if len(self.order) else []
+        while heap:
+            d, node = heappop(heap)
+            if d > limit or (len(found) == k and d >= -found[0][0]):
+                break
+            if self.left[node] < 0:
+                start = self.starts[node]
+                for item in self.order[start : start + self.counts[node]].tolist():  # noqa: E203
+                    d = box_distance(*self.boxes[item])
+                    if d != d or d > limit:
+                        continue
+                    if len(found) < k:
+                        heappush(found, (-d, item))
+                    elif d < -found[0][0]:
+                        heappop(found)
+                        heappush(found, (-d, item))
+                continue
+            for child in (self.left[node], self.right[node]):
+                d = box_distance(self.lo[child], self.hi[child])
+                if d == d:
+                    heappush(heap, (d, int(child)))
+
+        found.sort(key=lambda pair: -pair[0])
+        return asarray([item for _, item in found], dtype=int64), asarray([-d for d, _ in found], dtype=float64)
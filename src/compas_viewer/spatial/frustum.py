@@ -0,0 +1,79 @@
+from numpy import asarray
+from numpy import einsum
+from numpy import float64
+from numpy import ndarray
+from numpy import stack
+from numpy import where
+from numpy.linalg import norm
+
+
+def frustum_planes(matrix, window=None) -> ndarray:
+    """Extract the six clipping planes of a view frustum from a projection matrix.
+
+    Parameters
+    ----------
+    matrix : array-like
+        The 4x4 matrix transforming points into clip space, e.g. ``projection @ viewworld``.
+        When the matrix also includes an object transformation,
+        the planes are expressed in the coordinate system of that object.
+    window : tuple[float, float, float, float], optional
+        A rectangle ``(xmin, ymin, xmax, ymax)`` in normalized device coordinates,
+        which restricts the frustum to the part of the view inside it, e.g. for a selection box.
+        Default is the full view ``(-1, -1, 1, 1)``.
+
+    Returns
+    -------
+    ndarray
+        The left, right, bottom, top, near and far planes as an array of shape (6, 4).
+        Every row ``(a, b, c, d)`` is normalized such that ``a * x + b * y + c * z + d``
+        is the signed distance of a point to the plane, positive on the inside.
+
+    References
+    ----------
+    * Gribb, G. and Hartmann, K. (2001). Fast Extraction of Viewing Frustum Planes from the World-View-Projection Matrix.
+
+    Examples
+    --------
+    >>> from numpy import identity
+    >>> planes = frustum_planes(identity(4))
+    >>> planes.shape
+    (6, 4)
+    """
+    m = asarray(matrix, dtype=float64)
+    xmin, ymin, xmax, ymax = window or (-1, -1, 1, 1)
+    planes = stack([m[0] - xmin * m[3], xmax * m[3] - m[0], m[1] - ymin * m[3], ymax * m[3] - m[1], m[3] + m[2], m[3] - m[2]])
+    return planes / norm(planes[:, :3], axis=1)[:, None]
+
+
+def boxes_in_frustum(boxes, planes) -> ndarray:
+    """Test axis-aligned boxes against the planes of a view frustum.
+
+    Parameters
+    ----------
+    boxes : array-like
+        The min and max corners of the boxes, as an array of shape (n, 2, 3).
+    planes : array-like
+        The inward facing planes of the frustum, as an array of shape (k, 4),
+        for example from :func:`compas_viewer.spatial.frustum_planes`.
+
+    Returns
+    -------
+    ndarray
+        A boolean array of shape (n,), False for the boxes which are entirely outside the frustum.
+        The test is conservative: a box close to a corner of the frustum may be reported inside.
+        Boxes with NaN coordinates are reported inside.
+
+    Examples
+    --------
+    >>> from numpy import identity
+    >>> planes = frustum_planes(identity(4))
+    >>> boxes_in_frustum([[[0, 0, 0], [0.5, 0.5, 0.5]], [[2, 2, 2], [3, 3, 3]]], planes).tolist()
+    [True, False]
+    """
+    boxes = asarray(boxes, dtype=float64).reshape(-1, 2, 3)
+    planes = asarray(planes, dtype=float64)
+    normals = planes[:, :3]
+    # The corner of every box furthest along the normal of every plane, of shape (n, k, 3).
+    corners = where(normals > 0, boxes[:, 1, None, :], boxes[:, 0, None, :])
+    distances = einsum("nkj,kj->nk", corners, normals) + planes[:, 3]
+    return ~(distances < 0).any(axis=1)
@@ -0,0 +1,387 @@
+from heapq import heappop
+from heapq import heappush
+from math import inf
+from math import sqrt
+from pathlib import Path
+from typing import Optional
+from typing import Union
+
+from numpy import arange
+from numpy import argsort
+from numpy import array
+from numpy import asarray
+from numpy import concatenate
+from numpy import float32
+from numpy import float64
+from numpy import full
+from numpy import int64
+from numpy import load
+from numpy import ndarray
+from numpy import save
+from numpy import savez
+from numpy import searchsorted
+from numpy import uint8
+from numpy.random import default_rng
+
+# Sign of each octant along X, Y and Z, indexed by the octant bit mask.
+OCTANT_SIGNS = array([[(o >> 0) & 1, (o >> 1) & 1, (o >> 2) & 1] for o in range(8)], dtype=float64) * 2 - 1
+
+
+class Octree:
+    """
+    Octree level-of-detail structure over a point array.
+
+    The points are distributed top-down: every node keeps a uniformly random subset of at most
+    ``capacity`` points of its cell and passes the remaining points on to its children.
+    Drawing a node together with all its ancestors therefore refines the point cloud progressively,
+    and a view only needs the nodes whose projected point spacing exceeds the error budget.
+    The points are reordered such that the points of every node are contiguous.
+
+    Parameters
+    ----------
+    positions : ndarray
+        The reordered point coordinates, as an array of shape (n, 3).
+    colors : ndarray, optional
+        The reordered RGBA point colors, as a uint8 array of shape (n, 4).
+    centers : ndarray
+        The centers of the node cells, as an array of shape (m, 3).
+    halfsizes : ndarray
+        The half edge lengths of the node cells, as an array of shape (m,).
+    starts : ndarray
+        The index of the first point of every node, as an array of shape (m,).
+    counts : ndarray
+        The number of points of every node, as an array of shape (m,).
+    children : ndarray
+        The child node indices per octant, -1 for no child, as an array of shape (m, 8).
+    capacity : int
+        The maximum number of points stored in an inner node.
+
+    Attributes
+    ----------
+    radii : ndarray
+        The radii of the bounding spheres of the node cells.
+    bounds : ndarray
+        The min and max corners of the root cell.
+
+    See Also
+    --------
+    :class:`compas_viewer.scene.LODPointcloudObject`
+
+    References
+    ----------
+    * Schütz, M. (2016). Potree: Rendering Large Point Clouds in Web Browsers.
+
+    Examples
+    --------
+    >>> from numpy.random import default_rng
+    >>> points = default_rng(0).random((10000, 3))
+    >>> octree = Octree.from_points(points, capacity=1000)
+    >>> int(octree.counts.sum())
+    10000
+    >>> int(octree.counts[0])
+    1000
+    """
+
+    def __init__(
+        self,
+        positions: ndarray,
+        colors: Optional[ndarray],
+        centers: ndarray,
+        halfsizes: ndarray,
+        starts: ndarray,
+        counts: ndarray,
+        children: ndarray,
+        capacity: int,
+    ):
+        self.positions = positions
+        self.colors = colors
+        self.centers = centers
+        self.halfsizes = halfsizes
+        self.starts = starts
+        self.counts = counts
+        self.children = children
+        self.capacity = capacity
+        self.radii = halfsizes * sqrt(3)
+        self._children = [[int(c) for c in node if c >= 0] for node in children]
+
+    def __len__(self):
+        return len(self.counts)
+
+    @property
+    def bounds(self) -> ndarray:
+        """The min and max corners of the root cell, as an array of shape (2, 3)."""
+        return array([self.centers[0] - self.halfsizes[0], self.centers[0] + self.halfsizes[0]])
+
+    # ==========================================================================
+    # Construction
+    # ==========================================================================
+
+    @classmethod
+    def from_points(
+        cls,
+        points,
+        colors=None,
+        capacity: int = 20000,
+        max_depth: int = 20,
+        seed: int = 0,
+    ) -> "Octree":
+        """Build an octree from a point array.
+
+        Parameters
+        ----------
+        points : array-like
+            The point coordinates, as an array of shape (n, 3).
+        colors : array-like, optional
+            The point colors, as an array of shape (n, 3) or (n, 4),
+            either as uint8 or as floats in the range [0, 1].
+        capacity : int, optional
+            The maximum number of points stored in an inner node.
+        max_depth : int, optional
+            The maximum depth of the tree. Leaves at this depth store all their remaining points.
+        seed : int, optional
+            Seed of the random shuffle which distributes the points over the levels.
+
+        Returns
+        -------
+        :class:`compas_viewer.spatial.Octree`
+        """
+        points = asarray(points, dtype=float32)
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError(f"Expected points of shape (n, 3), got {points.shape}.")
+
+        lo = points.min(axis=0).astype(float64)
+        hi = points.max(axis=0).astype(float64)
+
+        centers = [(lo + hi) / 2]
+        halfsizes = [max(float((hi - lo).max()) / 2, 1e-9)]
+        depths = [0]
+        starts = [0]
+        counts = [0]
+        children = [[-1] * 8]
+
+        chunks = []
+        offset = 0
+        stack = [(0, default_rng(seed).permutation(len(points)))]
+
+        while stack:
+            node, indices = stack.pop()
+            if len(indices) <= capacity or depths[node] >= max_depth:
+                keep, rest = indices, indices[:0]
+            else:
+                keep, rest = indices[:capacity], indices[capacity:]
+
+            starts[node] = offset
+            counts[node] = len(keep)
+            offset += len(keep)
+            chunks.append(keep)
+
+            if not len(rest):
+                continue
+
+            # A stable sort keeps the points of every octant in random order.
+            p = points[rest]
+            c = centers[node]
+            octants = (p[:, 0] >= c[0]).astype(uint8) | ((p[:, 1] >= c[1]).astype(uint8) << 1) | ((p[:, 2] >= c[2]).astype(uint8) << 2)
+            order = argsort(octants, kind="stable")
+            rest = rest[order]
+            bounds = searchsorted(octants[order], arange(9))
+
+            halfsize = halfsizes[node] / 2
+            for octant in range(8):
+                a, b = bounds[octant], bounds[octant + 1]
+                if a == b:
+                    continue
+                child = len(centers)
+                centers.append(c + OCTANT_SIGNS[octant] * halfsize)
+                halfsizes.append(halfsize)
+                depths.append(depths[node] + 1)
+                starts.append(0)
+                counts.append(0)
+                children.append([-1] * 8)
+                children[node][octant] = child
+                stack.append((child, rest[a:b]))
+
+        order = concatenate(chunks)
+        return cls(
+            positions=points[order],
+            colors=None if colors is None else _as_rgba8(colors)[order],
+            centers=array(centers, dtype=float64),
+            halfsizes=array(halfsizes, dtype=float64),
+            starts=array(starts, dtype=int64),
+            counts=array(counts, dtype=int64),
+            children=array(children, dtype=int64),
+            capacity=capacity,
+        )
+
+    # ==========================================================================
+    # Persistence
+    # ==========================================================================
+
+    def save(self, path: Union[str, Path]):
+        """Save the octree as an on-disk index.
+
+        The index is a folder with the reordered points and colors as ``.npy`` files,
+        which can be memory-mapped when loading, and the node table as ``nodes.npz``.
+
+        Parameters
+        ----------
+        path : str | :class:`pathlib.Path`
+            The folder of the index. It is created if it does not exist.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        save(path / "positions.npy", self.positions)
+        if self.colors is not None:
+            save(path / "colors.npy", self.colors)
+        savez(
+            path / "nodes.npz",
+            centers=self.centers,
+            halfsizes=self.halfsizes,
+            starts=self.starts,
+            counts=self.counts,
+            children=self.children,
+            capacity=self.capacity,
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path], mmap: bool = True) -> "Octree":
+        """Load an octree from an on-disk index.
+
+        Parameters
+        ----------
+        path : str | :class:`pathlib.Path`
+            The folder of the index.
+        mmap : bool, optional
+            Memory-map the points instead of reading them into memory.
+            Only the nodes which are actually drawn are then read from disk.
+
+        Returns
+        -------
+        :class:`compas_viewer.spatial.Octree`
+        """
+        path = Path(path)
+        mode = "r" if mmap else None
+        nodes = load(path / "nodes.npz")
+        colors = path / "colors.npy"
+        return cls(
+            positions=load(path / "positions.npy", mmap_mode=mode),
+            colors=load(colors, mmap_mode=mode) if colors.exists() else None,
+            centers=nodes["centers"],
+            halfsizes=nodes["halfsizes"],
+            starts=nodes["starts"],
+            counts=nodes["counts"],
+            children=nodes["children"],
+            capacity=int(nodes["capacity"]),
+        )
+
+    # ==========================================================================
+    # Queries
+    # ==========================================================================
+
+    def node_positions(self, node: int) -> ndarray:
+        """The points of a node, as an array of shape (k, 3)."""
+        start = self.starts[node]
+        return self.positions[start : start + self.counts[node]]  # noqa: E203
+
+    def node_colors(self, node: int) -> Optional[ndarray]:
+        """The uint8 RGBA colors of a node, as an array of shape (k, 4)."""
+        if self.colors is None:
+            return None
+        start = self.starts[node]
+        return self.colors[start : start + self.counts[node]]  # noqa: E203
+
+    def select(
+        self,
+        eye,
+        scale: float,
+        point_budget: int,
+        error_budget: float = 1.0,
+        orthographic: bool = False,
+        planes: Optional[ndarray] = None,
+    ) -> tuple[list[int], int]:
+        """Select the nodes to draw for a view.
+
+        Nodes are visited in order of decreasing projected size.
+        A node is refined into its children as long as the projected point spacing of the children
+        is larger than ``error_budget`` pixels, and the traversal stops once the point budget is exhausted.
+
+        Parameters
+        ----------
+        eye : array-like
+            The camera position, in the coordinate system of the points.
+        scale : float
+            The number of pixels covered by one unit of length at unit distance from the camera
+            (``height / (2 * tan(fov / 2))``) for perspective views,
+            or at any distance for orthographic views.
+        point_budget : int
+            The maximum number of points to select.
+        error_budget : float, optional
+            The largest acceptable projected point spacing, in pixels.
+        orthographic : bool, optional
+            If True, the projected sizes do not depend on the distance to the camera.
+        planes : ndarray, optional
+            The frustum planes of the view, as an array of shape (6, 4) of inward facing ``(a, b, c, d)``,
+            in the coordinate system of the points. Nodes outside the frustum are skipped.
+
+        Returns
+        -------
+        tuple[list[int], int]
+            The selected nodes and their total number of points.
+        """
+        eye = asarray(eye, dtype=float64)
+        density = sqrt(self.capacity)
+        selected = []
+        total = 0
+
+        def projected_size(nodes):
+            if orthographic:
+                return self.radii[nodes] * scale
+            distances = ((self.centers[nodes] - eye) ** 2).sum(axis=-1) ** 0.5
+            inside = distances <= self.radii[nodes]
+            sizes = self.radii[nodes] * scale / (distances + inside)
+            sizes[inside] = inf
+            return sizes
+
+        def visible(nodes):
+            if planes is None:
+                return full(len(nodes), True)
+            distances = self.centers[nodes] @ planes[:, :3].T + planes[:, 3]
+            return (distances >= -self.radii[nodes][:, None]).all(axis=1)
+
+        root = array([0])
+        if not visible(root)[0]:
+            return selected, total
+
+        heap = [(-float(projected_size(root)[0]), 0)]
+        while heap:
+            _, node = heappop(heap)
+            count = int(self.counts[node])
+            if total + count > point_budget:
+                break
+            selected.append(node)
+            total += count
+
+            children = self._children[node]
+            if not children:
+                continue
+            children = array(children)
+            children = children[visible(children)]
+            if not len(children):
+                continue
+            sizes = projected_size(children)
+            for child, size in zip(children.tolist(), sizes.tolist()):
+                if size / density >= error_budget:
+                    heappush(heap, (-size, child))
+
+        return selected, total
+
+
+def _as_rgba8(colors) -> ndarray:
+    """Convert float or uint8 colors of shape (n, 3) or (n, 4) to uint8 RGBA."""
+    colors = asarray(colors)
+    if colors.dtype != uint8:
+        colors = (colors.clip(0, 1) * 255 + 0.5).astype(uint8)
+    if colors.shape[1] == 3:
+        alpha = full((len(colors), 1), 255, dtype=uint8)
+        colors = concatenate([colors, alpha], axis=1)
+    return colors
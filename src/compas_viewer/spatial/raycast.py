@@ -0,0 +1,155 @@
+from math import inf
+
+from numpy import abs
+from numpy import asarray
+from numpy import clip
+from numpy import cross
+from numpy import einsum
+from numpy import errstate
+from numpy import float64
+from numpy import ndarray
+from numpy import where
+from numpy import zeros
+
+from .bvh import BVH
+
+
+def ray_triangles(origin, direction, triangles) -> ndarray:
+    """Intersect a ray with triangles, from both sides.
+
+    Parameters
+    ----------
+    origin : array-like
+        The start point of the ray.
+    direction : array-like
+        The direction of the ray.
+    triangles : array-like
+        The corners of the triangles, as an array of shape (m, 3, 3).
+
+    Returns
+    -------
+    ndarray
+        The ray parameter of the intersection with every triangle, or infinity if the ray misses it.
+
+    References
+    ----------
+    * Möller, T. and Trumbore, B. (1997). Fast, Minimum Storage Ray/Triangle Intersection.
+
+    Examples
+    --------
+    >>> ray_triangles([0.2, 0.2, 1], [0, 0, -1], [[[0, 0, 0], [1, 0, 0], [0, 1, 0]]]).tolist()
+    [1.0]
+    """
+    origin = asarray(origin, dtype=float64)
+    direction = asarray(direction, dtype=float64)
+    triangles = asarray(triangles, dtype=float64).reshape(-1, 3, 3)
+    a = triangles[:, 0]
+    e1 = triangles[:, 1] - a
+    e2 = triangles[:, 2] - a
+    p = cross(direction, e2)
+    det = einsum("ij,ij->i", e1, p)
+    with errstate(divide="ignore", invalid="ignore"):
+        inverse = 1.0 / det
+        s = origin - a
+        u = einsum("ij,ij->i", s, p) * inverse
+        q = cross(s, e1)
+        v = (q @ direction) * inverse
+        t = einsum("ij,ij->i", e2, q) * inverse
+        hit = (abs(det) > 1e-300) & (u >= 0) & (v >= 0) & (u + v <= 1) & (t >= 0)
+    return where(hit, t, inf)
+
+
+def ray_segments(origin, direction, segments) -> tuple[ndarray, ndarray]:
+    """Find the closest points between a ray and line segments.
+
+    Parameters
+    ----------
+    origin : array-like
+        The start point of the ray.
+    direction : array-like
+        The direction of the ray.
+    segments : array-like
+        The end points of the segments, as an array of shape (m, 2, 3).
+        Segments with identical end points represent points.
+
+    Returns
+    -------
+    tuple[ndarray, ndarray]
+        The ray parameters of the closest points on the ray,
+        and the parameters of the closest points on the segments, between 0 and 1.
+    """
+    origin = asarray(origin, dtype=float64)
+    direction = asarray(direction, dtype=float64)
+    segments = asarray(segments, dtype=float64).reshape(-1, 2, 3)
+    a = segments[:, 0]
+    v = segments[:, 1] - a
+    w = origin - a
+    dd = float(direction @ direction)
+    dv = v @ direction
+    vv = einsum("ij,ij->i", v, v)
+    dw = w @ direction
+    vw = einsum("ij,ij->i", v, w)
+
+    with errstate(divide="ignore", invalid="ignore"):
+        # The closest points of the infinite lines, then clamped to the segments and the ray.
+        denominator = dd * vv - dv * dv
+        s = where(denominator > 1e-12 * dd * vv, (dd * vw - dv * dw) / denominator, 0.0)
+        s = clip(s, 0, 1)
+        t = clip((s * dv - dw) / dd, 0, inf)
+        s = where(vv > 0, clip((t * dv + vw) / vv, 0, 1), 0.0)
+    return t, s
+
+
+def raycast_triangles(bvh: BVH, triangles: ndarray, origin, direction, tmax: float = inf) -> tuple[int, float]:
+    """Find the first triangle hit by a ray, using a hierarchy over the triangles.
+
+    Parameters
+    ----------
+    bvh : :class:`compas_viewer.spatial.BVH`
+        The hierarchy over the bounding boxes of the triangles.
+    triangles : ndarray
+        The corners of the triangles, as an array of shape (m, 3, 3).
+    origin : array-like
+        The start point of the ray.
+    direction : array-like
+        The direction of the ray.
+    tmax : float, optional
+        The maximum ray parameter.
+
+    Returns
+    -------
+    tuple[int, float]
+        The index of the triangle and the ray parameter of the hit, or -1 and infinity if there is no hit.
+
+    See Also
+    --------
+    :func:`compas_viewer.spatial.ray_triangles`
+    """
+    items, _ = bvh.query_ray(origin, direction, tmax=tmax)
+    if not len(items):
+        return -1, inf
+    t = ray_triangles(origin, direction, triangles[items])
+    i = int(t.argmin())
+    if t[i] == inf or t[i] > tmax:
+        return -1, inf
+    return int(items[i]), float(t[i])
+
+
+def primitive_boxes(primitives: ndarray) -> ndarray:
+    """Compute the bounding boxes of primitives such as segments or triangles.
+
+    Parameters
+    ----------
+    primitives : ndarray
+        The corners of the primitives, as an array of shape (m, k, 3).
+
+    Returns
+    -------
+    ndarray
+        The boxes, as an array of shape (m, 2, 3).
+    """
+    boxes = zeros((len(primitives), 2, 3))
+    if len(primitives):
+        boxes[:, 0] = primitives.min(axis=1)
+        boxes[:, 1] = primitives.max(axis=1)
+    return boxes
@@ -0,0 +1,203 @@
+from typing import Optional
+
+from numpy import asarray
+from numpy import bincount
+from numpy import clip
+from numpy import column_stack
+from numpy import cross
+from numpy import einsum
+from numpy import float32
+from numpy import float64
+from numpy import floor
+from numpy import identity
+from numpy import int64
+from numpy import ndarray
+from numpy import sort
+from numpy import unique
+from numpy import zeros
+from numpy.linalg import norm
+from numpy.linalg import solve
+
+# The upper triangle of a symmetric 4x4 quadric, stored as 10 components.
+QUADRIC_ROWS = (0, 0, 0, 0, 1, 1, 1, 2, 2, 3)
+QUADRIC_COLS = (0, 1, 2, 3, 1, 2, 3, 2, 3, 3)
+
+
+def _cluster(positions: ndarray, lo: ndarray, cellsize: float) -> tuple[ndarray, ndarray]:
+    """Assign every vertex to a grid cell, returning the cluster of every vertex and the cell of every cluster."""
+    cells = floor((positions - lo) / cellsize).astype(int64)
+    cells = clip(cells, 0, (1 << 20) - 1)
+    keys = (cells[:, 0] << 40) | (cells[:, 1] << 20) | cells[:, 2]
+    _, first, clusters = unique(keys, return_index=True, return_inverse=True)
+    return clusters.ravel(), cells[first]
+
+
+def _remap_triangles(triangles: ndarray, clusters: ndarray) -> ndarray:
+    """Map triangles onto clusters, dropping collapsed and duplicate triangles."""
+    remapped = clusters[triangles]
+    valid = (remapped[:, 0] != remapped[:, 1]) & (remapped[:, 1] != remapped[:, 2]) & (remapped[:, 2] != remapped[:, 0])
+    remapped = remapped[valid]
+    if not len(remapped):
+        return remapped
+    ordered = sort(remapped, axis=1)
+    if ordered[:, 2].max() < (1 << 21):
+        # Pack the sorted indices in one integer, which is much faster to deduplicate than rows.
+        _, index = unique((ordered[:, 0] << 42) | (ordered[:, 1] << 21) | ordered[:, 2], return_index=True)
+    else:
+        _, index = unique(ordered, axis=0, return_index=True)
+    return remapped[sort(index)]
+
+
+def simplify_mesh(
+    positions,
+    triangles,
+    target: int,
+    colors=None,
+    iterations: int = 8,
+) -> tuple[ndarray, ndarray, Optional[ndarray]]:
+    """Simplify a triangle mesh with quadric error vertex clustering.
+
+    The vertices are clustered on a uniform grid. Every cluster is replaced by the point
+    which minimizes the sum of squared distances to the planes of the triangles around it,
+    and the triangles which collapse are removed. The grid size is searched such that the
+    number of remaining triangles is close to the target.
+
+    Parameters
+    ----------
+    positions : array-like
+        The vertex coordinates, as an array of shape (n, 3).
+        Vertices do not have to be shared, a triangle soup is welded by the clustering.
+    triangles : array-like
+        The vertex indices of the triangles, as an array of shape (m, 3).
+    target : int
+        The approximate number of triangles of the simplified mesh.
+    colors : array-like, optional
+        The vertex colors, as an array of shape (n, k). The colors of a cluster are averaged.
+    iterations : int, optional
+        The maximum number of steps of the grid size search.
+
+    Returns
+    -------
+    tuple[ndarray, ndarray, ndarray | None]
+        The vertex coordinates, the triangles and the vertex colors of the simplified mesh.
+
+    References
+    ----------
+    * Lindstrom, P. (2000). Out-of-Core Simplification of Large Polygonal Models.
+    * Garland, M. and Heckbert, P. (1997). Surface Simplification Using Quadric Error Metrics.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_meshgrid(10.0, 100)
+    >>> mesh.quads_to_triangles()
+    >>> vertices, faces = mesh.to_vertices_and_faces()
+    >>> v, t, _ = simplify_mesh(vertices, faces, 2000)
+    >>> len(t) < 5000
+    True
+    """
+    positions = asarray(positions, dtype=float64)
+    triangles = asarray(triangles, dtype=int64).reshape(-1, 3)
+    if len(triangles) <= target:
+        return positions.astype(float32), triangles, None if colors is None else asarray(colors, dtype=float32)
+
+    lo = positions.min(axis=0)
+    extent = max(float((positions.max(axis=0) - lo).max()), 1e-12)
+
+    # Search the grid resolution giving the target number of triangles.
+    # On a surface the number of triangles grows with the square of the resolution.
+    resolution = max(1.0, (target / 2) ** 0.5)
+    best = None
+    for _ in range(iterations):
+        clusters, cells = _cluster(positions, lo, extent / resolution)
+        remapped = _remap_triangles(triangles, clusters)
+        if best is None or abs(len(remapped) - target) < abs(len(best[2]) - target):
+            best = (resolution, (clusters, cells), remapped)
+        if abs(len(remapped) - target) <= 0.05 * target:
+            break
+        resolution *= min(max((target / max(len(remapped), 1)) ** 0.5, 0.5), 2.0)
+    resolution, (clusters, cells), remapped = best  # type: ignore
+    cellsize = extent / resolution
+    k = len(cells)
+
+    # Area weighted plane quadrics of the triangles, accumulated per cluster.
+    p0, p1, p2 = positions[triangles[:, 0]], positions[triangles[:, 1]], positions[triangles[:, 2]]
+    normals = cross(p1 - p0, p2 - p0)
+    areas = norm(normals, axis=1)
+    valid = areas > 0
+    normals[valid] /= areas[valid][:, None]
+    planes = column_stack([normals, -einsum("ij,ij->i", normals, p0)])
+    owners = clusters[triangles].ravel()
+    quadrics = zeros((k, 4, 4))
+    for r, c in zip(QUADRIC_ROWS, QUADRIC_COLS):
+        weights = (planes[:, r] * planes[:, c] * areas).repeat(3)
+        quadrics[:, r, c] = bincount(owners, weights=weights, minlength=k)
+        quadrics[:, c, r] = quadrics[:, r, c]
+
+    # The optimal points, regularized towards the mean of the cluster and kept inside its cell.
+    counts = bincount(clusters, minlength=k)
+    means = column_stack([bincount(clusters, weights=positions[:, i], minlength=k) for i in range(3)]) / counts[:, None]
+    A = quadrics[:, :3, :3]
+    b = quadrics[:, :3, 3]
+    regularization = (einsum("kii->k", A) / 3 * 1e-3 + 1e-12)[:, None]
+    optimal = solve(A + regularization[:, :, None] * identity(3), (regularization * means - b)[:, :, None])[:, :, 0]
+    cell_lo = lo + cells * cellsize
+    optimal = clip(optimal, cell_lo, cell_lo + cellsize)
+
+    cluster_colors = None
+    if colors is not None:
+        colors = asarray(colors, dtype=float64)
+        cluster_colors = column_stack([bincount(clusters, weights=colors[:, i], minlength=k) for i in range(colors.shape[1])]) / counts[:, None]
+        cluster_colors = cluster_colors.astype(float32)
+
+    return optimal.astype(float32), remapped, cluster_colors
+
+
+def simplify_chain(
+    positions,
+    triangles,
+    levels: int = 3,
+    ratio: float = 0.25,
+    colors=None,
+    min_triangles: int = 32,
+) -> list[tuple[ndarray, ndarray, Optional[ndarray]]]:
+    """Build a level-of-detail chain of successively simplified meshes.
+
+    Parameters
+    ----------
+    positions : array-like
+        The vertex coordinates, as an array of shape (n, 3).
+    triangles : array-like
+        The vertex indices of the triangles, as an array of shape (m, 3).
+    levels : int, optional
+        The maximum number of simplified levels, excluding the original mesh.
+    ratio : float, optional
+        The ratio of the number of triangles between successive levels.
+    colors : array-like, optional
+        The vertex colors, as an array of shape (n, k).
+    min_triangles : int, optional
+        No further levels are built below this number of triangles.
+
+    Returns
+    -------
+    list[tuple[ndarray, ndarray, ndarray | None]]
+        The vertex coordinates, triangles and vertex colors of every simplified level, from fine to coarse.
+
+    See Also
+    --------
+    :func:`compas_viewer.spatial.simplify_mesh`
+    """
+    chain = []
+    triangles = asarray(triangles, dtype=int64).reshape(-1, 3)
+    count = len(triangles)
+    for _ in range(levels):
+        target = int(count * ratio)
+        if target < min_triangles:
+            break
+        # Every level is simplified from the original mesh, so that the errors do not accumulate.
+        level = simplify_mesh(positions, triangles, target, colors=colors)
+        if len(level[1]) >= count:
+            break
+        chain.append(level)
+        count = len(level[1])
+    return chain
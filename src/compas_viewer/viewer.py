@@ -1,3 +1,4 @@
+import os
 import sys
 from pathlib import Path
 from typing import Callable
@@ -14,6 +15,8 @@ from compas.geometry import Geometry
 from compas_viewer.actions import Action
 from compas_viewer.actions import register
 from compas_viewer.components import Renderer
+from compas_viewer.components.renderer import FrameRecorder
+from compas_viewer.components.renderer import OffscreenRenderer
 from compas_viewer.configurations import ActionConfig
 from compas_viewer.configurations import ControllerConfig
 from compas_viewer.configurations import LayoutConfig
@@ -40,15 +43,19 @@ class Viewer:
         The width of the viewer window at startup. It will override the value in the config file.
     height : int, optional
         The height of the viewer window at startup. It will override the value in the config file.
-    rendermode : Literal['shaded', 'ghosted', 'wireframe', 'lighted'], optional
+    rendermode : Literal['shaded', 'ghosted', 'oit', 'wireframe', 'lighted'], optional
         The display mode of the OpenGL view. It will override the value in the config file.
     viewmode : Literal['front', 'right', 'top', 'perspective'], optional
         The view mode of the OpenGL view. It will override the value in the config file.
         In 'ghosted' mode, all objects have a default opacity of 0.7.
+        The 'oit' mode is the 'ghosted' mode with weighted blended order-independent transparency instead of sorting.
     show_grid : bool, optional
         Show the XY plane. It will override the value in the config file.
     configpath : str, optional
         The path to the config folder.
+    headless : bool, optional
+        Render without a window, through :attr:`offscreen`. The layout widgets are not built,
+        and without an application yet, the "offscreen" Qt platform plugin is used unless another one is set.
 
     Attributes
     ----------
@@ -60,6 +67,14 @@ class Viewer:
         The controller component of the viewer.
     layout : :class:`compas_viewer.layout.Layout`
         The layout component of the viewer.
+    offscreen : :class:`compas_viewer.components.renderer.OffscreenRenderer` | None
+        The offscreen renderer of a headless viewer, which renders the scene into arrays and image files.
+    recorder : :class:`compas_viewer.components.renderer.FrameRecorder`
+        The recorder of the frames of the animation of :func:`on`, into image files or an encoder.
+    animation : Callable | None
+        The step of the animation of :func:`on`, which calls the decorated function with the next frame number.
+    animation_interval : int | None
+        The interval, or timeout, of the animation of :func:`on`, in milliseconds.
 
     Notes
     -----
@@ -86,10 +101,11 @@ class Viewer:
         fullscreen: Optional[bool] = None,
         width: Optional[int] = None,
         height: Optional[int] = None,
-        rendermode: Optional[Literal["wireframe", "shaded", "ghosted", "lighted", "instance"]] = None,
+        rendermode: Optional[Literal["wireframe", "shaded", "ghosted", "oit", "lighted", "instance"]] = None,
         viewmode: Optional[Literal["front", "right", "top", "perspective"]] = None,
         show_grid: Optional[bool] = None,
         configpath: Optional[str] = None,
+        headless: bool = False,
     ):
         # Custom or default config
         if configpath is None:
@@ -124,6 +140,9 @@ class Viewer:
 
         #  Application
         self.started = False
+        self.headless = headless
+        if headless and QCoreApplication.instance() is None:
+            os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
         self.app = QCoreApplication.instance() or QApplication(sys.argv)
         self.window = QMainWindow()
 
@@ -138,11 +157,18 @@ class Viewer:
 
         # Layout
         self.layout = Layout(self, self.layout_config)
-        self.layout.init()
+        self.offscreen: Optional[OffscreenRenderer] = None
+        if headless:
+            self.offscreen = OffscreenRenderer(self.renderer)
+        else:
+            self.layout.init()
 
         # `on` function
         self.timer: Timer
         self.frame_count: int = 0
+        self.animation: Optional[Callable] = None
+        self.animation_interval: Optional[int] = None
+        self.recorder = FrameRecorder(self.renderer)
 
         #  Primitive
         self.objects: list[ViewerSceneObject]
@@ -180,7 +206,15 @@ class Viewer:
     # ==========================================================================
 
     def show(self):
-        """Show the viewer window."""
+        """Show the viewer window.
+
+        Raises
+        ------
+        RuntimeError
+            If the viewer is headless.
+        """
+        if self.headless:
+            raise RuntimeError("A headless viewer has no window, render it with `Viewer.offscreen` instead.")
         # opengel being initialized:
         self.window.show()
         self.started = True
@@ -211,6 +245,9 @@ class Viewer:
         without taking into account the duration of the execution of the call,
         whereas the latter indicates a pause after the completed execution of the previous call,
         before starting the next one.
+        The updates of the objects in the callback are applied together after it returns,
+        see :func:`compas_viewer.scene.ViewerScene.batch`.
+        The animation can be recorded frame by frame, at a fixed timestep, with :attr:`recorder`.
 
         Examples
         --------
@@ -230,7 +267,8 @@ class Viewer:
 
         def outer(func: Callable):
             def renderer():
-                func(self.frame_count)
+                with self.scene.batch():
+                    func(self.frame_count)
                 self.renderer.update()
                 self.frame_count += 1
                 if frames is not None and self.frame_count >= frames:
@@ -242,6 +280,8 @@ class Viewer:
                 self.timer = Timer(interval=timeout, callback=renderer, singleshot=True)
 
             self.frame_count = 0
+            self.animation = renderer
+            self.animation_interval = interval or timeout
 
         return outer
 
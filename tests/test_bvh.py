@@ -0,0 +1,129 @@
+import pytest
+from numpy import allclose
+from numpy import array
+from numpy import inf
+from numpy import isnan
+from numpy import maximum
+from numpy import minimum
+from numpy import nan
+from numpy import random
+from numpy import sort
+from numpy.linalg import norm
+
+from compas_viewer.spatial import BVH
+from compas_viewer.spatial import boxes_in_frustum
+from compas_viewer.spatial import frustum_planes
+
+
+def random_boxes(n, seed=0):
+    rng = random.RandomState(seed)
+    lo = rng.uniform(-10, 10, (n, 3))
+    boxes = array([lo, lo + rng.uniform(0, 2, (n, 3))]).transpose(1, 0, 2)
+    # Removed items keep a row of NaN.
+    boxes[::17] = nan
+    return boxes
+
+
+def valid(boxes):
+    return ~isnan(boxes).any(axis=(1, 2))
+
+
+def brute_box(boxes, lo, hi):
+    return (valid(boxes) & ((boxes[:, 0] <= hi) & (boxes[:, 1] >= lo)).all(axis=1)).nonzero()[0]
+
+
+def perspective(fov=60.0, aspect=1.5, near=0.1, far=100.0):
+    from math import radians
+    from math import tan
+
+    f = 1 / tan(radians(fov) / 2)
+    projection = array([[f / aspect, 0, 0, 0], [0, f, 0, 0], [0, 0, (far + near) / (near - far), 2 * far * near / (near - far)], [0, 0, -1, 0]])
+    # The camera looks along the x axis from (-20, 0, 0).
+    viewworld = array([[0, 1, 0, 0], [0, 0, 1, 0], [-1, 0, 0, -20], [0, 0, 0, 1]], dtype=float)
+    return projection @ viewworld
+
+
+@pytest.mark.parametrize("leafsize", [1, 4, 16])
+def test_query_box(leafsize):
+    boxes = random_boxes(500)
+    bvh = BVH(boxes, leafsize=leafsize)
+    rng = random.RandomState(1)
+    for _ in range(20):
+        lo = rng.uniform(-10, 8, 3)
+        hi = lo + rng.uniform(0, 5, 3)
+        assert sort(bvh.query_box(lo, hi)).tolist() == brute_box(boxes, lo, hi).tolist()
+
+
+@pytest.mark.parametrize("window", [None, (-0.2, -0.3, 0.1, 0.4)])
+def test_query_frustum(window):
+    boxes = random_boxes(500)
+    bvh = BVH(boxes)
+    planes = frustum_planes(perspective(), window=window)
+    expected = (valid(boxes) & boxes_in_frustum(boxes, planes)).nonzero()[0]
+    assert sort(bvh.query_frustum(planes)).tolist() == expected.tolist()
+    assert 0 < len(expected) < valid(boxes).sum()
+
+
+def test_query_ray():
+    boxes = random_boxes(500)
+    bvh = BVH(boxes)
+    rng = random.RandomState(2)
+    for _ in range(20):
+        origin = rng.uniform(-15, 15, 3)
+        direction = rng.normal(size=3)
+        items, t = bvh.query_ray(origin, direction, pad=0.1)
+
+        # The slab test of every box.
+        t1 = (boxes[:, 0] - 0.1 - origin) / direction
+        t2 = (boxes[:, 1] + 0.1 - origin) / direction
+        tnear = maximum(minimum(t1, t2).max(axis=1), 0)
+        tfar = maximum(t1, t2).min(axis=1)
+        expected = (valid(boxes) & (tnear <= tfar)).nonzero()[0]
+
+        assert sort(items).tolist() == expected.tolist()
+        assert allclose(t, tnear[items])
+        assert (t[1:] >= t[:-1]).all()
+
+
+@pytest.mark.parametrize("k", [1, 5, 30])
+def test_nearest(k):
+    boxes = random_boxes(500)
+    bvh = BVH(boxes)
+    rng = random.RandomState(3)
+    for _ in range(20):
+        point = rng.uniform(-12, 12, 3)
+        items, distances = bvh.nearest(point, k=k)
+
+        brute = norm(maximum(maximum(boxes[:, 0] - point, point - boxes[:, 1]), 0), axis=1)
+        brute[~valid(boxes)] = inf
+        assert allclose(distances, sort(brute)[:k])
+        assert allclose(brute[items], distances)
+
+
+def test_nearest_within_distance():
+    boxes = random_boxes(500)
+    bvh = BVH(boxes)
+    items, distances = bvh.nearest([0, 0, 0], k=1000, distance=1.5)
+    brute = norm(maximum(maximum(boxes[:, 0], -boxes[:, 1]), 0), axis=1)
+    assert sort(items).tolist() == (valid(boxes) & (brute <= 1.5)).nonzero()[0].tolist()
+    assert (distances <= 1.5).all()
+
+
+def test_refit():
+    boxes = random_boxes(500)
+    bvh = BVH(boxes)
+    rng = random.RandomState(4)
+    moved = boxes + rng.uniform(-3, 3, (len(boxes), 1, 3))
+    bvh.refit(moved)
+    for _ in range(20):
+        lo = rng.uniform(-10, 8, 3)
+        hi = lo + rng.uniform(0, 5, 3)
+        assert sort(bvh.query_box(lo, hi)).tolist() == brute_box(moved, lo, hi).tolist()
+
+    # The boxes can also be moved in place.
+    bvh.boxes[:] = boxes
+    bvh.refit()
+    assert sort(bvh.query_box([-10, -10, -10], [0, 0, 0])).tolist() == brute_box(boxes, [-10, -10, -10], [0, 0, 0]).tolist()
+
+    with pytest.raises(ValueError):
+        bvh.refit(boxes[:10])
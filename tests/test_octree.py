@@ -0,0 +1,104 @@
+import pytest
+from numpy import array
+from numpy import array_equal
+from numpy import sqrt
+from numpy.random import default_rng
+
+from compas_viewer.spatial import Octree
+
+# The camera is in front of the unit cube, looking at it.
+EYE = [0.5, -2.0, 0.5]
+SCALE = 1000.0
+
+
+@pytest.fixture(scope="module")
+def octree():
+    rng = default_rng(0)
+    return Octree.from_points(rng.random((20000, 3)), colors=rng.random((20000, 3)), capacity=500)
+
+
+def parents(octree):
+    parent = {}
+    for node, children in enumerate(octree.children.tolist()):
+        for child in children:
+            if child >= 0:
+                parent[child] = node
+    return parent
+
+
+def test_from_points(octree):
+    assert int(octree.counts.sum()) == 20000
+    assert len(octree.positions) == len(octree.colors) == 20000
+    inner = (octree.children >= 0).any(axis=1)
+    assert (octree.counts[inner] == octree.capacity).all()
+    for node in range(len(octree)):
+        points = octree.node_positions(node)
+        assert (abs(points - octree.centers[node]) <= octree.halfsizes[node] + 1e-6).all()
+
+
+@pytest.mark.parametrize("budget", [500, 3000, 12000])
+def test_select_point_budget(octree, budget):
+    nodes, total = octree.select(EYE, SCALE, point_budget=budget, error_budget=0.0)
+    assert total == int(octree.counts[nodes].sum())
+    assert total <= budget
+    # The next node would exceed the budget, unless everything is selected.
+    assert total + octree.capacity > budget or len(nodes) == len(octree)
+
+    # The selection is closed under the parents, such that the refinement is progressive.
+    parent = parents(octree)
+    selected = set(nodes)
+    assert nodes[0] == 0
+    assert all(parent[node] in selected for node in nodes[1:])
+
+
+def test_select_error_budget(octree):
+    density = sqrt(octree.capacity)
+    counts = []
+    for error_budget in (2.0, 4.0, 8.0):
+        nodes, total = octree.select(EYE, SCALE, point_budget=10**9, error_budget=error_budget)
+        centers = octree.centers[nodes[1:]]
+        radii = octree.radii[nodes[1:]]
+        distances = sqrt(((centers - array(EYE)) ** 2).sum(axis=1))
+        assert (radii * SCALE / distances / density >= error_budget).all()
+        counts.append(total)
+    assert counts[0] > counts[1] > counts[2]
+
+    nodes, total = octree.select(EYE, SCALE, point_budget=10**9, error_budget=0.0)
+    assert total == 20000 and len(nodes) == len(octree)
+
+    nodes, _ = octree.select(EYE, 1.0, point_budget=10**9, error_budget=10.0, orthographic=True)
+    assert nodes == [0]
+
+
+def test_select_frustum(octree):
+    # The half of the cube with x >= 0.5.
+    planes = array([[1, 0, 0, -0.5], [-1, 0, 0, 1], [0, 1, 0, 0], [0, -1, 0, 1], [0, 0, 1, 0], [0, 0, -1, 1]], dtype=float)
+    nodes, _ = octree.select(EYE, SCALE, point_budget=10**9, error_budget=0.0, planes=planes)
+    all_nodes, _ = octree.select(EYE, SCALE, point_budget=10**9, error_budget=0.0)
+
+    distances = octree.centers @ planes[:, :3].T + planes[:, 3]
+    inside = (distances >= -octree.radii[:, None]).all(axis=1)
+    assert set(nodes) == {node for node in all_nodes if inside[node]}
+    assert len(nodes) < len(all_nodes)
+
+    outside = array([[1, 0, 0, -5.0]])
+    assert octree.select(EYE, SCALE, point_budget=10**9, planes=outside) == ([], 0)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load(octree, tmp_path, mmap):
+    octree.save(tmp_path / "index")
+    loaded = Octree.load(tmp_path / "index", mmap=mmap)
+
+    for name in ("positions", "colors", "centers", "halfsizes", "starts", "counts", "children"):
+        assert array_equal(getattr(loaded, name), getattr(octree, name))
+    assert loaded.capacity == octree.capacity
+    assert loaded.select(EYE, SCALE, point_budget=5000) == octree.select(EYE, SCALE, point_budget=5000)
+
+
+def test_save_load_without_colors(tmp_path):
+    octree = Octree.from_points(default_rng(1).random((1000, 3)), capacity=100)
+    octree.save(tmp_path / "index")
+    loaded = Octree.load(tmp_path / "index")
+    assert loaded.colors is None and loaded.node_colors(0) is None
+    assert array_equal(loaded.positions, octree.positions)
@@ -0,0 +1,41 @@
+import numpy as np
+
+from compas_viewer.readers import read_ply
+from compas_viewer.readers import read_points
+
+
+def test_pts_header_and_intensity(tmp_path):
+    path = tmp_path / "cloud.pts"
+    path.write_text("2\n0 0 0 -120 255 0 0\n1 2 3 40 0 128 255\n")
+
+    chunks = list(read_points(path))
+
+    positions = np.concatenate([p for p, _ in chunks])
+    colors = np.concatenate([c for _, c in chunks])
+    assert positions.tolist() == [[0, 0, 0], [1, 2, 3]]
+    assert colors.tolist() == [[255, 0, 0, 255], [0, 128, 255, 255]]
+
+
+def test_xyz_rgb(tmp_path):
+    path = tmp_path / "cloud.xyz"
+    path.write_text("0 0 0 255 0 0\n1 2 3 0.0 128 255\n")
+
+    positions, colors = next(read_points(path))
+
+    assert positions.tolist() == [[0, 0, 0], [1, 2, 3]]
+    assert colors.tolist() == [[255, 0, 0, 255], [0, 128, 255, 255]]
+
+
+def test_16bit_colors_are_scaled_alike_in_all_chunks(tmp_path):
+    path = tmp_path / "cloud.ply"
+    vertices = np.zeros(4, dtype=[("x", "<f4"), ("y", "<f4"), ("z", "<f4"), ("red", "<u2"), ("green", "<u2"), ("blue", "<u2")])
+    # The first chunk is dark, with all values below 256, the second one is bright.
+    vertices["red"] = [100, 200, 65535, 32768]
+    header = "ply\nformat binary_little_endian 1.0\nelement vertex 4\n"
+    header += "".join(f"property {t} {n}\n" for t, n in [("float", "x"), ("float", "y"), ("float", "z"), ("ushort", "red"), ("ushort", "green"), ("ushort", "blue")])
+    header += "end_header\n"
+    path.write_bytes(header.encode("ascii") + vertices.tobytes())
+
+    colors = np.concatenate([c for _, c in read_ply(path, chunksize=2)])
+
+    assert colors[:, 0].tolist() == [0, 0, 255, 128]
@@ -0,0 +1,117 @@
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from unittest.mock import MagicMock  # noqa: E402
+
+import pytest  # noqa: E402
+from numpy import identity  # noqa: E402
+from PySide6.QtCore import QCoreApplication  # noqa: E402
+
+from compas.geometry import Box  # noqa: E402
+from compas.geometry import Vector  # noqa: E402
+from compas_viewer import Viewer  # noqa: E402
+
+SHADERS = ["shader_model", "shader_oit", "shader_composite", "shader_tag", "shader_arrow", "shader_instance", "shader_element", "shader_grid"]
+
+
+@pytest.fixture
+def renderer():
+    renderer = Viewer().renderer
+    # The shaders and the timer queries need an OpenGL context.
+    for name in SHADERS:
+        setattr(renderer, name, MagicMock())
+    renderer.frametimer = MagicMock()
+    return renderer
+
+
+@pytest.mark.parametrize("rendermode", ["shaded", "lighted"])
+def test_occlusion_queries_between_opaque_and_transparent(renderer, monkeypatch, rendermode):
+    calls = MagicMock()
+    monkeypatch.setattr(renderer.renderqueue, "draw_opaque", calls.draw_opaque)
+    monkeypatch.setattr(renderer.renderqueue, "draw_transparent", calls.draw_transparent)
+    monkeypatch.setattr(renderer.occlusion, "cull", lambda objs, viewworld: objs)
+    monkeypatch.setattr(renderer.occlusion, "query", calls.query)
+    renderer.config.occlusionculling = True
+    renderer._rendermode = rendermode
+
+    renderer.paint()
+
+    assert [call[0] for call in calls.mock_calls] == ["draw_opaque", "query", "draw_transparent"]
+
+
+def test_deprecated_sorts(renderer):
+    scene = renderer.viewer.scene
+    objs = []
+    for z, opacity in [(-2, 0.5), (-10, 1.0), (-5, 0.5), (-20, 0.5)]:
+        obj = scene.add(Box(1.0).translated([0, 0, z]), opacity=opacity)
+        obj._update_bounding_box(obj.geometry.to_vertices_and_faces()[0])
+        objs.append(obj)
+    vector = scene.add(Vector(1, 0, 0))
+    near, opaque, middle, far = objs
+
+    with pytest.warns(DeprecationWarning):
+        # The camera at the origin, looking along -z.
+        assert renderer.sort_objects_from_viewworld(objs, identity(4).tolist()) == [opaque, far, middle, near]
+    with pytest.warns(DeprecationWarning):
+        tags, vectors, meshes = renderer.sort_objects_from_category(tuple(scene.objects))
+    assert (tags, vectors, meshes) == ([], [vector], objs)
+    assert (tags, vectors, meshes) == renderer.renderlists.lists()
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    renderer = Viewer().renderer
+    # The window is not shown in the tests.
+    monkeypatch.setattr(renderer, "isVisible", lambda: True)
+    return renderer.scheduler
+
+
+def wait(scheduler, timeout=1.0):
+    """Process the events until the scheduled paint, if any, is done."""
+    deadline = time.perf_counter() + timeout
+    QCoreApplication.processEvents()
+    while scheduler._timer.isActive() and time.perf_counter() < deadline:
+        time.sleep(0.001)
+        QCoreApplication.processEvents()
+
+
+def test_scheduler_coalesces_requests(scheduler):
+    paints, requests = scheduler.paints, scheduler.requests
+    for _ in range(10):
+        scheduler.renderer.update()
+    assert scheduler.requests == requests + 10 and scheduler.dirty
+    wait(scheduler)
+    assert scheduler.paints == paints + 1
+
+    scheduler.painted()
+    assert not scheduler.dirty
+    scheduler.request()
+    wait(scheduler)
+    assert scheduler.paints == paints + 2
+
+
+def test_scheduler_pause_keeps_the_frame_dirty(scheduler):
+    scheduler.painted()
+    paints = scheduler.paints
+    scheduler.pause()
+    for _ in range(3):
+        scheduler.request()
+    assert not scheduler._timer.isActive()
+    wait(scheduler)
+    assert scheduler.dirty and scheduler.paints == paints
+
+    scheduler.resume()
+    assert scheduler._timer.isActive()
+    wait(scheduler)
+    assert scheduler.paints == paints + 1
+
+
+def test_scheduler_pauses_while_hidden(scheduler, monkeypatch):
+    scheduler.painted()
+    paints = scheduler.paints
+    monkeypatch.setattr(scheduler.renderer, "isVisible", lambda: False)
+    scheduler.request()
+    wait(scheduler)
+    assert scheduler.paused and scheduler.dirty and scheduler.paints == paints
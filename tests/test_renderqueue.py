@@ -0,0 +1,103 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from unittest.mock import MagicMock  # noqa: E402
+
+import pytest  # noqa: E402
+from numpy import identity  # noqa: E402
+
+from compas.geometry import Box  # noqa: E402
+from compas_viewer import Viewer  # noqa: E402
+
+# The camera at the origin, looking along -z.
+VIEWWORLD = identity(4).tolist()
+
+
+@pytest.fixture
+def viewer():
+    viewer = Viewer()
+    viewer.renderer.frametimer = MagicMock()
+    return viewer
+
+
+def add_box(viewer, z, opacity=1.0, **kwargs):
+    obj = viewer.scene.add(Box(1.0).translated([0, 0, z]), opacity=opacity, **kwargs)
+    # The buffers and bounds are made in an OpenGL context, their names are enough here.
+    obj._update_bounding_box(obj.geometry.to_vertices_and_faces()[0])
+    for name in ("_points_buffer", "_lines_buffer", "_frontfaces_buffer", "_backfaces_buffer"):
+        setattr(obj, name, {"positions": 0, "colors": 0, "elements": 0, "n": 0})
+    return obj
+
+
+def test_opaque_order(viewer):
+    near = add_box(viewer, -2, show_points=False, show_lines=True, lineswidth=2)
+    far = add_box(viewer, -10, show_points=False, show_lines=True, lineswidth=2)
+    middle = add_box(viewer, -5, show_points=True, show_lines=True, lineswidth=4, pointssize=3)
+    ground = add_box(viewer, -20, show_points=False, show_lines=False)
+    ground.background = True
+    queue = viewer.renderer.renderqueue
+    objs = [near, far, middle, ground]
+    queue.build(objs)
+
+    items = [queue.items[i] for i in queue.order(objs, VIEWWORLD)]
+    keys = [item.key for item in items]
+    assert keys == sorted(keys)
+    # Background first, then faces, lines and points, then the line widths.
+    assert [(item.obj, item.kind) for item in items] == [
+        (ground, "frontface"),
+        (ground, "backface"),
+        (near, "frontface"),
+        (middle, "frontface"),
+        (far, "frontface"),
+        (near, "backface"),
+        (middle, "backface"),
+        (far, "backface"),
+        (near, "line"),
+        (far, "line"),
+        (middle, "line"),
+        (middle, "point"),
+    ]
+
+    # The culled objects are left out.
+    items = [queue.items[i] for i in queue.order([far, middle], VIEWWORLD)]
+    assert {item.obj for item in items} == {far, middle}
+
+
+def test_transparent_back_to_front(viewer):
+    objs = [add_box(viewer, z, opacity=0.5) for z in (-3, -9, -1, -6)]
+    opaque = add_box(viewer, -4)
+    queue = viewer.renderer.renderqueue
+    queue.build(objs + [opaque])
+
+    assert queue.transparent == objs
+    assert [obj.geometry.frame.point.z for obj in queue.sort_transparent(objs + [opaque], VIEWWORLD)] == [-9, -6, -3, -1]
+    assert queue.sort_transparent(objs[:2], VIEWWORLD) == [objs[1], objs[0]]
+    assert opaque in {item.obj for item in queue.items}
+
+
+def test_cache(viewer, monkeypatch):
+    objs = [add_box(viewer, -2), add_box(viewer, -4)]
+    renderer = viewer.renderer
+    queue = renderer.renderqueue
+    builds = []
+    build = queue.build
+    monkeypatch.setattr(queue, "build", lambda objs: builds.append(1) or build(objs))
+    shader = MagicMock()
+
+    def draw():
+        queue.draw_opaque(shader, objs, objs, VIEWWORLD)
+        return len(builds)
+
+    assert draw() == 1
+    assert draw() == 1
+    viewer.scene.invalidate()
+    assert draw() == 2
+    monkeypatch.setattr(renderer, "_rendermode", "wireframe")
+    assert draw() == 3
+    monkeypatch.setattr(renderer, "_opacity", 0.5)
+    assert draw() == 4
+    assert draw() == 4
+    # The display settings of the objects invalidate the scene.
+    objs[0].show_lines = False
+    assert draw() == 5
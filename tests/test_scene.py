@@ -0,0 +1,234 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest  # noqa: E402
+
+from compas.geometry import Box  # noqa: E402
+from compas_viewer import Viewer  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def viewer():
+    return Viewer()
+
+
+def add_box(viewer, x, parent=None):
+    obj = viewer.scene.add(Box(1.0).translated([x, 0, 0]), parent=parent)
+    # The bounds are stored when the buffers are made, which needs an OpenGL context.
+    obj._update_bounding_box(obj.geometry.to_vertices_and_faces()[0])
+    return obj
+
+
+def test_remove_drops_bounds_and_instances(viewer):
+    parent = add_box(viewer, 0)
+    child = add_box(viewer, 3, parent=parent)
+    other = add_box(viewer, 6)
+    assert set(viewer.scene.query_box([-10, -10, -10], [10, 10, 10])) >= {parent, child, other}
+
+    viewer.scene.remove(parent)
+
+    found = viewer.scene.query_box([-10, -10, -10], [10, 10, 10])
+    assert parent not in found and child not in found
+    assert other in found
+    assert parent._bounds_index is None and child._bounds_index is None
+    assert viewer.scene._bounds_objects[other._bounds_index] is other
+    for obj in (parent, child):
+        assert obj.instance_color.rgb255 not in viewer.scene.instance_colors
+        assert obj not in viewer.scene._instance_objects.tolist()
+
+
+def test_remove_drops_pending_updates(viewer):
+    obj = add_box(viewer, 0)
+    with viewer.scene.batch():
+        obj.update()
+        viewer.scene.remove(obj)
+        assert obj not in viewer.scene._batch
+
+
+@pytest.fixture
+def recorded(viewer, monkeypatch):
+    """Boxes whose buffer updates are recorded instead of uploaded, and the repaint requests."""
+    calls = {"buffers": [], "repaints": 0}
+
+    def record(obj):
+        def update_buffers(update_positions=True, update_colors=True, update_elements=True):
+            calls["buffers"].append((obj, update_positions, update_colors, update_elements))
+            if obj.name == "broken":
+                raise RuntimeError("The buffers of the object cannot be updated.")
+
+        monkeypatch.setattr(obj, "update_buffers", update_buffers)
+        return obj
+
+    def repaint():
+        calls["repaints"] += 1
+
+    monkeypatch.setattr(viewer.renderer, "update", repaint)
+    objs = [record(add_box(viewer, x)) for x in range(3)]
+    yield objs, calls
+    for obj in objs:
+        viewer.scene.remove(obj)
+
+
+def test_batch_merges_updates(viewer, recorded):
+    (a, b, _), calls = recorded
+    version = viewer.scene.version
+    with viewer.scene.batch():
+        a.update(update_positions=True, update_colors=False, update_elements=False)
+        a.update(update_positions=False, update_colors=True, update_elements=False)
+        b.update(update_positions=False, update_colors=False, update_elements=True)
+        assert calls == {"buffers": [], "repaints": 0}
+        assert viewer.scene.version == version
+
+    assert calls["buffers"] == [(a, True, True, False), (b, False, False, True)]
+    assert calls["repaints"] == 1
+    assert viewer.scene.version == version + 1
+
+
+def test_nested_batches(viewer, recorded):
+    (a, b, _), calls = recorded
+    with viewer.scene.batch():
+        a.update()
+        with viewer.scene.batch():
+            b.update()
+            a.update(update_colors=False)
+        assert calls["buffers"] == []
+        assert viewer.scene.batching
+    assert not viewer.scene.batching
+    assert calls["buffers"] == [(a, True, True, True), (b, True, True, True)]
+    assert calls["repaints"] == 1
+
+
+def test_batch_flushes_when_the_block_raises(viewer, recorded):
+    (a, _, _), calls = recorded
+    with pytest.raises(ValueError):
+        with viewer.scene.batch():
+            a.update()
+            raise ValueError
+    assert calls["buffers"] == [(a, True, True, True)]
+    assert calls["repaints"] == 1
+    assert not viewer.scene.batching and not viewer.scene._batch
+
+
+def test_batch_applies_all_updates_when_one_raises(viewer, recorded):
+    (a, b, c), calls = recorded
+    b.name = "broken"
+    version = viewer.scene.version
+    with pytest.raises(RuntimeError):
+        with viewer.scene.batch():
+            for obj in (a, b, c):
+                obj.update()
+    assert [call[0] for call in calls["buffers"]] == [a, b, c]
+    assert calls["repaints"] == 1
+    assert viewer.scene.version == version + 1
+
+
+def test_streaming_read_error(viewer, tmp_path):
+    from compas_viewer.scene import StreamingPointcloud
+
+    path = tmp_path / "broken.xyz"
+    path.write_text("0 0 0\n1 2\n")
+    obj = viewer.scene.add(StreamingPointcloud(path))
+
+    with pytest.warns(RuntimeWarning):
+        obj._read()
+    obj.upload()
+
+    assert isinstance(obj.error, ValueError)
+    assert not obj.is_loaded
+    viewer.scene.remove(obj)
+
+
+def test_lod_rebuilds_once_from_current_data(viewer, monkeypatch):
+    from threading import Event
+
+    from compas_viewer.scene import sceneobject
+
+    calls = []
+    release = Event()
+
+    def simplify_chain(positions, elements, **kwargs):
+        calls.append(positions)
+        if len(calls) == 1:
+            release.wait(5)
+        return [len(calls)]
+
+    monkeypatch.setattr(sceneobject, "simplify_chain", simplify_chain)
+    obj = viewer.scene.add(Box(1.0))
+    obj.lod = True
+    obj._frontfaces_data = obj._read_frontfaces_data()
+    obj.update_lod()
+    thread = obj._lod_thread
+
+    # The data is read again twice while the first chain is being built.
+    for _ in range(2):
+        obj._frontfaces_data = obj._read_frontfaces_data()
+        obj.update_lod()
+    assert obj._lod_thread is thread
+    release.set()
+    thread.join(5)
+
+    assert len(calls) == 2
+    assert obj._lod_chain == [2]
+
+    # An update of the transformation keeps the chain.
+    obj.update_lod()
+    assert obj._lod_chain == [2] and obj._lod_thread is thread
+    viewer.scene.remove(obj)
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [("show_points", True), ("show_lines", False), ("show_faces", False), ("lineswidth", 3.0), ("pointssize", 9.0), ("opacity", 0.5), ("background", True)],
+)
+def test_display_settings_invalidate(viewer, name, value):
+    obj = viewer.scene.add(Box(1.0))
+    version = viewer.scene.version
+    setattr(obj, name, value)
+    assert viewer.scene.version > version
+    viewer.scene.remove(obj)
+
+
+def test_streaming_upload_outside_the_view(viewer, tmp_path, monkeypatch):
+    import time
+
+    from compas_viewer.scene import StreamingPointcloud
+    from compas_viewer.scene import streamingpointcloudobject
+
+    # The buffers need an OpenGL context, their names are enough here.
+    monkeypatch.setattr(streamingpointcloudobject, "make_vertex_buffer", lambda data: 0)
+    monkeypatch.setattr(streamingpointcloudobject, "make_index_buffer", lambda data: 0)
+
+    # A georeferenced file, far from the camera.
+    path = tmp_path / "far.xyz"
+    path.write_text("".join(f"{1e6 + i} {2e6 + i} 100\n" for i in range(50)))
+    obj = viewer.scene.add(StreamingPointcloud(path, chunksize=5))
+    obj.init()
+    obj.is_visible = False
+
+    start = time.perf_counter()
+    while obj.count == 0 and time.perf_counter() - start < 5:
+        viewer.renderer.upload()
+    assert not viewer.renderer.cull_objects([obj], viewer.renderer.camera.viewworld())
+
+    while not obj.is_loaded and time.perf_counter() - start < 5:
+        viewer.renderer.upload()
+    assert obj.is_loaded and obj.count == 50
+    assert obj not in viewer.renderer.uploads
+    viewer.scene.remove(obj)
+
+
+def test_transform_update_keeps_primitives(viewer):
+    obj = viewer.scene.add(Box(1.0))
+    obj._frontfaces_data = obj._read_frontfaces_data()
+    obj.clear_primitives()
+    primitives, bvh = obj.pick_primitives("face")
+
+    # The transformation changes, the data is the same.
+    obj.update_primitives()
+    assert obj.pick_primitives("face")[1] is bvh
+
+    obj._frontfaces_data = obj._read_frontfaces_data()
+    obj.update_primitives()
+    assert obj.pick_primitives("face")[1] is not bvh
+    viewer.scene.remove(obj)
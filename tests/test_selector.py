@@ -0,0 +1,76 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest  # noqa: E402
+from PySide6.QtCore import QPoint  # noqa: E402
+
+from compas.datastructures import Mesh  # noqa: E402
+from compas_viewer import Viewer  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def viewer():
+    return Viewer()
+
+
+@pytest.fixture
+def selector(viewer, monkeypatch):
+    selector = viewer.renderer.selector
+    monkeypatch.setattr(selector, "pickmode", "element")
+    monkeypatch.setattr(selector, "dragmode", "element")
+    monkeypatch.setattr(selector, "selected_elements", {})
+    return selector
+
+
+def test_element_click_selection(viewer, selector, monkeypatch):
+    obj = viewer.scene.add(Mesh.from_polygons([[[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]]))
+    picks = iter([(obj, "point", 2), (obj, "face", 0), (obj, "point", 2), None])
+    picked_kinds = []
+
+    def pick(x, y, objs=None, kinds=("point", "line", "face")):
+        picked_kinds.append(kinds)
+        return next(picks)
+
+    monkeypatch.setattr(viewer.renderer.elementpicker, "pick", pick)
+
+    selector.select_action()
+    assert selector.selected_elements == {obj: {"point": [2]}}
+    assert obj.is_selected
+    assert picked_kinds == [selector.elementkinds]
+
+    selector.multiselect_action()
+    assert selector.selected_elements == {obj: {"point": [2], "face": [0]}}
+
+    selector.deselect_action()
+    assert selector.selected_elements == {obj: {"face": [0]}}
+    assert obj.is_selected
+
+    # A click on nothing clears the selection.
+    selector.select_action()
+    assert selector.selected_elements == {} and selector.last_elements == {}
+    assert not obj.is_selected
+    viewer.scene.remove(obj)
+
+
+def test_element_drag_selection(viewer, selector, monkeypatch):
+    obj = viewer.scene.add(Mesh.from_polygons([[[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]]))
+    boxes = []
+
+    def pick_box(box, objs=None, kinds=("point", "line", "face")):
+        boxes.append(box)
+        return {obj: {"point": [0, 1], "line": [(0, 1)]}}
+
+    monkeypatch.setattr(viewer.renderer.elementpicker, "pick_box", pick_box)
+    selector.drag_start_pt = QPoint(10, 10)
+    selector.drag_end_pt = QPoint(50, 40)
+
+    selector.drag_selection_action()
+    assert boxes == [(10, 10, 50, 40)]
+    assert selector.selected_elements == {obj: {"point": [0, 1], "line": [(0, 1)]}}
+    assert obj.is_selected
+
+    selector.drag_deselection_action()
+    assert selector.selected_elements == {}
+    assert not obj.is_selected
+    viewer.scene.remove(obj)